@@ -0,0 +1,196 @@
+"""Drive both clients through an in-process mock transport to measure throughput and memory.
+
+Each scenario serves synthetic record pages of a given width (fields per
+record) and size (records per page) from an ``httpx.MockTransport``, fetches
+every page with ``get_all_records_by_app_id`` and reports requests per second,
+total time per record, parse time per record and peak memory. Parse time is
+measured separately by running the response handler on one page, so it
+excludes the transport and thread scheduling. No network or credentials are
+needed.
+
+Run with ``python benchmarks/bench_client.py``. Pass ``--save results.json``
+to keep the results and ``--compare results.json`` on a later run to flag
+scenarios that got slower or use more memory.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+from collections.abc import Callable
+from itertools import cycle, islice
+from typing import Any
+
+import httpx
+from bench_parse import FIELD_DATA
+
+from onspring_api_sdk import AsyncOnspringClient, OnspringClient
+from onspring_api_sdk._responses import handle_get_records_by_app_id_response
+from onspring_api_sdk.enums import ParseMode
+from onspring_api_sdk.models import GetRecordsByAppRequest
+
+BASE_URL = "https://bench.onspring.invalid"
+WIDTHS = (10, 100, 500)
+SIZES = (50, 500)
+PAGES = 10
+REPEAT = 3
+REGRESSION_THRESHOLD = 0.20
+
+# Result keys checked by ``compare``, with the unit printed for each.
+COMPARED = (("us_per_record", "us/record"), ("parse_us_per_record", "parse us/record"), ("peak_mib", "MiB peak"))
+
+
+def build_page(width: int, size: int, pages: int) -> bytes:
+    """Return the JSON body of a records page of ``size`` records with ``width`` fields each."""
+    field_data = [
+        {**field, "fieldId": field_id} for field_id, field in enumerate(islice(cycle(FIELD_DATA), width), start=1)
+    ]
+    page = {
+        "pageNumber": 1,
+        "pageSize": size,
+        "totalPages": pages,
+        "totalRecords": size * pages,
+        "items": [{"appId": 1, "recordId": i, "fieldData": field_data} for i in range(size)],
+    }
+
+    return json.dumps(page).encode()
+
+
+def mock_transport(body: bytes) -> httpx.MockTransport:
+    """Return a transport answering every request with the given records page."""
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=body, headers={"Content-Type": "application/json"})
+
+    return httpx.MockTransport(_handler)
+
+
+def run_sync(body: bytes, parse_mode: ParseMode) -> int:
+    """Fetch every page with the sync client and return the number of records."""
+    with OnspringClient(BASE_URL, "key", transport=mock_transport(body), parse_mode=parse_mode) as client:
+        responses = client.get_all_records_by_app_id(GetRecordsByAppRequest(app_id=1))
+
+    return sum(len(response.data.records) for response in responses)
+
+
+def run_async(body: bytes, parse_mode: ParseMode) -> int:
+    """Fetch every page with the async client and return the number of records."""
+
+    async def _run() -> int:
+        async with AsyncOnspringClient(
+            BASE_URL, "key", transport=mock_transport(body), parse_mode=parse_mode
+        ) as client:
+            responses = await client.get_all_records_by_app_id(GetRecordsByAppRequest(app_id=1))
+
+        return sum(len(response.data.records) for response in responses)
+
+    return asyncio.run(_run())
+
+
+def measure_parse(body: bytes, parse_mode: ParseMode) -> float:
+    """Return the best of ``REPEAT`` times, in microseconds per record, to parse one page with the response handler."""
+    best = float("inf")
+    records = 0
+
+    for _ in range(REPEAT):
+        response = httpx.Response(200, content=body, headers={"Content-Type": "application/json"})
+        start = time.perf_counter()
+        records = len(handle_get_records_by_app_id_response(response, parse_mode).data.records)
+        best = min(best, time.perf_counter() - start)
+
+    return best / records * 1_000_000
+
+
+def measure(run: Callable[[bytes, ParseMode], int], body: bytes, parse_mode: ParseMode, pages: int) -> dict[str, Any]:
+    """Time the best of ``REPEAT`` runs and the parse step alone, then measure peak memory in one more run."""
+    best = float("inf")
+    records = 0
+
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        records = run(body, parse_mode)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    run(body, parse_mode)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "requests_per_second": pages / best,
+        "us_per_record": best / records * 1_000_000,
+        "parse_us_per_record": measure_parse(body, parse_mode),
+        "peak_mib": peak / 1024 / 1024,
+    }
+
+
+def compare(
+    results: dict[str, dict[str, Any]], baseline: dict[str, dict[str, Any]], threshold: float = REGRESSION_THRESHOLD
+) -> list[str]:
+    """Return a message for every scenario that is more than ``threshold`` slower or larger than the baseline."""
+    regressions = []
+
+    for name, result in results.items():
+        previous = baseline.get(name)
+
+        if previous is None:
+            continue
+
+        for key, unit in COMPARED:
+            if key in previous and result[key] > previous[key] * (1 + threshold):
+                regressions.append(f"{name}: {previous[key]:.1f} -> {result[key]:.1f} {unit}")
+
+    return regressions
+
+
+def main() -> None:
+    """Run every scenario and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--widths", type=int, nargs="+", default=WIDTHS, help="fields per record")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="records per page")
+    parser.add_argument("--pages", type=int, default=PAGES, help="pages fetched per run")
+    parser.add_argument("--parse-mode", choices=["Validated", "Lazy"], default="Validated")
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="flag regressions against results saved with --save")
+    parser.add_argument(
+        "--threshold", type=float, default=REGRESSION_THRESHOLD, help="relative change reported as a regression"
+    )
+    args = parser.parse_args()
+
+    parse_mode = ParseMode[args.parse_mode]
+    results = {}
+
+    print(f"{'scenario':<38} {'req/s':>10} {'us/record':>10} {'parse us':>10} {'peak MiB':>10}")
+
+    for width in args.widths:
+        for size in args.sizes:
+            body = build_page(width, size, args.pages)
+
+            for client_name, run in (("sync", run_sync), ("async", run_async)):
+                name = f"{client_name} {parse_mode.name} {width} fields x {size}"
+                result = measure(run, body, parse_mode, args.pages)
+                results[name] = result
+
+                print(
+                    f"{name:<38} {result['requests_per_second']:>10.1f} {result['us_per_record']:>10.1f} "
+                    f"{result['parse_us_per_record']:>10.1f} {result['peak_mib']:>10.1f}"
+                )
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.threshold)
+
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+
+        if regressions:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Compare the parse modes on a 1,000-record page.
+
+Run with ``python benchmarks/bench_parse.py``.
+"""
+
+import json
+import timeit
+
+import httpx
+
+from onspring_api_sdk._responses import handle_get_records_by_app_id_response
+from onspring_api_sdk.enums import ParseMode
+
+RECORD_COUNT = 1000
+REPEAT = 5
+NUMBER = 10
+
+FIELD_DATA = [
+    {"type": "String", "fieldId": 1, "value": "Lorem ipsum dolor sit amet"},
+    {"type": "Integer", "fieldId": 2, "value": 42},
+    {"type": "Decimal", "fieldId": 3, "value": 1234.5678},
+    {"type": "Date", "fieldId": 4, "value": "2024-01-02T03:04:05Z"},
+    {"type": "Guid", "fieldId": 5, "value": "3fa85f64-5717-4562-b3fc-2c963f66afa6"},
+    {
+        "type": "TimeSpan",
+        "fieldId": 6,
+        "value": {"quantity": 1, "increment": "Day(s)", "recurrence": "None", "endByDate": None},
+    },
+    {"type": "StringList", "fieldId": 7, "value": ["alpha", "beta", "gamma"]},
+    {"type": "IntegerList", "fieldId": 8, "value": [1, 2, 3]},
+    {"type": "GuidList", "fieldId": 9, "value": ["3fa85f64-5717-4562-b3fc-2c963f66afa6"]},
+    {
+        "type": "AttachmentList",
+        "fieldId": 10,
+        "value": [{"fileId": 1, "fileName": "evidence.pdf", "notes": None, "storageLocation": "Internal"}],
+    },
+    {
+        "type": "ScoringGroupList",
+        "fieldId": 11,
+        "value": [{"listValueId": "3fa85f64-5717-4562-b3fc-2c963f66afa6", "name": "Group", "score": 1.5}],
+    },
+    {"type": "FileList", "fieldId": 12, "value": [1, 2]},
+]
+
+
+def build_page(record_count: int = RECORD_COUNT) -> bytes:
+    """Return the JSON body of a records page holding ``record_count`` records."""
+    page = {
+        "pageNumber": 1,
+        "pageSize": record_count,
+        "totalPages": 1,
+        "totalRecords": record_count,
+        "items": [{"appId": 1, "recordId": i, "fieldData": FIELD_DATA} for i in range(record_count)],
+    }
+
+    return json.dumps(page).encode()
+
+
+def main() -> None:
+    """Time parsing the page in each parse mode and print the results."""
+    body = build_page()
+    print(f"Parsing a page of {RECORD_COUNT} records with {len(FIELD_DATA)} fields each ({len(body):,} bytes)")
+
+    baseline = None
+
+    for parse_mode in ParseMode:
+
+        def _parse(parse_mode: ParseMode = parse_mode) -> None:
+            handle_get_records_by_app_id_response(httpx.Response(200, content=body), parse_mode)
+
+        best = min(timeit.repeat(_parse, repeat=REPEAT, number=NUMBER)) / NUMBER * 1000
+        baseline = baseline or best
+        print(f"{parse_mode.name:>10}: {best:8.2f} ms per page ({baseline / best:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Compare the memory held by a page of records as models and as a ``RecordTable``.
+
+Run with ``python benchmarks/bench_table.py``.
+"""
+
+import gc
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+from bench_parse import FIELD_DATA, RECORD_COUNT, build_page
+
+from onspring_api_sdk._responses import handle_get_records_by_app_id_response
+from onspring_api_sdk.enums import ParseMode
+from onspring_api_sdk.table import RecordTable
+
+
+def measure(build: Callable[[], Any]) -> int:
+    """Return the bytes still allocated by the object ``build`` returns."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    return size
+
+
+def main() -> None:
+    """Measure each representation of the page and print the results."""
+    body = build_page()
+    print(f"Holding {RECORD_COUNT} records with {len(FIELD_DATA)} fields each")
+
+    def _records() -> Any:
+        return handle_get_records_by_app_id_response(httpx.Response(200, content=body)).data.records
+
+    def _table() -> Any:
+        response = handle_get_records_by_app_id_response(httpx.Response(200, content=body), ParseMode.Lazy)
+        return RecordTable.from_records(response.data.records)
+
+    baseline = measure(_records)
+    print(f"{'Records':>8}: {baseline / 1024:10,.0f} KiB")
+
+    size = measure(_table)
+    print(f"{'Table':>8}: {size / 1024:10,.0f} KiB ({baseline / size:.1f}x smaller)")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ Provides sync and async clients for interacting with the Onspring API v2.
 """
 
 from onspring_api_sdk.async_client import AsyncOnspringClient
+from onspring_api_sdk.cache import MetadataCache
 from onspring_api_sdk.client import OnspringClient
 from onspring_api_sdk.errors import (
     OnspringAuthenticationError,
@@ -11,6 +12,14 @@ from onspring_api_sdk.errors import (
     OnspringNotFoundError,
     OnspringRateLimitError,
 )
+from onspring_api_sdk.http_cache import ResponseCache
+from onspring_api_sdk.incremental import Checkpoint, CheckpointStore, FileCheckpointStore, MemoryCheckpointStore
+from onspring_api_sdk.instrumentation import RequestObserver, RequestStart, RequestTiming
+from onspring_api_sdk.metrics import MetricsCollector
+from onspring_api_sdk.persistent_cache import PersistentMetadataCache
+from onspring_api_sdk.rate_limit import RateLimiter
+from onspring_api_sdk.retry import RetryPolicy, RetryStats
+from onspring_api_sdk.table import Column, RecordTable, ReportTable
 
 __all__ = [
     "OnspringClient",
@@ -19,4 +28,21 @@ __all__ = [
     "OnspringAuthenticationError",
     "OnspringNotFoundError",
     "OnspringRateLimitError",
+    "MetadataCache",
+    "PersistentMetadataCache",
+    "ResponseCache",
+    "RateLimiter",
+    "RetryPolicy",
+    "RetryStats",
+    "RecordTable",
+    "ReportTable",
+    "Column",
+    "RequestObserver",
+    "RequestStart",
+    "RequestTiming",
+    "MetricsCollector",
+    "Checkpoint",
+    "CheckpointStore",
+    "MemoryCheckpointStore",
+    "FileCheckpointStore",
 ]
@@ -0,0 +1,191 @@
+"""Helpers for splitting batch record requests into chunks and fanning out many requests."""
+
+import asyncio
+from collections.abc import AsyncIterable, Awaitable, Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, TypeVar
+
+from onspring_api_sdk.models import (
+    ApiResponse,
+    DeleteBatchRecordsChunkResult,
+    DeleteBatchRecordsReport,
+    GetBatchRecordsResponse,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def chunk_request(request: Any, batch_size: int) -> list[Any]:
+    """Split a request's ``record_ids`` into copies holding at most ``batch_size`` IDs each."""
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+
+    record_ids = request.record_ids
+
+    if len(record_ids) <= batch_size:
+        return [request]
+
+    return [
+        request.model_copy(update={"record_ids": record_ids[i : i + batch_size]})
+        for i in range(0, len(record_ids), batch_size)
+    ]
+
+
+def fetch_chunks(fetch: Callable[[Any], R], requests: list[Any], max_concurrency: int) -> list[R]:
+    """Send each chunk on a bounded thread pool and return the results in chunk order."""
+    if len(requests) == 1:
+        return [fetch(requests[0])]
+
+    with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+        return list(executor.map(fetch, requests))
+
+
+async def afetch_chunks(fetch: Callable[[Any], Awaitable[R]], requests: list[Any], max_concurrency: int) -> list[R]:
+    """Async equivalent of ``fetch_chunks`` bounded by a semaphore."""
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _fetch(request: Any) -> R:
+        async with semaphore:
+            return await fetch(request)
+
+    return list(await asyncio.gather(*(_fetch(request) for request in requests)))
+
+
+def merge_batch_records(
+    responses: list[ApiResponse[GetBatchRecordsResponse]],
+) -> ApiResponse[GetBatchRecordsResponse]:
+    """Merge chunked batch-get responses, or return the first failure if any chunk failed.
+
+    Responses parsed as decoded JSON are merged into a single JSON object.
+    """
+    if len(responses) == 1:
+        return responses[0]
+
+    for response in responses:
+        if not response.is_successful or response.data is None:
+            return response
+
+    if isinstance(responses[0].data, dict):
+        items = [item for response in responses for item in response.data["items"]]
+
+        return ApiResponse(status_code=responses[0].status_code, data={"count": len(items), "items": items})
+
+    records = [record for response in responses for record in response.data.records]
+
+    return ApiResponse(
+        status_code=responses[0].status_code,
+        data=GetBatchRecordsResponse(count=len(records), items=records),
+    )
+
+
+def build_delete_report(
+    requests: list[Any], responses: list[ApiResponse[None]]
+) -> ApiResponse[DeleteBatchRecordsReport]:
+    """Combine chunked batch-delete responses into one response carrying a per-chunk report.
+
+    The combined response takes its status and message from the first failed
+    chunk, or from the last chunk when every chunk succeeded, and its raw
+    response, headers and timing too when there was only one chunk. A failed
+    unchunked request is returned as is, without a report.
+    """
+    if len(responses) == 1 and not responses[0].is_successful:
+        return responses[0]
+
+    report = DeleteBatchRecordsReport(
+        chunks=[
+            DeleteBatchRecordsChunkResult(
+                record_ids=request.record_ids,
+                status_code=response.status_code,
+                is_successful=response.is_successful,
+                message=response.message,
+            )
+            for request, response in zip(requests, responses)
+        ]
+    )
+    summary = next((response for response in responses if not response.is_successful), responses[-1])
+    single = len(responses) == 1
+
+    return ApiResponse(
+        status_code=summary.status_code,
+        is_successful=summary.is_successful,
+        message=summary.message,
+        data=report,
+        raw_response=summary.raw_response if single else None,
+        headers=summary.headers if single else None,
+        elapsed=summary.elapsed if single else None,
+        timing=summary.timing if single else None,
+    )
+
+
+def map_bounded(fn: Callable[[T], R], items: Iterable[T], max_concurrency: int) -> list[R | Exception]:
+    """Apply ``fn`` to each item on a thread pool and return the results in input order.
+
+    Items are pulled from the iterable only as workers free up, so at most
+    ``max_concurrency`` calls are in flight and the iterable is never
+    materialized. An exception raised for an item is returned in its place.
+    """
+    max_concurrency = max(1, max_concurrency)
+    results: list[R | Exception] = []
+    in_flight: dict[Future[R], int] = {}
+
+    def _collect(futures: Iterable[Future[R]]) -> None:
+        for future in futures:
+            index = in_flight.pop(future)
+            error = future.exception()
+            results[index] = error if error is not None else future.result()
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        for item in items:
+            if len(in_flight) >= max_concurrency:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                _collect(done)
+
+            in_flight[executor.submit(fn, item)] = len(results)
+            results.append(None)
+
+        _collect(list(in_flight))
+
+    return results
+
+
+async def amap_bounded(
+    fn: Callable[[T], Awaitable[R]], items: Iterable[T] | AsyncIterable[T], max_concurrency: int
+) -> list[R | Exception]:
+    """Async equivalent of ``map_bounded`` using a fixed number of worker tasks.
+
+    Accepts a sync or async iterable of items.
+    """
+    results: dict[int, R | Exception] = {}
+    iterator = _aenumerate(items)
+    lock = asyncio.Lock()
+
+    async def _worker() -> None:
+        while True:
+            async with lock:
+                try:
+                    index, item = await anext(iterator)
+                except StopAsyncIteration:
+                    return
+
+            try:
+                results[index] = await fn(item)
+            except Exception as error:
+                results[index] = error
+
+    await asyncio.gather(*(_worker() for _ in range(max(1, max_concurrency))))
+
+    return [results[index] for index in range(len(results))]
+
+
+async def _aenumerate(items: Iterable[T] | AsyncIterable[T]):
+    index = 0
+
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield index, item
+            index += 1
+    else:
+        for item in items:
+            yield index, item
+            index += 1
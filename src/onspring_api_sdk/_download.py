@@ -0,0 +1,87 @@
+"""Helpers for streaming response bodies to a path or writable stream."""
+
+import asyncio
+import inspect
+import os
+from collections.abc import AsyncIterator, Iterator
+from typing import IO, Any
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+Destination = str | os.PathLike[str] | IO[bytes]
+
+
+def _is_path(destination: Any) -> bool:
+    return isinstance(destination, (str, os.PathLike))
+
+
+def remove_partial(path: Any) -> None:
+    """Remove a partly written file, ignoring errors if it is already gone."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def write_stream(chunks: Iterator[bytes], destination: Destination) -> int:
+    """Write each chunk to the destination and return the number of bytes written.
+
+    A path is opened for writing and removed again if the stream fails part
+    way through. A file-like object is written to as is and left open.
+    """
+    if not _is_path(destination):
+        return _write_chunks(chunks, destination)
+
+    try:
+        with open(destination, "wb") as f:
+            return _write_chunks(chunks, f)
+    except BaseException:
+        remove_partial(destination)
+        raise
+
+
+def _write_chunks(chunks: Iterator[bytes], f: IO[bytes]) -> int:
+    written = 0
+
+    for chunk in chunks:
+        f.write(chunk)
+        written += len(chunk)
+
+    return written
+
+
+async def awrite_stream(chunks: AsyncIterator[bytes], destination: Destination) -> int:
+    """Async equivalent of ``write_stream``.
+
+    File writes are run in a worker thread so the event loop is not blocked.
+    A destination whose ``write`` method is a coroutine function is awaited
+    directly instead.
+    """
+    if not _is_path(destination):
+        return await _awrite_chunks(chunks, destination)
+
+    f = await asyncio.to_thread(open, destination, "wb")
+
+    try:
+        try:
+            return await _awrite_chunks(chunks, f)
+        finally:
+            await asyncio.to_thread(f.close)
+    except BaseException:
+        await asyncio.to_thread(remove_partial, destination)
+        raise
+
+
+async def _awrite_chunks(chunks: AsyncIterator[bytes], f: Any) -> int:
+    written = 0
+    is_async = inspect.iscoroutinefunction(f.write)
+
+    async for chunk in chunks:
+        if is_async:
+            await f.write(chunk)
+        else:
+            await asyncio.to_thread(f.write, chunk)
+
+        written += len(chunk)
+
+    return written
@@ -0,0 +1,107 @@
+"""Streaming multipart/form-data encoding for file uploads."""
+
+import asyncio
+import os
+import secrets
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator, Mapping
+from typing import Any
+
+from onspring_api_sdk._download import DEFAULT_CHUNK_SIZE
+
+FileContent = bytes | Iterable[bytes] | AsyncIterable[bytes]
+
+
+def _quote(value: str) -> str:
+    """Escape a header parameter value the way browsers do for form uploads."""
+    return value.replace("\\", "\\\\").replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+
+class MultipartEncoder:
+    """Encodes form fields and a single file as a multipart body streamed chunk by chunk.
+
+    Only the part headers are held in memory. The file content is passed
+    through as it is produced, so memory use does not depend on file size.
+    """
+
+    def __init__(
+        self,
+        fields: Mapping[str, Any],
+        file_field: str,
+        file_name: str,
+        content_type: str,
+        content_length: int | None = None,
+    ):
+        """Prepare the part headers for ``fields`` followed by a file part named ``file_field``."""
+        self.boundary = secrets.token_hex(16)
+        delimiter = f"--{self.boundary}\r\n"
+
+        head = "".join(
+            f'{delimiter}Content-Disposition: form-data; name="{_quote(name)}"\r\n\r\n{value}\r\n'
+            for name, value in fields.items()
+        )
+        head += (
+            f'{delimiter}Content-Disposition: form-data; name="{_quote(file_field)}"; '
+            f'filename="{_quote(file_name)}"\r\nContent-Type: {content_type}\r\n\r\n'
+        )
+
+        self._head = head.encode()
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode()
+        self.content_length = content_length
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """Return the request headers for the body, including its length when the file size is known."""
+        headers = {"Content-Type": f"multipart/form-data; boundary={self.boundary}"}
+
+        if self.content_length is not None:
+            headers["Content-Length"] = str(len(self._head) + self.content_length + len(self._tail))
+
+        return headers
+
+    def iter_bytes(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Yield the encoded body around the given file chunks."""
+        yield self._head
+
+        for chunk in chunks:
+            if chunk:
+                yield chunk
+
+        yield self._tail
+
+    async def aiter_bytes(self, chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+        """Async equivalent of ``iter_bytes``."""
+        yield self._head
+
+        async for chunk in chunks:
+            if chunk:
+                yield chunk
+
+        yield self._tail
+
+
+def iter_file(path: str | os.PathLike[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield the contents of a file in chunks."""
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            yield chunk
+
+
+async def aiter_file(path: str | os.PathLike[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Yield the contents of a file in chunks, reading in a worker thread."""
+    f = await asyncio.to_thread(open, path, "rb")
+
+    try:
+        while chunk := await asyncio.to_thread(f.read, chunk_size):
+            yield chunk
+    finally:
+        await asyncio.to_thread(f.close)
+
+
+async def aiter_content(content: Iterable[bytes] | AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """Adapt a sync or async iterable of bytes to an async iterator."""
+    if isinstance(content, AsyncIterable):
+        async for chunk in content:
+            yield chunk
+    else:
+        for chunk in content:
+            yield chunk
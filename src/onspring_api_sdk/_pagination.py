@@ -0,0 +1,144 @@
+"""Shared paging helpers used by the sync and async clients."""
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from onspring_api_sdk.models import ApiResponse
+
+P = TypeVar("P")
+
+
+def _with_page(request: Any, page_number: int) -> Any:
+    """Return a copy of a paged request pointing at the given page."""
+    return request.model_copy(update={"page_number": page_number})
+
+
+def iter_pages(fetch: Callable[[Any], ApiResponse[P]], request: Any, prefetch: int) -> Iterator[P]:
+    """Yield the data of each page in order while keeping up to ``prefetch`` later pages in flight.
+
+    Raises the matching ``OnspringError`` subclass as soon as a page fails.
+    """
+    first = fetch(request)
+    first.raise_for_status()
+    total_pages = first.data.total_pages
+    next_page = request.page_number + 1
+
+    if prefetch < 1:
+        yield first.data
+
+        for page_number in range(next_page, total_pages + 1):
+            response = fetch(_with_page(request, page_number))
+            response.raise_for_status()
+            yield response.data
+
+        return
+
+    if next_page > total_pages:
+        yield first.data
+        return
+
+    executor = ThreadPoolExecutor(max_workers=prefetch)
+    pending: deque[Future[ApiResponse[P]]] = deque()
+
+    def _fill() -> None:
+        nonlocal next_page
+        while next_page <= total_pages and len(pending) < prefetch:
+            pending.append(executor.submit(fetch, _with_page(request, next_page)))
+            next_page += 1
+
+    try:
+        _fill()
+        yield first.data
+
+        while pending:
+            response = pending.popleft().result()
+            _fill()
+            response.raise_for_status()
+            yield response.data
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_pages(
+    fetch: Callable[[Any], Awaitable[ApiResponse[P]]], request: Any, prefetch: int
+) -> AsyncIterator[P]:
+    """Async equivalent of ``iter_pages`` that prefetches pages as concurrent tasks."""
+    first = await fetch(request)
+    first.raise_for_status()
+    total_pages = first.data.total_pages
+    next_page = request.page_number + 1
+
+    if prefetch < 1:
+        yield first.data
+
+        for page_number in range(next_page, total_pages + 1):
+            response = await fetch(_with_page(request, page_number))
+            response.raise_for_status()
+            yield response.data
+
+        return
+
+    pending: deque[asyncio.Task[ApiResponse[P]]] = deque()
+
+    def _fill() -> None:
+        nonlocal next_page
+        while next_page <= total_pages and len(pending) < prefetch:
+            pending.append(asyncio.ensure_future(fetch(_with_page(request, next_page))))
+            next_page += 1
+
+    try:
+        _fill()
+        yield first.data
+
+        while pending:
+            response = await pending.popleft()
+            _fill()
+            response.raise_for_status()
+            yield response.data
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def fetch_all_pages(fetch: Callable[[Any], ApiResponse[P]], request: Any, max_concurrency: int) -> list[ApiResponse[P]]:
+    """Fetch the request's page, then every later page on a bounded thread pool.
+
+    Responses are returned in page order. If the first page fails it is the
+    only response returned; failures on later pages are returned in place.
+    """
+    first = fetch(request)
+
+    if not first.is_successful or first.data is None:
+        return [first]
+
+    requests = [_with_page(request, n) for n in range(request.page_number + 1, first.data.total_pages + 1)]
+
+    if not requests:
+        return [first]
+
+    with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+        return [first, *executor.map(fetch, requests)]
+
+
+async def afetch_all_pages(
+    fetch: Callable[[Any], Awaitable[ApiResponse[P]]], request: Any, max_concurrency: int
+) -> list[ApiResponse[P]]:
+    """Async equivalent of ``fetch_all_pages`` bounded by a semaphore."""
+    first = await fetch(request)
+
+    if not first.is_successful or first.data is None:
+        return [first]
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _fetch(page_request: Any) -> ApiResponse[P]:
+        async with semaphore:
+            return await fetch(page_request)
+
+    requests = [_with_page(request, n) for n in range(request.page_number + 1, first.data.total_pages + 1)]
+    rest = await asyncio.gather(*(_fetch(page_request) for page_request in requests))
+
+    return [first, *rest]
@@ -1,15 +1,22 @@
 """Shared response handlers for Onspring API endpoints."""
 
 import re
+from collections.abc import Callable
+from typing import Any, TypeVar
 
 import httpx
+from pydantic import BaseModel
 
+from onspring_api_sdk.enums import ParseMode, RawResponseMode
 from onspring_api_sdk.errors import _get_error_message
+from onspring_api_sdk.http_cache import PARSED_MODELS
 from onspring_api_sdk.models import (
     AddOrUpdateListItemResponse,
     AddOrUpdateRecordResponse,
     ApiResponse,
     App,
+    DownloadedFile,
+    DownloadFileResponse,
     File,
     FileInfo,
     GetAppByIdResponse,
@@ -28,9 +35,68 @@ from onspring_api_sdk.models import (
     Record,
     SaveFileResponse,
 )
+from onspring_api_sdk.models.record import LAZY_FIELDS
 
+M = TypeVar("M", bound=BaseModel)
+T = TypeVar("T")
 
-def handle_get_apps_response(response: httpx.Response) -> ApiResponse[GetAppsResponse]:
+
+def is_raw(parse_mode: ParseMode) -> bool:
+    """Return whether the parse mode skips building models."""
+    return parse_mode in (ParseMode.Json, ParseMode.Bytes)
+
+
+def _parse(
+    model: type[M], response: httpx.Response, parse_mode: ParseMode, wrap: Callable[[M], Any] | None = None
+) -> Any:
+    """Build a model from a response body according to the parse mode.
+
+    ``Json`` and ``Bytes`` return the decoded JSON or the body itself without
+    building ``model``, in which case ``wrap`` is not applied either. Models
+    are reused when the response was served from a response cache that has
+    already parsed the same body.
+    """
+    if parse_mode is ParseMode.Json:
+        return response.json()
+
+    if parse_mode is ParseMode.Bytes:
+        return response.content
+
+    parsed_models = response.extensions.get(PARSED_MODELS)
+    key = (model, parse_mode)
+
+    if parsed_models is not None and key in parsed_models:
+        parsed = parsed_models[key]
+    else:
+        if parse_mode is ParseMode.Lazy:
+            parsed = model.model_validate_json(response.content, context={LAZY_FIELDS: True})
+        else:
+            parsed = model.model_validate(response.json())
+
+        if parsed_models is not None:
+            parsed_models[key] = parsed
+
+    return wrap(parsed) if wrap is not None else parsed
+
+
+def apply_raw_response_mode(result: ApiResponse[T], raw_response_mode: RawResponseMode) -> ApiResponse[T]:
+    """Drop the raw response, and optionally its metadata and timing, according to the mode."""
+    if raw_response_mode is RawResponseMode.Full:
+        return result
+
+    result.raw_response = None
+
+    if raw_response_mode is RawResponseMode.Off:
+        result.headers = None
+        result.elapsed = None
+        result.timing = None
+
+    return result
+
+
+def handle_get_apps_response(
+    response: httpx.Response, parse_mode: ParseMode = ParseMode.Validated
+) -> ApiResponse[GetAppsResponse]:
     match response.status_code:
         case 400:
             return ApiResponse(
@@ -49,14 +115,16 @@ def handle_get_apps_response(response: httpx.Response) -> ApiResponse[GetAppsRes
         case 200:
             return ApiResponse(
                 status_code=response.status_code,
-                data=GetAppsResponse.model_validate(response.json()),
+                data=_parse(GetAppsResponse, response, parse_mode),
                 raw_response=response,
             )
         case _:
             return ApiResponse(status_code=response.status_code, is_successful=False, raw_response=response)
 
 
-def handle_get_field_by_id_response(response: httpx.Response) -> ApiResponse[GetFieldByIdResponse]:
+def handle_get_field_by_id_response(
+    response: httpx.Response, parse_mode: ParseMode = ParseMode.Validated
+) -> ApiResponse[GetFieldByIdResponse]:
     match response.status_code:
         case 401:
             return ApiResponse(
@@ -82,14 +150,16 @@ def handle_get_field_by_id_response(response: httpx.Response) -> ApiResponse[Get
         case 200:
             return ApiResponse(
                 status_code=response.status_code,
-                data=GetFieldByIdResponse(field=OnspringField.model_validate(response.json())),
+                data=_parse(OnspringField, response, parse_mode, lambda field: GetFieldByIdResponse(field=field)),
                 raw_response=response,
             )
         case _:
             return ApiResponse(status_code=response.status_code, is_successful=False, raw_response=response)
 
 
-def handle_get_fields_by_ids_response(response: httpx.Response) -> ApiResponse[GetFieldsByIdsResponse]:
+def handle_get_fields_by_ids_response(
+    response: httpx.Response, parse_mode: ParseMode = ParseMode.Validated
+) -> ApiResponse[GetFieldsByIdsResponse]:
     match response.status_code:
         case 401:
             return ApiResponse(
@@ -115,14 +185,16 @@ def handle_get_fields_by_ids_response(response: httpx.Response) -> ApiResponse[G
         case 200:
             return ApiResponse(
                 status_code=response.status_code,
-                data=GetFieldsByIdsResponse.model_validate(response.json()),
+                data=_parse(GetFieldsByIdsResponse, response, parse_mode),
                 raw_response=response,
             )
         case _:
             return ApiResponse(status_code=response.status_code, is_successful=False, raw_response=response)
 
 
-def handle_get_fields_by_app_id_response(response: httpx.Response) -> ApiResponse[GetFieldsByAppIdResponse]:
+def handle_get_fields_by_app_id_response(
+    response: httpx.Response, parse_mode: ParseMode = ParseMode.Validated
+) -> ApiResponse[GetFieldsByAppIdResponse]:
     match response.status_code:
         case 400:
             return ApiResponse(
@@ -141,14 +213,16 @@ def handle_get_fields_by_app_id_response(response: httpx.Response) -> ApiRespons
         case 200:
             return ApiResponse(
                 status_code=response.status_code,
-                data=GetFieldsByAppIdResponse.model_validate(response.json()),
+                data=_parse(GetFieldsByAppIdResponse, response, parse_mode),
                 raw_response=response,
             )
         case _:
             return ApiResponse(status_code=response.status_code, is_successful=False, raw_response=response)
 
 
-def handle_get_apps_by_ids_response(response: httpx.Response) -> ApiResponse[GetAppsByIdsResponse]:
+def handle_get_apps_by_ids_response(
+    response: httpx.Response, parse_mode: ParseMode = ParseMode.Validated
+) -> ApiResponse[GetAppsByIdsResponse]:
     match response.status_code:
         case 401:
             return ApiResponse(
@@ -167,14 +241,16 @@ def handle_get_apps_by_ids_response(response: httpx.Response) -> ApiResponse[Get
         case 200:
             return ApiResponse(
                 status_code=response.status_code,
-                data=GetAppsByIdsResponse.model_validate(response.json()),
+                data=_parse(GetAppsByIdsResponse, response, parse_mode),
                 raw_response=response,
             )
         case _:
             return ApiResponse(status_code=response.status_code, is_successful=False, raw_response=response)
 
 
-def handle_get_app_by_id_response(response: httpx.Response) -> ApiResponse[GetAppByIdResponse]:
+def handle_get_app_by_id_response(
+    response: httpx.Response, parse_mode: ParseMode = ParseMode.Validated
+) -> ApiResponse[GetAppByIdResponse]:
     match response.status_code:
         case 401:
             return ApiResponse(
@@ -200,14 +276,16 @@ def handle_get_app_by_id_response(response: httpx.Response) -> ApiResponse[GetAp
         case 200:
             return ApiResponse(
                 status_code=response.status_code,
-                data=GetAppByIdResponse(app=App.model_validate(response.json())),
+                data=_parse(App, response, parse_mode, lambda app: GetAppByIdResponse(app=app)),
                 raw_response=response,
             )
         case _:
             return ApiResponse(status_code=response.status_code, is_successful=False, raw_response=response)
 
 
-def handle_get_file_info_by_id_response(response: httpx.Response) -> ApiResponse[GetFileInfoByIdResponse]:
+def handle_get_file_info_by_id_response(
+    response: httpx.Response, parse_mode: ParseMode = ParseMode.Validated
+) -> ApiResponse[GetFileInfoByIdResponse]:
     match response.status_code:
         case 400:
             return ApiResponse(
@@ -240,7 +318,9 @@ def handle_get_file_info_by_id_response(response: httpx.Response) -> ApiResponse
         case 200:
             return ApiResponse(
                 status_code=response.status_code,
-                data=GetFileInfoByIdResponse(file_info=FileInfo.model_validate(response.json())),
+                data=_parse(
+                    FileInfo, response, parse_mode, lambda file_info: GetFileInfoByIdResponse(file_info=file_info)
+                ),
                 raw_response=response,
             )
         case _:
@@ -285,6 +365,19 @@ def handle_delete_file_by_id_response(response: httpx.Response) -> ApiResponse[N
             return ApiResponse(status_code=response.status_code, is_successful=False, raw_response=response)
 
 
+def _get_file_headers(response: httpx.Response) -> dict:
+    """Extract the file name, content type and content length from a file response's headers."""
+    headers = response.headers
+    content_disposition = headers.get("content-disposition", "")
+    match = re.search(r"filename=(.*?)(?:;|$)", content_disposition)
+
+    return {
+        "name": match.group(1).strip("'\"") if match else "OnspringFile",
+        "contentType": headers.get("content-type", ""),
+        "contentLength": int(headers.get("content-length", 0)),
+    }
+
+
 def handle_get_file_by_id_response(response: httpx.Response) -> ApiResponse[GetFileByIdResponse]:
     match response.status_code:
         case 400:
@@ -309,16 +402,7 @@ def handle_get_file_by_id_response(response: httpx.Response) -> ApiResponse[GetF
                 raw_response=response,
             )
         case 200:
-            headers = response.headers
-            content_disposition = headers.get("content-disposition", "")
-            match = re.search(r"filename=(.*?)(?:;|$)", content_disposition)
-            file_name = match.group(1).strip("'\"") if match else "OnspringFile"
-            file = File(
-                name=file_name,
-                contentType=headers.get("content-type", ""),
-                contentLength=int(headers.get("content-length", 0)),
-                content=response.content,
-            )
+            file = File(**_get_file_headers(response), content=response.content)
 
             return ApiResponse(
                 status_code=response.status_code, data=GetFileByIdResponse(file=file), raw_response=response
@@ -327,7 +411,44 @@ def handle_get_file_by_id_response(response: httpx.Response) -> ApiResponse[GetF
             return ApiResponse(status_code=response.status_code, is_successful=False, raw_response=response)
 
 
-def handle_save_file_response(response: httpx.Response) -> ApiResponse[SaveFileResponse]:
+def handle_download_file_response(
+    response: httpx.Response, bytes_written: int = 0
+) -> ApiResponse[DownloadFileResponse]:
+    match response.status_code:
+        case 400:
+            return ApiResponse(
+                status_code=response.status_code,
+                is_successful=False,
+                message="Request is invalid based on underlying data",
+                raw_response=response,
+            )
+        case 401:
+            return ApiResponse(
+                status_code=response.status_code,
+                is_successful=False,
+                message="Unauthorized request",
+                raw_response=response,
+            )
+        case 403 | 404:
+            return ApiResponse(
+                status_code=response.status_code,
+                is_successful=False,
+                message=_get_error_message(response),
+                raw_response=response,
+            )
+        case 200:
+            file = DownloadedFile(**_get_file_headers(response), bytesWritten=bytes_written)
+
+            return ApiResponse(
+                status_code=response.status_code, data=DownloadFileResponse(file=file), raw_response=response
+            )
+        case _:
+            return ApiResponse(status_code=response.status_code, is_successful=False, raw_response=response)
+
+
+def handle_save_file_response(
+    response: httpx.Response, parse_mode: ParseMode = ParseMode.Validated
+) -> ApiResponse[SaveFileResponse]:
     match response.status_code:
         case 400:
             return ApiResponse(
@@ -353,7 +474,7 @@ def handle_save_file_response(response: httpx.Response) -> ApiResponse[SaveFileR
         case 201:
             return ApiResponse(
                 status_code=response.status_code,
-                data=SaveFileResponse.model_validate(response.json()),
+                data=_parse(SaveFileResponse, response, parse_mode),
                 raw_response=response,
             )
         case _:
@@ -361,7 +482,7 @@ def handle_save_file_response(response: httpx.Response) -> ApiResponse[SaveFileR
 
 
 def handle_add_or_update_list_item_response(
-    response: httpx.Response,
+    response: httpx.Response, parse_mode: ParseMode = ParseMode.Validated
 ) -> ApiResponse[AddOrUpdateListItemResponse]:
     match response.status_code:
         case 401:
@@ -381,14 +502,14 @@ def handle_add_or_update_list_item_response(
         case 201:
             return ApiResponse(
                 status_code=response.status_code,
-                data=AddOrUpdateListItemResponse.model_validate(response.json()),
+                data=_parse(AddOrUpdateListItemResponse, response, parse_mode),
                 message="New list value successfully added",
                 raw_response=response,
             )
         case 200:
             return ApiResponse(
                 status_code=response.status_code,
-                data=AddOrUpdateListItemResponse.model_validate(response.json()),
+                data=_parse(AddOrUpdateListItemResponse, response, parse_mode),
                 message="Existing list value successfully updated",
                 raw_response=response,
             )
@@ -427,7 +548,9 @@ def handle_delete_list_item_response(response: httpx.Response) -> ApiResponse[No
             return ApiResponse(status_code=response.status_code, is_successful=False, raw_response=response)
 
 
-def handle_get_records_by_app_id_response(response: httpx.Response) -> ApiResponse[GetRecordsResponse]:
+def handle_get_records_by_app_id_response(
+    response: httpx.Response, parse_mode: ParseMode = ParseMode.Validated
+) -> ApiResponse[GetRecordsResponse]:
     match response.status_code:
         case 400:
             return ApiResponse(
@@ -453,14 +576,16 @@ def handle_get_records_by_app_id_response(response: httpx.Response) -> ApiRespon
         case 200:
             return ApiResponse(
                 status_code=response.status_code,
-                data=GetRecordsResponse.model_validate(response.json()),
+                data=_parse(GetRecordsResponse, response, parse_mode),
                 raw_response=response,
             )
         case _:
             return ApiResponse(status_code=response.status_code, is_successful=False, raw_response=response)
 
 
-def handle_get_record_by_id_response(response: httpx.Response) -> ApiResponse[Record]:
+def handle_get_record_by_id_response(
+    response: httpx.Response, parse_mode: ParseMode = ParseMode.Validated
+) -> ApiResponse[Record]:
     match response.status_code:
         case 401:
             return ApiResponse(
@@ -485,7 +610,7 @@ def handle_get_record_by_id_response(response: httpx.Response) -> ApiResponse[Re
             )
         case 200:
             return ApiResponse(
-                status_code=response.status_code, data=Record.model_validate(response.json()), raw_response=response
+                status_code=response.status_code, data=_parse(Record, response, parse_mode), raw_response=response
             )
         case _:
             return ApiResponse(status_code=response.status_code, is_successful=False, raw_response=response)
@@ -522,7 +647,9 @@ def handle_delete_record_by_id_response(response: httpx.Response) -> ApiResponse
             return ApiResponse(status_code=response.status_code, is_successful=False, raw_response=response)
 
 
-def handle_get_records_by_ids_response(response: httpx.Response) -> ApiResponse[GetBatchRecordsResponse]:
+def handle_get_records_by_ids_response(
+    response: httpx.Response, parse_mode: ParseMode = ParseMode.Validated
+) -> ApiResponse[GetBatchRecordsResponse]:
     match response.status_code:
         case 400:
             return ApiResponse(
@@ -548,14 +675,16 @@ def handle_get_records_by_ids_response(response: httpx.Response) -> ApiResponse[
         case 200:
             return ApiResponse(
                 status_code=response.status_code,
-                data=GetBatchRecordsResponse.model_validate(response.json()),
+                data=_parse(GetBatchRecordsResponse, response, parse_mode),
                 raw_response=response,
             )
         case _:
             return ApiResponse(status_code=response.status_code, is_successful=False, raw_response=response)
 
 
-def handle_query_records_response(response: httpx.Response) -> ApiResponse[GetRecordsResponse]:
+def handle_query_records_response(
+    response: httpx.Response, parse_mode: ParseMode = ParseMode.Validated
+) -> ApiResponse[GetRecordsResponse]:
     match response.status_code:
         case 400:
             return ApiResponse(
@@ -581,14 +710,16 @@ def handle_query_records_response(response: httpx.Response) -> ApiResponse[GetRe
         case 200:
             return ApiResponse(
                 status_code=response.status_code,
-                data=GetRecordsResponse.model_validate(response.json()),
+                data=_parse(GetRecordsResponse, response, parse_mode),
                 raw_response=response,
             )
         case _:
             return ApiResponse(status_code=response.status_code, is_successful=False, raw_response=response)
 
 
-def handle_add_or_update_record_response(response: httpx.Response) -> ApiResponse[AddOrUpdateRecordResponse]:
+def handle_add_or_update_record_response(
+    response: httpx.Response, parse_mode: ParseMode = ParseMode.Validated
+) -> ApiResponse[AddOrUpdateRecordResponse]:
     match response.status_code:
         case 400:
             return ApiResponse(
@@ -615,7 +746,7 @@ def handle_add_or_update_record_response(response: httpx.Response) -> ApiRespons
             message = "Record updated successfully" if response.status_code == 200 else "Record created successfully"
             return ApiResponse(
                 status_code=response.status_code,
-                data=AddOrUpdateRecordResponse.model_validate(response.json()),
+                data=_parse(AddOrUpdateRecordResponse, response, parse_mode),
                 message=message,
                 raw_response=response,
             )
@@ -661,7 +792,9 @@ def handle_delete_records_by_ids_response(response: httpx.Response) -> ApiRespon
             return ApiResponse(status_code=response.status_code, is_successful=False, raw_response=response)
 
 
-def handle_get_report_by_id_response(response: httpx.Response) -> ApiResponse[GetReportByIdResponse]:
+def handle_get_report_by_id_response(
+    response: httpx.Response, parse_mode: ParseMode = ParseMode.Validated
+) -> ApiResponse[GetReportByIdResponse]:
     match response.status_code:
         case 400:
             return ApiResponse(
@@ -694,14 +827,16 @@ def handle_get_report_by_id_response(response: httpx.Response) -> ApiResponse[Ge
         case 200:
             return ApiResponse(
                 status_code=response.status_code,
-                data=GetReportByIdResponse.model_validate(response.json()),
+                data=_parse(GetReportByIdResponse, response, parse_mode),
                 raw_response=response,
             )
         case _:
             return ApiResponse(status_code=response.status_code, is_successful=False, raw_response=response)
 
 
-def handle_get_reports_by_app_id_response(response: httpx.Response) -> ApiResponse[GetReportsByAppIdResponse]:
+def handle_get_reports_by_app_id_response(
+    response: httpx.Response, parse_mode: ParseMode = ParseMode.Validated
+) -> ApiResponse[GetReportsByAppIdResponse]:
     match response.status_code:
         case 400:
             return ApiResponse(
@@ -727,7 +862,7 @@ def handle_get_reports_by_app_id_response(response: httpx.Response) -> ApiRespon
         case 200:
             return ApiResponse(
                 status_code=response.status_code,
-                data=GetReportsByAppIdResponse.model_validate(response.json()),
+                data=_parse(GetReportsByAppIdResponse, response, parse_mode),
                 raw_response=response,
             )
         case _:
@@ -2,19 +2,34 @@
 
 import asyncio
 import json
-from collections.abc import Mapping
+import os
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Mapping, Sequence
+from datetime import timedelta
+from functools import partial
 from types import MappingProxyType
-from typing import Final
+from typing import Final, TypeVar
 
 import httpx
 
+from onspring_api_sdk._batching import (
+    afetch_chunks,
+    amap_bounded,
+    build_delete_report,
+    chunk_request,
+    merge_batch_records,
+)
+from onspring_api_sdk._download import DEFAULT_CHUNK_SIZE, Destination, awrite_stream
+from onspring_api_sdk._multipart import FileContent, MultipartEncoder, aiter_content, aiter_file
+from onspring_api_sdk._pagination import afetch_all_pages, aiter_pages
 from onspring_api_sdk._responses import (
+    apply_raw_response_mode,
     handle_add_or_update_list_item_response,
     handle_add_or_update_record_response,
     handle_delete_file_by_id_response,
     handle_delete_list_item_response,
     handle_delete_record_by_id_response,
     handle_delete_records_by_ids_response,
+    handle_download_file_response,
     handle_get_app_by_id_response,
     handle_get_apps_by_ids_response,
     handle_get_apps_response,
@@ -30,7 +45,9 @@ from onspring_api_sdk._responses import (
     handle_get_reports_by_app_id_response,
     handle_query_records_response,
     handle_save_file_response,
+    is_raw,
 )
+from onspring_api_sdk.cache import MetadataCache
 from onspring_api_sdk.endpoints import (
     add_or_update_list_item_endpoint,
     add_or_update_record_endpoint,
@@ -55,11 +72,25 @@ from onspring_api_sdk.endpoints import (
     query_records_endpoint,
     save_file_endpoint,
 )
+from onspring_api_sdk.enums import DataFormat, ExportFormat, ParseMode, RawResponseMode
+from onspring_api_sdk.export import (
+    DEFAULT_EXPORT_PAGE_SIZE,
+    ExportProgress,
+    TextDestination,
+    open_writer,
+    record_columns,
+    record_rows,
+)
+from onspring_api_sdk.http_cache import ResponseCache
+from onspring_api_sdk.incremental import DEFAULT_CHANGES_PAGE_SIZE, DEFAULT_OVERLAP, ChangeScan, CheckpointStore
+from onspring_api_sdk.instrumentation import RequestObserver, RequestStart, RequestTiming, _RequestTimer, pop_timer
 from onspring_api_sdk.models import (
     AddOrUpdateListItemResponse,
     AddOrUpdateRecordResponse,
     ApiResponse,
+    DeleteBatchRecordsReport,
     DeleteBatchRecordsRequest,
+    DownloadFileResponse,
     GetAppByIdResponse,
     GetAppsByIdsResponse,
     GetAppsResponse,
@@ -83,24 +114,68 @@ from onspring_api_sdk.models import (
     SaveFileRequest,
     SaveFileResponse,
 )
+from onspring_api_sdk.rate_limit import RateLimiter
+from onspring_api_sdk.retry import RetryPolicy, RetryStats
+from onspring_api_sdk.table import RecordTable
 
 API_VERSION = "2"
 CONTENT_TYPE_JSON = "application/json"
+DEFAULT_PREFETCH = 2
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_LIMITS: Final = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=5.0)
+DEFAULT_TIMEOUT: Final = httpx.Timeout(5.0)
 _JSON_HEADERS: Final[Mapping[str, str]] = MappingProxyType({"Content-Type": CONTENT_TYPE_JSON})
 
+T = TypeVar("T")
+
 
 class AsyncOnspringClient:
     """Async client for interacting with the Onspring API v2."""
 
-    def __init__(self, url: str, key: str):
-        """Initialize the client with a base URL and API key."""
+    def __init__(
+        self,
+        url: str,
+        key: str,
+        *,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        timeout: httpx.Timeout | float | None = DEFAULT_TIMEOUT,
+        http2: bool = False,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        metadata_cache: MetadataCache | None = None,
+        response_cache: ResponseCache | None = None,
+        coalesce_requests: bool = False,
+        parse_mode: ParseMode = ParseMode.Validated,
+        raw_response_mode: RawResponseMode = RawResponseMode.Full,
+        observers: Sequence[RequestObserver] = (),
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """Initialize the client with a base URL, API key and optional connection, retry and caching settings."""
+        if is_raw(parse_mode):
+            raise ValueError("Json and Bytes parse modes can only be passed to individual methods")
+
         self.client = httpx.AsyncClient(
             headers={
                 "x-apikey": key,
                 "x-api-version": API_VERSION,
-            }
+            },
+            limits=limits,
+            timeout=timeout,
+            http2=http2,
+            transport=transport,
         )
         self.base_url = url
+        self.retry_policy = retry_policy
+        self.retry_stats = RetryStats()
+        self.rate_limiter = rate_limiter
+        self.metadata_cache = metadata_cache
+        self.response_cache = response_cache
+        self.parse_mode = parse_mode
+        self.raw_response_mode = raw_response_mode
+        self.observers = tuple(observers)
+        self.coalesce_requests = coalesce_requests
+        self._in_flight: dict[str, asyncio.Future[ApiResponse]] = {}
 
     async def aclose(self) -> None:
         """Close the underlying HTTP client."""
@@ -114,123 +189,425 @@ class AsyncOnspringClient:
         """Exit the async runtime context and close the client."""
         await self.aclose()
 
+    def _finish_response(self, result: ApiResponse[T]) -> ApiResponse[T]:
+        """Record the timing of a handled response and apply the client's raw response mode to it."""
+        result.timing = self._record_timing(result.raw_response)
+
+        return apply_raw_response_mode(result, self.raw_response_mode)
+
+    def _notify_start(self, event: RequestStart) -> None:
+        for observer in self.observers:
+            observer.on_request_start(event)
+
+    def _notify_end(self, timing: RequestTiming) -> None:
+        for observer in self.observers:
+            observer.on_request_end(timing)
+
+    def _record_timing(
+        self, response: httpx.Response | None, error: BaseException | None = None
+    ) -> RequestTiming | None:
+        """Finish the timing of the request that produced ``response`` and notify the observers."""
+        timer = pop_timer(response)
+
+        if timer is None:
+            return None
+
+        timing = timer.finish(response, error=error)
+        self._notify_end(timing)
+
+        return timing
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        *,
+        retryable: bool = False,
+        stream: bool = False,
+        cacheable: bool = False,
+        **kwargs,
+    ) -> httpx.Response:
+        """Send a request, retrying transient failures when the request is retryable.
+
+        When ``stream`` is true the response body is not read, and the caller
+        is responsible for closing the response. When ``cacheable`` is true
+        and a response cache is configured, the response may be served from
+        or revalidated against the cache.
+        """
+        if cacheable and self.response_cache is not None:
+            return await self._send_cached(method, url, retryable=retryable, **kwargs)
+
+        policy = self.retry_policy if retryable else None
+        attempt = 0
+        timer = _RequestTimer(method, url)
+        kwargs["extensions"] = {**kwargs.get("extensions", {}), "trace": timer.atrace}
+        self._notify_start(timer.start)
+
+        while True:
+            if self.rate_limiter is not None:
+                timer.queue_seconds += await self.rate_limiter.acquire_async()
+
+            self.retry_stats.record_attempt()
+            attempt_started = timer.begin_attempt()
+
+            try:
+                if stream:
+                    response = await self.client.send(self.client.build_request(method, url, **kwargs), stream=True)
+                else:
+                    response = await self.client.request(method, url, **kwargs)
+            except httpx.TransportError as error:
+                timer.end_attempt(attempt_started)
+
+                if policy is None or not policy.should_retry_error(error):
+                    self._notify_end(timer.finish(error=error))
+                    raise
+
+                if attempt >= policy.max_retries:
+                    self.retry_stats.record_exhausted()
+                    self._notify_end(timer.finish(error=error))
+                    raise
+
+                reason = type(error).__name__
+                delay = policy.get_delay(attempt)
+            else:
+                timer.end_attempt(attempt_started)
+
+                if policy is None or not policy.should_retry_response(response):
+                    timer.attach(response)
+                    return response
+
+                if attempt >= policy.max_retries:
+                    self.retry_stats.record_exhausted()
+                    timer.attach(response)
+                    return response
+
+                reason = str(response.status_code)
+                delay = policy.get_delay(attempt, response)
+                await response.aclose()
+
+            self.retry_stats.record_retry(reason, delay)
+            await asyncio.sleep(delay)
+            timer.queue_seconds += delay
+            timer.retry_reasons.append(reason)
+            attempt += 1
+
+    async def _get(
+        self,
+        url: str,
+        handler: Callable[[httpx.Response, ParseMode], ApiResponse[T]],
+        params: dict | None = None,
+        parse_mode: ParseMode | None = None,
+        cacheable: bool = False,
+    ) -> ApiResponse[T]:
+        """Send a retryable GET and parse it with ``handler``, defaulting to the client's parse mode.
+
+        When ``coalesce_requests`` is enabled, concurrent calls for the same
+        URL, params and parse mode share a single in-flight request and receive
+        the same ``ApiResponse`` object. Cancelling one caller does not cancel
+        the shared request for the others.
+        """
+        parse_mode = parse_mode or self.parse_mode
+
+        async def _fetch() -> ApiResponse[T]:
+            return self._finish_response(
+                handler(await self._send("GET", url, params=params, retryable=True, cacheable=cacheable), parse_mode)
+            )
+
+        if not self.coalesce_requests:
+            return await _fetch()
+
+        key = f"{parse_mode.name} {httpx.URL(url, params=params)}"
+        future = self._in_flight.get(key)
+
+        if future is None:
+            future = asyncio.ensure_future(_fetch())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        return await asyncio.shield(future)
+
+    async def _send_cached(self, method: str, url: str, *, retryable: bool = False, **kwargs) -> httpx.Response:
+        """Send a request through the response cache, asking the server only whether a stored response changed."""
+        entry, cached = self.response_cache.lookup(self.client.build_request(method, url, **kwargs))
+
+        if cached is not None:
+            return cached
+
+        if entry is not None:
+            kwargs["headers"] = {**kwargs.get("headers", {}), **entry.conditional_headers()}
+
+        return self.response_cache.store(await self._send(method, url, retryable=retryable, **kwargs), entry)
+
     async def can_connect(self) -> bool:
         """Ping the API to check connectivity."""
-        response = await self.client.get(get_ping_endpoint(self.base_url))
+        response = await self._send("GET", get_ping_endpoint(self.base_url), retryable=True)
+        self._record_timing(response)
 
         return response.status_code == 200
 
-    async def get_apps(self, paging_request: PagingRequest | None = None) -> ApiResponse[GetAppsResponse]:
+    async def get_apps(
+        self, paging_request: PagingRequest | None = None, parse_mode: ParseMode | None = None
+    ) -> ApiResponse[GetAppsResponse]:
         """Retrieve all apps the API key has access to."""
         if paging_request is None:
             paging_request = PagingRequest()
 
-        response = await self.client.get(
+        return await self._get(
             get_apps_endpoint(self.base_url),
+            handle_get_apps_response,
             params=paging_request.model_dump(by_alias=True, exclude_none=True),
+            parse_mode=parse_mode,
+            cacheable=True,
         )
 
-        return handle_get_apps_response(response)
+    async def get_all_apps(
+        self, paging_request: PagingRequest | None = None, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> list[ApiResponse[GetAppsResponse]]:
+        """Get every page of apps, fetching pages after the first concurrently."""
+        if paging_request is None:
+            paging_request = PagingRequest()
+
+        return await afetch_all_pages(self.get_apps, paging_request, max_concurrency)
 
-    async def get_app_by_id(self, app_id: int) -> ApiResponse[GetAppByIdResponse]:
+    async def get_app_by_id(self, app_id: int, parse_mode: ParseMode | None = None) -> ApiResponse[GetAppByIdResponse]:
         """Retrieve an app by its ID."""
-        response = await self.client.get(get_app_by_id_endpoint(self.base_url, app_id))
+        parse_mode = parse_mode or self.parse_mode
+        cache = None if is_raw(parse_mode) else self.metadata_cache
+
+        if cache is not None:
+            app = cache.get_app(app_id)
+
+            if app is not None:
+                return ApiResponse(status_code=200, data=GetAppByIdResponse(app=app))
+
+        result = await self._get(
+            get_app_by_id_endpoint(self.base_url, app_id),
+            handle_get_app_by_id_response,
+            parse_mode=parse_mode,
+            cacheable=True,
+        )
 
-        return handle_get_app_by_id_response(response)
+        if cache is not None and result.is_successful:
+            cache.set_app(result.data.app)
 
-    async def get_apps_by_ids(self, app_ids: list[int]) -> ApiResponse[GetAppsByIdsResponse]:
+        return result
+
+    async def get_apps_by_ids(
+        self, app_ids: list[int], parse_mode: ParseMode | None = None
+    ) -> ApiResponse[GetAppsByIdsResponse]:
         """Retrieve multiple apps by their IDs."""
         if not isinstance(app_ids, (list, tuple)):
             return ApiResponse(status_code=400, is_successful=False, message="App ids should be of type list or tuple")
 
-        response = await self.client.post(
+        response = await self._send(
+            "POST",
             get_apps_by_ids_endpoint(self.base_url),
             content=json.dumps(app_ids),
             headers=_JSON_HEADERS,
+            retryable=True,
         )
 
-        return handle_get_apps_by_ids_response(response)
+        return self._finish_response(handle_get_apps_by_ids_response(response, parse_mode or self.parse_mode))
 
-    async def get_field_by_id(self, field_id: int) -> ApiResponse[GetFieldByIdResponse]:
+    async def get_field_by_id(
+        self, field_id: int, parse_mode: ParseMode | None = None
+    ) -> ApiResponse[GetFieldByIdResponse]:
         """Retrieve a field by its ID."""
-        response = await self.client.get(get_field_by_id_endpoint(self.base_url, field_id))
+        parse_mode = parse_mode or self.parse_mode
+        cache = None if is_raw(parse_mode) else self.metadata_cache
+
+        if cache is not None:
+            field = cache.get_field(field_id)
+
+            if field is not None:
+                return ApiResponse(status_code=200, data=GetFieldByIdResponse(field=field))
+
+        result = await self._get(
+            get_field_by_id_endpoint(self.base_url, field_id),
+            handle_get_field_by_id_response,
+            parse_mode=parse_mode,
+            cacheable=True,
+        )
 
-        return handle_get_field_by_id_response(response)
+        if cache is not None and result.is_successful:
+            cache.set_field(result.data.field)
 
-    async def get_fields_by_ids(self, field_ids: list[int]) -> ApiResponse[GetFieldsByIdsResponse]:
+        return result
+
+    async def get_fields_by_ids(
+        self, field_ids: list[int], parse_mode: ParseMode | None = None
+    ) -> ApiResponse[GetFieldsByIdsResponse]:
         """Retrieve multiple fields by their IDs."""
+        parse_mode = parse_mode or self.parse_mode
+        cache = None if is_raw(parse_mode) else self.metadata_cache
+
         if not isinstance(field_ids, (list, tuple)):
             return ApiResponse(
                 status_code=400, is_successful=False, message="Field ids should be of type list or tuple"
             )
 
-        response = await self.client.post(
+        cached_fields = {}
+        missing_ids = list(field_ids)
+
+        if cache is not None:
+            for field_id in field_ids:
+                field = cache.get_field(field_id)
+
+                if field is not None:
+                    cached_fields[field_id] = field
+
+            missing_ids = [field_id for field_id in field_ids if field_id not in cached_fields]
+
+            if not missing_ids:
+                fields = [cached_fields[field_id] for field_id in field_ids]
+                return ApiResponse(status_code=200, data=GetFieldsByIdsResponse(count=len(fields), fields=fields))
+
+        response = await self._send(
+            "POST",
             get_fields_by_ids_endpoint(self.base_url),
-            content=json.dumps(field_ids),
+            content=json.dumps(missing_ids),
             headers=_JSON_HEADERS,
+            retryable=True,
         )
+        result = self._finish_response(handle_get_fields_by_ids_response(response, parse_mode))
+
+        if cache is not None and result.is_successful:
+            for field in result.data.fields:
+                cache.set_field(field)
 
-        return handle_get_fields_by_ids_response(response)
+            if cached_fields:
+                fields_by_id = {**cached_fields, **{field.id: field for field in result.data.fields}}
+                fields = [fields_by_id[field_id] for field_id in field_ids if field_id in fields_by_id]
+                result.data = GetFieldsByIdsResponse(count=len(fields), fields=fields)
+
+        return result
 
     async def get_fields_by_app_id(
-        self, app_id: int, paging_request: PagingRequest | None = None
+        self, app_id: int, paging_request: PagingRequest | None = None, parse_mode: ParseMode | None = None
     ) -> ApiResponse[GetFieldsByAppIdResponse]:
         """Retrieve all fields for a given app."""
+        parse_mode = parse_mode or self.parse_mode
+        cache = None if is_raw(parse_mode) else self.metadata_cache
+
         if paging_request is None:
             paging_request = PagingRequest()
 
-        response = await self.client.get(
+        if cache is not None:
+            page = cache.get_fields_page(app_id, paging_request)
+
+            if page is not None:
+                return ApiResponse(status_code=200, data=page)
+
+        result = await self._get(
             get_fields_by_app_id_endpoint(self.base_url, app_id),
+            handle_get_fields_by_app_id_response,
             params=paging_request.model_dump(by_alias=True, exclude_none=True),
+            parse_mode=parse_mode,
+            cacheable=True,
         )
 
-        return handle_get_fields_by_app_id_response(response)
+        if cache is not None and result.is_successful:
+            cache.set_fields_page(app_id, paging_request, result.data)
+
+        return result
+
+    async def get_all_fields_by_app_id(
+        self, app_id: int, paging_request: PagingRequest | None = None, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> list[ApiResponse[GetFieldsByAppIdResponse]]:
+        """Get every page of fields for an app, fetching pages after the first concurrently."""
+        if paging_request is None:
+            paging_request = PagingRequest()
+
+        return await afetch_all_pages(partial(self.get_fields_by_app_id, app_id), paging_request, max_concurrency)
 
     async def get_file_info_by_id(
-        self, record_id: int, field_id: int, file_id: int
+        self, record_id: int, field_id: int, file_id: int, parse_mode: ParseMode | None = None
     ) -> ApiResponse[GetFileInfoByIdResponse]:
         """Retrieve file metadata for a file attached to a record."""
-        response = await self.client.get(get_file_info_by_id_endpoint(self.base_url, record_id, field_id, file_id))
-
-        return handle_get_file_info_by_id_response(response)
+        return await self._get(
+            get_file_info_by_id_endpoint(self.base_url, record_id, field_id, file_id),
+            handle_get_file_info_by_id_response,
+            parse_mode=parse_mode,
+        )
 
     async def delete_file_by_id(self, record_id: int, field_id: int, file_id: int) -> ApiResponse[None]:
         """Delete a file attached to a record."""
-        response = await self.client.delete(delete_file_by_id_endpoint(self.base_url, record_id, field_id, file_id))
+        response = await self._send("DELETE", delete_file_by_id_endpoint(self.base_url, record_id, field_id, file_id))
 
-        return handle_delete_file_by_id_response(response)
+        return self._finish_response(handle_delete_file_by_id_response(response))
 
     async def get_file_by_id(self, record_id: int, field_id: int, file_id: int) -> ApiResponse[GetFileByIdResponse]:
         """Download a file attached to a record."""
-        response = await self.client.get(get_file_by_id_endpoint(self.base_url, record_id, field_id, file_id))
+        response = await self._send(
+            "GET", get_file_by_id_endpoint(self.base_url, record_id, field_id, file_id), retryable=True
+        )
 
-        return handle_get_file_by_id_response(response)
+        return self._finish_response(handle_get_file_by_id_response(response))
+
+    async def download_file(
+        self,
+        record_id: int,
+        field_id: int,
+        file_id: int,
+        destination: Destination,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> ApiResponse[DownloadFileResponse]:
+        """Stream a file to a path or writable binary stream without loading it into memory."""
+        response = await self._send(
+            "GET",
+            get_file_by_id_endpoint(self.base_url, record_id, field_id, file_id),
+            retryable=True,
+            stream=True,
+        )
 
-    async def save_file(self, save_file_request: SaveFileRequest) -> ApiResponse[SaveFileResponse]:
-        """Upload a file to a record."""
+        try:
+            if response.status_code != 200:
+                await response.aread()
+                return self._finish_response(handle_download_file_response(response))
+
+            bytes_written = await awrite_stream(response.aiter_bytes(chunk_size), destination)
+
+            return self._finish_response(handle_download_file_response(response, bytes_written))
+        except BaseException as error:
+            self._record_timing(response, error)
+            raise
+        finally:
+            await response.aclose()
+
+    async def save_file(
+        self,
+        save_file_request: SaveFileRequest,
+        content: FileContent | None = None,
+        content_length: int | None = None,
+    ) -> ApiResponse[SaveFileResponse]:
+        """Upload a file to a record, streaming its content instead of reading it into memory."""
         endpoint = save_file_endpoint(self.base_url)
 
-        def _read_file() -> bytes:
-            with open(save_file_request.file_path, "rb") as f:
-                return f.read()
-
-        file_content = await asyncio.to_thread(_read_file)
-
-        files = {
-            "File": (
-                save_file_request.file_name,
-                file_content,
-                save_file_request.content_type,
+        if content is None:
+            if save_file_request.file_path is None:
+                raise ValueError("Either save_file_request.file_path or content must be provided")
+
+            content_length = await asyncio.to_thread(os.path.getsize, save_file_request.file_path)
+            chunks = aiter_file(save_file_request.file_path)
+        elif isinstance(content, bytes):
+            content_length = len(content)
+            chunks = aiter_content([content])
+        else:
+            chunks = aiter_content(content)
+
+        encoder = MultipartEncoder(
+            save_file_request.model_dump(
+                by_alias=True, exclude={"file_name", "file_path", "content_type"}, exclude_none=True, mode="json"
             ),
-        }
-
-        data = save_file_request.model_dump(
-            by_alias=True, exclude={"file_name", "file_path", "content_type"}, exclude_none=True
+            "File",
+            save_file_request.file_name,
+            save_file_request.content_type,
+            content_length,
         )
 
-        response = await self.client.post(endpoint, data=data, files=files)
+        response = await self._send("POST", endpoint, content=encoder.aiter_bytes(chunks), headers=encoder.headers)
 
-        return handle_save_file_response(response)
+        return self._finish_response(handle_save_file_response(response, self.parse_mode))
 
     async def add_or_update_list_item(
         self, list_item_request: ListItemRequest
@@ -239,21 +616,24 @@ class AsyncOnspringClient:
         endpoint = add_or_update_list_item_endpoint(self.base_url, list_item_request.list_id)
         payload = list_item_request.model_dump(by_alias=True, exclude={"list_id"}, exclude_none=True, mode="json")
 
-        response = await self.client.put(
+        response = await self._send(
+            "PUT",
             endpoint,
             content=json.dumps(payload),
             headers=_JSON_HEADERS,
         )
 
-        return handle_add_or_update_list_item_response(response)
+        return self._finish_response(handle_add_or_update_list_item_response(response, self.parse_mode))
 
     async def delete_list_item(self, list_id: int, item_id: str) -> ApiResponse[None]:
         """Delete a list item by its ID."""
-        response = await self.client.delete(delete_list_item_endpoint(self.base_url, list_id, item_id))
+        response = await self._send("DELETE", delete_list_item_endpoint(self.base_url, list_id, item_id))
 
-        return handle_delete_list_item_response(response)
+        return self._finish_response(handle_delete_list_item_response(response))
 
-    async def get_records_by_app_id(self, request: GetRecordsByAppRequest) -> ApiResponse[GetRecordsResponse]:
+    async def get_records_by_app_id(
+        self, request: GetRecordsByAppRequest, parse_mode: ParseMode | None = None
+    ) -> ApiResponse[GetRecordsResponse]:
         """Retrieve records from an app with optional filtering and paging."""
         params = request.model_dump(by_alias=True, exclude={"app_id"}, exclude_none=True)
         field_ids = params.pop("fieldIds", None)
@@ -261,14 +641,22 @@ class AsyncOnspringClient:
         if field_ids:
             params["fieldIds"] = ",".join(str(i) for i in field_ids)
 
-        response = await self.client.get(
+        return await self._get(
             get_records_by_app_id_endpoint(self.base_url, request.app_id),
+            handle_get_records_by_app_id_response,
             params=params,
+            parse_mode=parse_mode,
         )
 
-        return handle_get_records_by_app_id_response(response)
+    async def get_all_records_by_app_id(
+        self, request: GetRecordsByAppRequest, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> list[ApiResponse[GetRecordsResponse]]:
+        """Get every page of records for an app, fetching pages after the first concurrently."""
+        return await afetch_all_pages(self.get_records_by_app_id, request, max_concurrency)
 
-    async def get_record_by_id(self, request: GetRecordByIdRequest) -> ApiResponse[Record]:
+    async def get_record_by_id(
+        self, request: GetRecordByIdRequest, parse_mode: ParseMode | None = None
+    ) -> ApiResponse[Record]:
         """Retrieve a single record by its ID."""
         params = request.model_dump(by_alias=True, exclude={"app_id", "record_id"}, exclude_none=True)
         field_ids = params.pop("fieldIds", None)
@@ -276,93 +664,294 @@ class AsyncOnspringClient:
         if field_ids:
             params["fieldIds"] = ",".join(str(i) for i in field_ids)
 
-        response = await self.client.get(
+        return await self._get(
             get_record_by_id_endpoint(self.base_url, request.app_id, request.record_id),
+            handle_get_record_by_id_response,
             params=params,
+            parse_mode=parse_mode,
         )
 
-        return handle_get_record_by_id_response(response)
-
     async def delete_record_by_id(self, app_id: int, record_id: int) -> ApiResponse[None]:
         """Delete a single record by its ID."""
-        response = await self.client.delete(delete_record_by_id_endpoint(self.base_url, app_id, record_id))
-
-        return handle_delete_record_by_id_response(response)
-
-    async def get_records_by_ids(self, request: GetBatchRecordsRequest) -> ApiResponse[GetBatchRecordsResponse]:
-        """Retrieve multiple records by their IDs."""
-        response = await self.client.post(
+        response = await self._send("DELETE", delete_record_by_id_endpoint(self.base_url, app_id, record_id))
+
+        return self._finish_response(handle_delete_record_by_id_response(response))
+
+    async def get_records_by_ids(
+        self,
+        request: GetBatchRecordsRequest,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        parse_mode: ParseMode | None = None,
+    ) -> ApiResponse[GetBatchRecordsResponse]:
+        """Get multiple records by their IDs, splitting long ID lists into concurrent chunks."""
+        parse_mode = parse_mode or self.parse_mode
+        requests = chunk_request(request, batch_size)
+
+        if len(requests) > 1 and parse_mode is ParseMode.Bytes:
+            raise ValueError("Bytes results cannot be merged across chunks; use a batch_size covering every ID")
+
+        fetch = partial(self._get_records_by_ids_chunk, parse_mode=parse_mode)
+
+        return merge_batch_records(await afetch_chunks(fetch, requests, max_concurrency))
+
+    async def _get_records_by_ids_chunk(
+        self, request: GetBatchRecordsRequest, parse_mode: ParseMode | None = None
+    ) -> ApiResponse[GetBatchRecordsResponse]:
+        """Get a single chunk of records by their IDs."""
+        response = await self._send(
+            "POST",
             get_records_by_ids_endpoint(self.base_url),
             content=json.dumps(request.model_dump(by_alias=True, exclude_none=True, mode="json")),
             headers=_JSON_HEADERS,
+            retryable=True,
         )
 
-        return handle_get_records_by_ids_response(response)
+        return self._finish_response(handle_get_records_by_ids_response(response, parse_mode or self.parse_mode))
 
-    async def query_records(self, request: QueryRecordsRequest) -> ApiResponse[GetRecordsResponse]:
+    async def query_records(
+        self, request: QueryRecordsRequest, parse_mode: ParseMode | None = None
+    ) -> ApiResponse[GetRecordsResponse]:
         """Query records using a structured query."""
         exclude = {"page_number", "page_size"}
         payload = request.model_dump(by_alias=True, exclude=exclude, exclude_none=True, mode="json")
         params = {"pageNumber": request.page_number, "pageSize": request.page_size}
 
-        response = await self.client.post(
+        response = await self._send(
+            "POST",
             query_records_endpoint(self.base_url),
             content=json.dumps(payload),
             params=params,
             headers=_JSON_HEADERS,
+            retryable=True,
         )
 
-        return handle_query_records_response(response)
+        return self._finish_response(handle_query_records_response(response, parse_mode or self.parse_mode))
+
+    async def query_all_records(
+        self, request: QueryRecordsRequest, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> list[ApiResponse[GetRecordsResponse]]:
+        """Get every page of records matching a query, fetching pages after the first concurrently."""
+        return await afetch_all_pages(self.query_records, request, max_concurrency)
+
+    async def iter_records_by_app_id(
+        self, request: GetRecordsByAppRequest, prefetch: int = DEFAULT_PREFETCH
+    ) -> AsyncIterator[Record]:
+        """Iterate over every record in an app, prefetching upcoming pages concurrently."""
+        async for page in aiter_pages(self.get_records_by_app_id, request, prefetch):
+            for record in page.records:
+                yield record
+
+    async def iter_query_records(
+        self, request: QueryRecordsRequest, prefetch: int = DEFAULT_PREFETCH
+    ) -> AsyncIterator[Record]:
+        """Iterate over every record matching a query, prefetching upcoming pages concurrently."""
+        async for page in aiter_pages(self.query_records, request, prefetch):
+            for record in page.records:
+                yield record
+
+    async def get_records_table_by_app_id(
+        self, request: GetRecordsByAppRequest, prefetch: int = DEFAULT_PREFETCH
+    ) -> RecordTable:
+        """Collect every record in an app, starting at the request's page, into a ``RecordTable``."""
+        fetch = partial(self.get_records_by_app_id, parse_mode=ParseMode.Lazy)
+        table = RecordTable()
+
+        async for page in aiter_pages(fetch, request, prefetch):
+            table.extend(page.records)
+
+        return table
+
+    async def query_records_table(self, request: QueryRecordsRequest, prefetch: int = DEFAULT_PREFETCH) -> RecordTable:
+        """Collect every record matching a query, starting at the request's page, into a ``RecordTable``."""
+        fetch = partial(self.query_records, parse_mode=ParseMode.Lazy)
+        table = RecordTable()
+
+        async for page in aiter_pages(fetch, request, prefetch):
+            table.extend(page.records)
+
+        return table
+
+    async def export_records(
+        self,
+        app_id: int,
+        destination: TextDestination,
+        format: ExportFormat = ExportFormat.JsonLines,
+        field_ids: Sequence[int] | None = None,
+        data_format: DataFormat = DataFormat.Raw,
+        filter: str | None = None,
+        page_size: int = DEFAULT_EXPORT_PAGE_SIZE,
+        prefetch: int = DEFAULT_PREFETCH,
+        progress: ExportProgress | None = None,
+    ) -> int:
+        """Write every record in an app to a CSV or JSON Lines file and return the number written."""
+        columns = list(field_ids) if field_ids else await self._get_field_ids(app_id)
+        options = {
+            "app_id": app_id,
+            "field_ids": field_ids or [],
+            "data_format": data_format.name,
+            "page_size": page_size,
+        }
+
+        if filter is None:
+            request = GetRecordsByAppRequest(**options)
+            fetch = partial(self.get_records_by_app_id, parse_mode=ParseMode.Lazy)
+        else:
+            request = QueryRecordsRequest(**options, filter=filter)
+            fetch = partial(self.query_records, parse_mode=ParseMode.Lazy)
+
+        written = 0
+
+        with open_writer(destination, record_columns(columns), format) as write:
+            async for page in aiter_pages(fetch, request, prefetch):
+                written += await asyncio.to_thread(write, list(record_rows(page.records, columns)))
+
+                if progress is not None:
+                    progress(written, page.total_records)
+
+        return written
+
+    async def iter_changed_records(
+        self,
+        app_id: int,
+        modified_field_id: int,
+        checkpoints: CheckpointStore,
+        field_ids: Sequence[int] | None = None,
+        filter: str | None = None,
+        overlap: timedelta = DEFAULT_OVERLAP,
+        page_size: int = DEFAULT_CHANGES_PAGE_SIZE,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> AsyncIterator[Record]:
+        """Iterate over the records in an app that changed since its checkpoint, then save a new one."""
+        scan = ChangeScan(modified_field_id, checkpoints.load(app_id), overlap)
+        fetch, request = self._changed_records_request(app_id, scan, field_ids, filter, page_size)
+
+        async for page in aiter_pages(fetch, request, prefetch):
+            for record in page.records:
+                if scan.accept(record):
+                    yield record
+
+        checkpoint = scan.checkpoint()
+
+        if checkpoint is not None:
+            checkpoints.save(app_id, checkpoint)
+
+    def _changed_records_request(
+        self, app_id: int, scan: ChangeScan, field_ids: Sequence[int] | None, filter: str | None, page_size: int
+    ) -> tuple[Callable, GetRecordsByAppRequest | QueryRecordsRequest]:
+        if field_ids and scan.modified_field_id not in field_ids:
+            field_ids = [*field_ids, scan.modified_field_id]
+
+        options = {"app_id": app_id, "field_ids": list(field_ids or []), "page_size": page_size}
+        query = scan.filter(filter)
+
+        if query is None:
+            return self.get_records_by_app_id, GetRecordsByAppRequest(**options)
+
+        return self.query_records, QueryRecordsRequest(**options, filter=query)
+
+    async def _get_field_ids(self, app_id: int) -> list[int]:
+        field_ids = []
+
+        for response in await self.get_all_fields_by_app_id(app_id):
+            response.raise_for_status()
+            field_ids.extend(field.id for field in response.data.fields)
+
+        return field_ids
 
     async def add_or_update_record(self, record: Record) -> ApiResponse[AddOrUpdateRecordResponse]:
         """Add or update a record."""
-        fields_dict = {}
-
-        for field in record.fields:
-            fields_dict[field.field_id] = field.value
+        fields_dict = {field_id: field.value for field_id, field in record.field_map.items()}
 
         payload = record.model_dump(by_alias=True, exclude={"fields"}, exclude_none=True, mode="json")
         payload["fields"] = fields_dict
 
-        response = await self.client.put(
+        response = await self._send(
+            "PUT",
             add_or_update_record_endpoint(self.base_url),
             content=json.dumps(payload, default=str),
             headers=_JSON_HEADERS,
         )
 
-        return handle_add_or_update_record_response(response)
-
-    async def delete_records_by_ids(self, request: DeleteBatchRecordsRequest) -> ApiResponse[None]:
-        """Delete multiple records by their IDs."""
-        response = await self.client.post(
+        return self._finish_response(handle_add_or_update_record_response(response, self.parse_mode))
+
+    async def add_or_update_records(
+        self, records: Iterable[Record] | AsyncIterable[Record], max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> list[ApiResponse[AddOrUpdateRecordResponse] | Exception]:
+        """Add or update many records with up to ``max_concurrency`` requests in flight."""
+        return await amap_bounded(self.add_or_update_record, records, max_concurrency)
+
+    async def delete_records_by_ids(
+        self,
+        request: DeleteBatchRecordsRequest,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> ApiResponse[DeleteBatchRecordsReport]:
+        """Delete multiple records by their IDs, splitting long ID lists into concurrent chunks."""
+        requests = chunk_request(request, batch_size)
+        responses = await afetch_chunks(self._delete_records_by_ids_chunk, requests, max_concurrency)
+
+        return build_delete_report(requests, responses)
+
+    async def _delete_records_by_ids_chunk(self, request: DeleteBatchRecordsRequest) -> ApiResponse[None]:
+        """Delete a single chunk of records by their IDs."""
+        response = await self._send(
+            "POST",
             delete_records_by_ids_endpoint(self.base_url),
             content=json.dumps(request.model_dump(by_alias=True, exclude_none=True, mode="json")),
             headers=_JSON_HEADERS,
         )
 
-        return handle_delete_records_by_ids_response(response)
+        return self._finish_response(handle_delete_records_by_ids_response(response))
 
-    async def get_report_by_id(self, request: GetReportByIdRequest) -> ApiResponse[GetReportByIdResponse]:
+    async def get_report_by_id(
+        self, request: GetReportByIdRequest, parse_mode: ParseMode | None = None
+    ) -> ApiResponse[GetReportByIdResponse]:
         """Retrieve a report by its ID."""
         params = request.model_dump(by_alias=True, exclude={"report_id"}, exclude_none=True)
 
-        response = await self.client.get(
+        return await self._get(
             get_report_by_id_endpoint(self.base_url, request.report_id),
+            handle_get_report_by_id_response,
             params=params,
+            parse_mode=parse_mode,
+            cacheable=True,
         )
 
-        return handle_get_report_by_id_response(response)
-
     async def get_reports_by_app_id(
-        self, app_id: int, paging_request: PagingRequest | None = None
+        self, app_id: int, paging_request: PagingRequest | None = None, parse_mode: ParseMode | None = None
     ) -> ApiResponse[GetReportsByAppIdResponse]:
         """Retrieve all reports for a given app."""
+        parse_mode = parse_mode or self.parse_mode
+        cache = None if is_raw(parse_mode) else self.metadata_cache
+
         if paging_request is None:
             paging_request = PagingRequest()
 
-        response = await self.client.get(
+        if cache is not None:
+            page = cache.get_reports_page(app_id, paging_request)
+
+            if page is not None:
+                return ApiResponse(status_code=200, data=page)
+
+        result = await self._get(
             get_reports_by_app_id_endpoint(self.base_url, app_id),
+            handle_get_reports_by_app_id_response,
             params=paging_request.model_dump(by_alias=True, exclude_none=True),
+            parse_mode=parse_mode,
+            cacheable=True,
         )
 
-        return handle_get_reports_by_app_id_response(response)
+        if cache is not None and result.is_successful:
+            cache.set_reports_page(app_id, paging_request, result.data)
+
+        return result
+
+    async def get_all_reports_by_app_id(
+        self, app_id: int, paging_request: PagingRequest | None = None, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> list[ApiResponse[GetReportsByAppIdResponse]]:
+        """Get every page of reports for an app, fetching pages after the first concurrently."""
+        if paging_request is None:
+            paging_request = PagingRequest()
+
+        return await afetch_all_pages(partial(self.get_reports_by_app_id, app_id), paging_request, max_concurrency)
@@ -0,0 +1,244 @@
+"""In-memory metadata cache for apps, fields and reports."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from contextvars import ContextVar
+from functools import partial
+from typing import Any
+
+from onspring_api_sdk.models import (
+    App,
+    GetFieldsByAppIdResponse,
+    GetReportsByAppIdResponse,
+    OnspringField,
+    PagingRequest,
+)
+
+DEFAULT_TTL = 300.0
+DEFAULT_MAX_ENTRIES = 1024
+
+# Key being fetched again by ``revalidate`` in the current thread or task, which must skip the stale entry.
+_REFRESHING: ContextVar[Hashable | None] = ContextVar("onspring_refreshing_key", default=None)
+
+
+class MetadataCache:
+    """Thread-safe TTL cache with least-recently-used eviction for rarely changing metadata.
+
+    Apps and fields are keyed by ID and pages of fields or reports by app ID
+    and paging parameters. Fields fetched as part of a page or batch are also
+    cached individually. Entries expire ``ttl`` seconds after they are stored,
+    and the least recently used entry is evicted once ``max_entries`` is exceeded.
+    Expired entries are still served for a further ``stale_ttl`` seconds,
+    counted in ``stale_hits``, until ``revalidate`` fetches them again.
+    Stale hits never trigger a refresh on their own.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES, stale_ttl: float = 0.0):
+        """Create a cache whose entries live for ``ttl`` seconds, holding at most ``max_entries``."""
+        if ttl <= 0:
+            raise ValueError("ttl must be greater than 0")
+
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        if stale_ttl < 0:
+            raise ValueError("stale_ttl must not be negative")
+
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.stale_ttl = stale_ttl
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of entries currently stored, including expired ones not yet purged."""
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value for ``key``, or ``None`` if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key) if key != _REFRESHING.get() else None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            now = time.monotonic()
+
+            if expires_at <= now:
+                if expires_at + self.stale_ttl <= now:
+                    self._delete(key)
+                    self.misses += 1
+                    return None
+
+                self.stale_hits += 1
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting the least recently used entries if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove a single entry if present."""
+        with self._lock:
+            self._delete(key)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_app(self, app_id: int) -> App | None:
+        """Return a cached app."""
+        return self.get(("app", app_id))
+
+    def set_app(self, app: App) -> None:
+        """Cache an app."""
+        self.set(("app", app.id), app)
+
+    def get_field(self, field_id: int) -> OnspringField | None:
+        """Return a cached field."""
+        return self.get(("field", field_id))
+
+    def set_field(self, field: OnspringField) -> None:
+        """Cache a field."""
+        self.set(("field", field.id), field)
+
+    def get_fields_page(self, app_id: int, paging_request: PagingRequest) -> GetFieldsByAppIdResponse | None:
+        """Return a cached page of fields for an app."""
+        return self.get(("fields_by_app", app_id, paging_request.page_number, paging_request.page_size))
+
+    def set_fields_page(self, app_id: int, paging_request: PagingRequest, page: GetFieldsByAppIdResponse) -> None:
+        """Cache a page of fields for an app along with each field on it."""
+        self.set(("fields_by_app", app_id, paging_request.page_number, paging_request.page_size), page)
+
+        for field in page.fields:
+            self.set_field(field)
+
+    def get_reports_page(self, app_id: int, paging_request: PagingRequest) -> GetReportsByAppIdResponse | None:
+        """Return a cached page of reports for an app."""
+        return self.get(("reports_by_app", app_id, paging_request.page_number, paging_request.page_size))
+
+    def set_reports_page(self, app_id: int, paging_request: PagingRequest, page: GetReportsByAppIdResponse) -> None:
+        """Cache a page of reports for an app."""
+        self.set(("reports_by_app", app_id, paging_request.page_number, paging_request.page_size), page)
+
+    def invalidate_app(self, app_id: int) -> None:
+        """Remove an app along with its cached fields and field and report pages."""
+        with self._lock:
+            for key, (_, value) in list(self._entries.items()):
+                kind = key[0] if isinstance(key, tuple) else None
+
+                if (kind in ("app", "fields_by_app", "reports_by_app") and key[1] == app_id) or (
+                    kind == "field" and value.app_id == app_id
+                ):
+                    self._delete(key)
+
+    def invalidate_field(self, field_id: int) -> None:
+        """Remove a field and any cached page of fields containing it."""
+        with self._lock:
+            for key, (_, value) in list(self._entries.items()):
+                kind = key[0] if isinstance(key, tuple) else None
+
+                if (kind == "field" and key[1] == field_id) or (
+                    kind == "fields_by_app" and any(field.id == field_id for field in value.fields)
+                ):
+                    self._delete(key)
+
+    def revalidate(self, client: Any) -> int:
+        """Fetch every expired app, field and page again with ``client`` and return how many were refreshed.
+
+        ``client`` must be an ``OnspringClient`` using this cache. Stale
+        entries keep being served to other threads while they are fetched.
+        Entries that now return 404 are removed, and entries that fail for
+        any other reason keep being served until their ``stale_ttl`` runs
+        out. Run this on a background thread to refresh stale metadata
+        without blocking.
+        """
+        refreshed = 0
+
+        for key, fetch in self._expired(client):
+            token = _REFRESHING.set(key)
+
+            try:
+                response = fetch()
+            finally:
+                _REFRESHING.reset(token)
+
+            refreshed += self._settle(key, response)
+
+        return refreshed
+
+    async def arevalidate(self, client: Any) -> int:
+        """Fetch every expired app, field and page again with an ``AsyncOnspringClient`` using this cache.
+
+        See ``revalidate``.
+        """
+        refreshed = 0
+
+        for key, fetch in self._expired(client):
+            token = _REFRESHING.set(key)
+
+            try:
+                response = await fetch()
+            finally:
+                _REFRESHING.reset(token)
+
+            refreshed += self._settle(key, response)
+
+        return refreshed
+
+    def _delete(self, key: Hashable) -> None:
+        """Remove an entry; called with the lock held."""
+        self._entries.pop(key, None)
+
+    def _expired(self, client: Any) -> list[tuple[Hashable, Callable[[], Any]]]:
+        if client.metadata_cache is not self:
+            raise ValueError("client must use this cache as its metadata_cache")
+
+        now = time.monotonic()
+
+        with self._lock:
+            keys = [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]
+
+        return [(key, fetch) for key in keys if (fetch := _refetch(client, key)) is not None]
+
+    def _settle(self, key: Hashable, response: Any) -> bool:
+        if response.status_code == 404:
+            with self._lock:
+                self._delete(key)
+
+        return response.is_successful
+
+
+def _refetch(client: Any, key: Hashable) -> Callable[[], Any] | None:
+    """Return a call that fetches a cache entry again through ``client``, or ``None`` for unknown keys."""
+    kind = key[0] if isinstance(key, tuple) else None
+
+    if kind == "app":
+        return partial(client.get_app_by_id, key[1])
+
+    if kind == "field":
+        return partial(client.get_field_by_id, key[1])
+
+    if kind in ("fields_by_app", "reports_by_app"):
+        method = client.get_fields_by_app_id if kind == "fields_by_app" else client.get_reports_by_app_id
+        return partial(method, key[1], PagingRequest(page_number=key[2], page_size=key[3]))
+
+    return None
@@ -1,19 +1,35 @@
 """Sync HTTP client for the Onspring API v2."""
 
 import json
-from collections.abc import Mapping
+import os
+import time
+from collections.abc import AsyncIterable, Callable, Iterable, Iterator, Mapping, Sequence
+from datetime import timedelta
+from functools import partial
 from types import MappingProxyType
-from typing import Final
+from typing import Final, TypeVar
 
 import httpx
 
+from onspring_api_sdk._batching import (
+    build_delete_report,
+    chunk_request,
+    fetch_chunks,
+    map_bounded,
+    merge_batch_records,
+)
+from onspring_api_sdk._download import DEFAULT_CHUNK_SIZE, Destination, write_stream
+from onspring_api_sdk._multipart import MultipartEncoder, iter_file
+from onspring_api_sdk._pagination import fetch_all_pages, iter_pages
 from onspring_api_sdk._responses import (
+    apply_raw_response_mode,
     handle_add_or_update_list_item_response,
     handle_add_or_update_record_response,
     handle_delete_file_by_id_response,
     handle_delete_list_item_response,
     handle_delete_record_by_id_response,
     handle_delete_records_by_ids_response,
+    handle_download_file_response,
     handle_get_app_by_id_response,
     handle_get_apps_by_ids_response,
     handle_get_apps_response,
@@ -29,7 +45,9 @@ from onspring_api_sdk._responses import (
     handle_get_reports_by_app_id_response,
     handle_query_records_response,
     handle_save_file_response,
+    is_raw,
 )
+from onspring_api_sdk.cache import MetadataCache
 from onspring_api_sdk.endpoints import (
     add_or_update_list_item_endpoint,
     add_or_update_record_endpoint,
@@ -54,11 +72,25 @@ from onspring_api_sdk.endpoints import (
     query_records_endpoint,
     save_file_endpoint,
 )
+from onspring_api_sdk.enums import DataFormat, ExportFormat, ParseMode, RawResponseMode
+from onspring_api_sdk.export import (
+    DEFAULT_EXPORT_PAGE_SIZE,
+    ExportProgress,
+    TextDestination,
+    open_writer,
+    record_columns,
+    record_rows,
+)
+from onspring_api_sdk.http_cache import ResponseCache
+from onspring_api_sdk.incremental import DEFAULT_CHANGES_PAGE_SIZE, DEFAULT_OVERLAP, ChangeScan, CheckpointStore
+from onspring_api_sdk.instrumentation import RequestObserver, RequestStart, RequestTiming, _RequestTimer, pop_timer
 from onspring_api_sdk.models import (
     AddOrUpdateListItemResponse,
     AddOrUpdateRecordResponse,
     ApiResponse,
+    DeleteBatchRecordsReport,
     DeleteBatchRecordsRequest,
+    DownloadFileResponse,
     GetAppByIdResponse,
     GetAppsByIdsResponse,
     GetAppsResponse,
@@ -82,24 +114,65 @@ from onspring_api_sdk.models import (
     SaveFileRequest,
     SaveFileResponse,
 )
+from onspring_api_sdk.rate_limit import RateLimiter
+from onspring_api_sdk.retry import RetryPolicy, RetryStats
+from onspring_api_sdk.table import RecordTable
 
 API_VERSION = "2"
 CONTENT_TYPE_JSON = "application/json"
+DEFAULT_PREFETCH = 2
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_LIMITS: Final = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=5.0)
+DEFAULT_TIMEOUT: Final = httpx.Timeout(5.0)
 _JSON_HEADERS: Final[Mapping[str, str]] = MappingProxyType({"Content-Type": CONTENT_TYPE_JSON})
 
+T = TypeVar("T")
+
 
 class OnspringClient:
     """Sync client for interacting with the Onspring API v2."""
 
-    def __init__(self, url: str, key: str):
-        """Initialize the client with a base URL and API key."""
+    def __init__(
+        self,
+        url: str,
+        key: str,
+        *,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        timeout: httpx.Timeout | float | None = DEFAULT_TIMEOUT,
+        http2: bool = False,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        metadata_cache: MetadataCache | None = None,
+        response_cache: ResponseCache | None = None,
+        parse_mode: ParseMode = ParseMode.Validated,
+        raw_response_mode: RawResponseMode = RawResponseMode.Full,
+        observers: Sequence[RequestObserver] = (),
+        transport: httpx.BaseTransport | None = None,
+    ):
+        """Initialize the client with a base URL, API key and optional connection, retry and caching settings."""
+        if is_raw(parse_mode):
+            raise ValueError("Json and Bytes parse modes can only be passed to individual methods")
+
         self.client = httpx.Client(
             headers={
                 "x-apikey": key,
                 "x-api-version": API_VERSION,
-            }
+            },
+            limits=limits,
+            timeout=timeout,
+            http2=http2,
+            transport=transport,
         )
         self.base_url = url
+        self.retry_policy = retry_policy
+        self.retry_stats = RetryStats()
+        self.rate_limiter = rate_limiter
+        self.metadata_cache = metadata_cache
+        self.response_cache = response_cache
+        self.parse_mode = parse_mode
+        self.raw_response_mode = raw_response_mode
+        self.observers = tuple(observers)
 
     def close(self) -> None:
         """Close the underlying HTTP client."""
@@ -113,153 +186,433 @@ class OnspringClient:
         """Exit the runtime context and close the client."""
         self.close()
 
+    def _finish_response(self, result: ApiResponse[T]) -> ApiResponse[T]:
+        """Record the timing of a handled response and apply the client's raw response mode to it."""
+        result.timing = self._record_timing(result.raw_response)
+
+        return apply_raw_response_mode(result, self.raw_response_mode)
+
+    def _notify_start(self, event: RequestStart) -> None:
+        for observer in self.observers:
+            observer.on_request_start(event)
+
+    def _notify_end(self, timing: RequestTiming) -> None:
+        for observer in self.observers:
+            observer.on_request_end(timing)
+
+    def _record_timing(
+        self, response: httpx.Response | None, error: BaseException | None = None
+    ) -> RequestTiming | None:
+        """Finish the timing of the request that produced ``response`` and notify the observers."""
+        timer = pop_timer(response)
+
+        if timer is None:
+            return None
+
+        timing = timer.finish(response, error=error)
+        self._notify_end(timing)
+
+        return timing
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        *,
+        retryable: bool = False,
+        stream: bool = False,
+        cacheable: bool = False,
+        **kwargs,
+    ) -> httpx.Response:
+        """Send a request, retrying transient failures when the request is retryable.
+
+        When ``stream`` is true the response body is not read, and the caller
+        is responsible for closing the response. When ``cacheable`` is true
+        and a response cache is configured, the response may be served from
+        or revalidated against the cache.
+        """
+        if cacheable and self.response_cache is not None:
+            return self._send_cached(method, url, retryable=retryable, **kwargs)
+
+        policy = self.retry_policy if retryable else None
+        attempt = 0
+        timer = _RequestTimer(method, url)
+        kwargs["extensions"] = {**kwargs.get("extensions", {}), "trace": timer.trace}
+        self._notify_start(timer.start)
+
+        while True:
+            if self.rate_limiter is not None:
+                timer.queue_seconds += self.rate_limiter.acquire()
+
+            self.retry_stats.record_attempt()
+            attempt_started = timer.begin_attempt()
+
+            try:
+                if stream:
+                    response = self.client.send(self.client.build_request(method, url, **kwargs), stream=True)
+                else:
+                    response = self.client.request(method, url, **kwargs)
+            except httpx.TransportError as error:
+                timer.end_attempt(attempt_started)
+
+                if policy is None or not policy.should_retry_error(error):
+                    self._notify_end(timer.finish(error=error))
+                    raise
+
+                if attempt >= policy.max_retries:
+                    self.retry_stats.record_exhausted()
+                    self._notify_end(timer.finish(error=error))
+                    raise
+
+                reason = type(error).__name__
+                delay = policy.get_delay(attempt)
+            else:
+                timer.end_attempt(attempt_started)
+
+                if policy is None or not policy.should_retry_response(response):
+                    timer.attach(response)
+                    return response
+
+                if attempt >= policy.max_retries:
+                    self.retry_stats.record_exhausted()
+                    timer.attach(response)
+                    return response
+
+                reason = str(response.status_code)
+                delay = policy.get_delay(attempt, response)
+                response.close()
+
+            self.retry_stats.record_retry(reason, delay)
+            time.sleep(delay)
+            timer.queue_seconds += delay
+            timer.retry_reasons.append(reason)
+            attempt += 1
+
+    def _send_cached(self, method: str, url: str, *, retryable: bool = False, **kwargs) -> httpx.Response:
+        """Send a request through the response cache, asking the server only whether a stored response changed."""
+        entry, cached = self.response_cache.lookup(self.client.build_request(method, url, **kwargs))
+
+        if cached is not None:
+            return cached
+
+        if entry is not None:
+            kwargs["headers"] = {**kwargs.get("headers", {}), **entry.conditional_headers()}
+
+        return self.response_cache.store(self._send(method, url, retryable=retryable, **kwargs), entry)
+
     def can_connect(self) -> bool:
         """Ping the API to check connectivity."""
-        response = self.client.get(get_ping_endpoint(self.base_url))
+        response = self._send("GET", get_ping_endpoint(self.base_url), retryable=True)
+        self._record_timing(response)
 
         return response.status_code == 200
 
-    def get_apps(self, paging_request: PagingRequest | None = None) -> ApiResponse[GetAppsResponse]:
+    def get_apps(
+        self, paging_request: PagingRequest | None = None, parse_mode: ParseMode | None = None
+    ) -> ApiResponse[GetAppsResponse]:
         """Get all apps with optional paging."""
         if paging_request is None:
             paging_request = PagingRequest()
 
-        response = self.client.get(
+        response = self._send(
+            "GET",
             get_apps_endpoint(self.base_url),
             params=paging_request.model_dump(by_alias=True, exclude_none=True),
+            retryable=True,
+            cacheable=True,
         )
 
-        return handle_get_apps_response(response)
+        return self._finish_response(handle_get_apps_response(response, parse_mode or self.parse_mode))
+
+    def get_all_apps(
+        self, paging_request: PagingRequest | None = None, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> list[ApiResponse[GetAppsResponse]]:
+        """Get every page of apps, fetching pages after the first on a thread pool."""
+        if paging_request is None:
+            paging_request = PagingRequest()
+
+        return fetch_all_pages(self.get_apps, paging_request, max_concurrency)
 
-    def get_app_by_id(self, app_id: int) -> ApiResponse[GetAppByIdResponse]:
+    def get_app_by_id(self, app_id: int, parse_mode: ParseMode | None = None) -> ApiResponse[GetAppByIdResponse]:
         """Get an app by its ID."""
-        response = self.client.get(get_app_by_id_endpoint(self.base_url, app_id))
+        parse_mode = parse_mode or self.parse_mode
+        cache = None if is_raw(parse_mode) else self.metadata_cache
 
-        return handle_get_app_by_id_response(response)
+        if cache is not None:
+            app = cache.get_app(app_id)
 
-    def get_apps_by_ids(self, app_ids: list[int]) -> ApiResponse[GetAppsByIdsResponse]:
+            if app is not None:
+                return ApiResponse(status_code=200, data=GetAppByIdResponse(app=app))
+
+        response = self._send("GET", get_app_by_id_endpoint(self.base_url, app_id), retryable=True, cacheable=True)
+        result = self._finish_response(handle_get_app_by_id_response(response, parse_mode))
+
+        if cache is not None and result.is_successful:
+            cache.set_app(result.data.app)
+
+        return result
+
+    def get_apps_by_ids(
+        self, app_ids: list[int], parse_mode: ParseMode | None = None
+    ) -> ApiResponse[GetAppsByIdsResponse]:
         """Get multiple apps by their IDs."""
         if not isinstance(app_ids, (list, tuple)):
             return ApiResponse(status_code=400, is_successful=False, message="App ids should be of type list or tuple")
 
-        response = self.client.post(
+        response = self._send(
+            "POST",
             get_apps_by_ids_endpoint(self.base_url),
             content=json.dumps(app_ids),
             headers=_JSON_HEADERS,
+            retryable=True,
         )
 
-        return handle_get_apps_by_ids_response(response)
+        return self._finish_response(handle_get_apps_by_ids_response(response, parse_mode or self.parse_mode))
 
-    def get_field_by_id(self, field_id: int) -> ApiResponse[GetFieldByIdResponse]:
+    def get_field_by_id(self, field_id: int, parse_mode: ParseMode | None = None) -> ApiResponse[GetFieldByIdResponse]:
         """Get a field by its ID."""
-        response = self.client.get(get_field_by_id_endpoint(self.base_url, field_id))
+        parse_mode = parse_mode or self.parse_mode
+        cache = None if is_raw(parse_mode) else self.metadata_cache
+
+        if cache is not None:
+            field = cache.get_field(field_id)
 
-        return handle_get_field_by_id_response(response)
+            if field is not None:
+                return ApiResponse(status_code=200, data=GetFieldByIdResponse(field=field))
 
-    def get_fields_by_ids(self, field_ids: list[int]) -> ApiResponse[GetFieldsByIdsResponse]:
+        response = self._send("GET", get_field_by_id_endpoint(self.base_url, field_id), retryable=True, cacheable=True)
+        result = self._finish_response(handle_get_field_by_id_response(response, parse_mode))
+
+        if cache is not None and result.is_successful:
+            cache.set_field(result.data.field)
+
+        return result
+
+    def get_fields_by_ids(
+        self, field_ids: list[int], parse_mode: ParseMode | None = None
+    ) -> ApiResponse[GetFieldsByIdsResponse]:
         """Get multiple fields by their IDs."""
+        parse_mode = parse_mode or self.parse_mode
+        cache = None if is_raw(parse_mode) else self.metadata_cache
+
         if not isinstance(field_ids, (list, tuple)):
             return ApiResponse(
                 status_code=400, is_successful=False, message="Field ids should be of type list or tuple"
             )
 
-        response = self.client.post(
+        cached_fields = {}
+        missing_ids = list(field_ids)
+
+        if cache is not None:
+            for field_id in field_ids:
+                field = cache.get_field(field_id)
+
+                if field is not None:
+                    cached_fields[field_id] = field
+
+            missing_ids = [field_id for field_id in field_ids if field_id not in cached_fields]
+
+            if not missing_ids:
+                fields = [cached_fields[field_id] for field_id in field_ids]
+                return ApiResponse(status_code=200, data=GetFieldsByIdsResponse(count=len(fields), fields=fields))
+
+        response = self._send(
+            "POST",
             get_fields_by_ids_endpoint(self.base_url),
-            content=json.dumps(field_ids),
+            content=json.dumps(missing_ids),
             headers=_JSON_HEADERS,
+            retryable=True,
         )
+        result = self._finish_response(handle_get_fields_by_ids_response(response, parse_mode))
 
-        return handle_get_fields_by_ids_response(response)
+        if cache is not None and result.is_successful:
+            for field in result.data.fields:
+                cache.set_field(field)
+
+            if cached_fields:
+                fields_by_id = {**cached_fields, **{field.id: field for field in result.data.fields}}
+                fields = [fields_by_id[field_id] for field_id in field_ids if field_id in fields_by_id]
+                result.data = GetFieldsByIdsResponse(count=len(fields), fields=fields)
+
+        return result
 
     def get_fields_by_app_id(
-        self, app_id: int, paging_request: PagingRequest | None = None
+        self, app_id: int, paging_request: PagingRequest | None = None, parse_mode: ParseMode | None = None
     ) -> ApiResponse[GetFieldsByAppIdResponse]:
         """Get all fields for an app with optional paging."""
+        parse_mode = parse_mode or self.parse_mode
+        cache = None if is_raw(parse_mode) else self.metadata_cache
+
         if paging_request is None:
             paging_request = PagingRequest()
 
-        response = self.client.get(
+        if cache is not None:
+            page = cache.get_fields_page(app_id, paging_request)
+
+            if page is not None:
+                return ApiResponse(status_code=200, data=page)
+
+        response = self._send(
+            "GET",
             get_fields_by_app_id_endpoint(self.base_url, app_id),
             params=paging_request.model_dump(by_alias=True, exclude_none=True),
+            retryable=True,
+            cacheable=True,
         )
+        result = self._finish_response(handle_get_fields_by_app_id_response(response, parse_mode))
+
+        if cache is not None and result.is_successful:
+            cache.set_fields_page(app_id, paging_request, result.data)
+
+        return result
+
+    def get_all_fields_by_app_id(
+        self, app_id: int, paging_request: PagingRequest | None = None, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> list[ApiResponse[GetFieldsByAppIdResponse]]:
+        """Get every page of fields for an app, fetching pages after the first on a thread pool."""
+        if paging_request is None:
+            paging_request = PagingRequest()
 
-        return handle_get_fields_by_app_id_response(response)
+        return fetch_all_pages(partial(self.get_fields_by_app_id, app_id), paging_request, max_concurrency)
 
-    def get_file_info_by_id(self, record_id: int, field_id: int, file_id: int) -> ApiResponse[GetFileInfoByIdResponse]:
+    def get_file_info_by_id(
+        self, record_id: int, field_id: int, file_id: int, parse_mode: ParseMode | None = None
+    ) -> ApiResponse[GetFileInfoByIdResponse]:
         """Get file metadata by record, field, and file IDs."""
-        response = self.client.get(get_file_info_by_id_endpoint(self.base_url, record_id, field_id, file_id))
+        response = self._send(
+            "GET", get_file_info_by_id_endpoint(self.base_url, record_id, field_id, file_id), retryable=True
+        )
 
-        return handle_get_file_info_by_id_response(response)
+        return self._finish_response(handle_get_file_info_by_id_response(response, parse_mode or self.parse_mode))
 
     def delete_file_by_id(self, record_id: int, field_id: int, file_id: int) -> ApiResponse[None]:
         """Delete a file by record, field, and file IDs."""
-        response = self.client.delete(delete_file_by_id_endpoint(self.base_url, record_id, field_id, file_id))
+        response = self._send("DELETE", delete_file_by_id_endpoint(self.base_url, record_id, field_id, file_id))
 
-        return handle_delete_file_by_id_response(response)
+        return self._finish_response(handle_delete_file_by_id_response(response))
 
     def get_file_by_id(self, record_id: int, field_id: int, file_id: int) -> ApiResponse[GetFileByIdResponse]:
         """Get a file by record, field, and file IDs."""
-        response = self.client.get(get_file_by_id_endpoint(self.base_url, record_id, field_id, file_id))
+        response = self._send(
+            "GET", get_file_by_id_endpoint(self.base_url, record_id, field_id, file_id), retryable=True
+        )
 
-        return handle_get_file_by_id_response(response)
+        return self._finish_response(handle_get_file_by_id_response(response))
+
+    def download_file(
+        self,
+        record_id: int,
+        field_id: int,
+        file_id: int,
+        destination: Destination,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> ApiResponse[DownloadFileResponse]:
+        """Stream a file to a path or writable binary stream without loading it into memory."""
+        response = self._send(
+            "GET",
+            get_file_by_id_endpoint(self.base_url, record_id, field_id, file_id),
+            retryable=True,
+            stream=True,
+        )
 
-    def save_file(self, save_file_request: SaveFileRequest) -> ApiResponse[SaveFileResponse]:
-        """Save a file to a record."""
+        try:
+            if response.status_code != 200:
+                response.read()
+                return self._finish_response(handle_download_file_response(response))
+
+            bytes_written = write_stream(response.iter_bytes(chunk_size), destination)
+
+            return self._finish_response(handle_download_file_response(response, bytes_written))
+        except BaseException as error:
+            self._record_timing(response, error)
+            raise
+        finally:
+            response.close()
+
+    def save_file(
+        self,
+        save_file_request: SaveFileRequest,
+        content: bytes | Iterable[bytes] | None = None,
+        content_length: int | None = None,
+    ) -> ApiResponse[SaveFileResponse]:
+        """Save a file to a record, streaming its content instead of reading it into memory."""
         endpoint = save_file_endpoint(self.base_url)
 
-        with open(save_file_request.file_path, "rb") as f:
-            file_content = f.read()
-
-        files = {
-            "File": (
-                save_file_request.file_name,
-                file_content,
-                save_file_request.content_type,
+        if content is None:
+            if save_file_request.file_path is None:
+                raise ValueError("Either save_file_request.file_path or content must be provided")
+
+            content_length = os.path.getsize(save_file_request.file_path)
+            chunks = iter_file(save_file_request.file_path)
+        elif isinstance(content, bytes):
+            content_length = len(content)
+            chunks = [content]
+        elif isinstance(content, AsyncIterable):
+            raise TypeError("Async iterables are only supported by AsyncOnspringClient")
+        else:
+            chunks = content
+
+        encoder = MultipartEncoder(
+            save_file_request.model_dump(
+                by_alias=True, exclude={"file_name", "file_path", "content_type"}, exclude_none=True, mode="json"
             ),
-        }
-
-        data = save_file_request.model_dump(
-            by_alias=True, exclude={"file_name", "file_path", "content_type"}, exclude_none=True
+            "File",
+            save_file_request.file_name,
+            save_file_request.content_type,
+            content_length,
         )
 
-        response = self.client.post(endpoint, data=data, files=files)
+        response = self._send("POST", endpoint, content=encoder.iter_bytes(chunks), headers=encoder.headers)
 
-        return handle_save_file_response(response)
+        return self._finish_response(handle_save_file_response(response, self.parse_mode))
 
     def add_or_update_list_item(self, list_item_request: ListItemRequest) -> ApiResponse[AddOrUpdateListItemResponse]:
         """Add or update a list item value."""
         endpoint = add_or_update_list_item_endpoint(self.base_url, list_item_request.list_id)
         payload = list_item_request.model_dump(by_alias=True, exclude={"list_id"}, exclude_none=True, mode="json")
 
-        response = self.client.put(
+        response = self._send(
+            "PUT",
             endpoint,
             content=json.dumps(payload),
             headers=_JSON_HEADERS,
         )
 
-        return handle_add_or_update_list_item_response(response)
+        return self._finish_response(handle_add_or_update_list_item_response(response, self.parse_mode))
 
     def delete_list_item(self, list_id: int, item_id: str) -> ApiResponse[None]:
         """Delete a list item by list and item IDs."""
-        response = self.client.delete(delete_list_item_endpoint(self.base_url, list_id, item_id))
+        response = self._send("DELETE", delete_list_item_endpoint(self.base_url, list_id, item_id))
 
-        return handle_delete_list_item_response(response)
+        return self._finish_response(handle_delete_list_item_response(response))
 
-    def get_records_by_app_id(self, request: GetRecordsByAppRequest) -> ApiResponse[GetRecordsResponse]:
+    def get_records_by_app_id(
+        self, request: GetRecordsByAppRequest, parse_mode: ParseMode | None = None
+    ) -> ApiResponse[GetRecordsResponse]:
         """Get records for an app with optional filtering and paging."""
         params = request.model_dump(by_alias=True, exclude={"app_id"}, exclude_none=True)
         field_ids = params.pop("fieldIds", None)
         if field_ids:
             params["fieldIds"] = ",".join(str(i) for i in field_ids)
 
-        response = self.client.get(
+        response = self._send(
+            "GET",
             get_records_by_app_id_endpoint(self.base_url, request.app_id),
             params=params,
+            retryable=True,
         )
 
-        return handle_get_records_by_app_id_response(response)
+        return self._finish_response(handle_get_records_by_app_id_response(response, parse_mode or self.parse_mode))
+
+    def get_all_records_by_app_id(
+        self, request: GetRecordsByAppRequest, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> list[ApiResponse[GetRecordsResponse]]:
+        """Get every page of records for an app, fetching pages after the first on a thread pool."""
+        return fetch_all_pages(self.get_records_by_app_id, request, max_concurrency)
 
-    def get_record_by_id(self, request: GetRecordByIdRequest) -> ApiResponse[Record]:
+    def get_record_by_id(
+        self, request: GetRecordByIdRequest, parse_mode: ParseMode | None = None
+    ) -> ApiResponse[Record]:
         """Get a record by its app and record IDs."""
         params = request.model_dump(by_alias=True, exclude={"app_id", "record_id"}, exclude_none=True)
         field_ids = params.pop("fieldIds", None)
@@ -267,93 +620,295 @@ class OnspringClient:
         if field_ids:
             params["fieldIds"] = ",".join(str(i) for i in field_ids)
 
-        response = self.client.get(
+        response = self._send(
+            "GET",
             get_record_by_id_endpoint(self.base_url, request.app_id, request.record_id),
             params=params,
+            retryable=True,
         )
 
-        return handle_get_record_by_id_response(response)
+        return self._finish_response(handle_get_record_by_id_response(response, parse_mode or self.parse_mode))
 
     def delete_record_by_id(self, app_id: int, record_id: int) -> ApiResponse[None]:
         """Delete a record by its app and record IDs."""
-        response = self.client.delete(delete_record_by_id_endpoint(self.base_url, app_id, record_id))
-
-        return handle_delete_record_by_id_response(response)
-
-    def get_records_by_ids(self, request: GetBatchRecordsRequest) -> ApiResponse[GetBatchRecordsResponse]:
-        """Get multiple records by their IDs."""
-        response = self.client.post(
+        response = self._send("DELETE", delete_record_by_id_endpoint(self.base_url, app_id, record_id))
+
+        return self._finish_response(handle_delete_record_by_id_response(response))
+
+    def get_records_by_ids(
+        self,
+        request: GetBatchRecordsRequest,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        parse_mode: ParseMode | None = None,
+    ) -> ApiResponse[GetBatchRecordsResponse]:
+        """Get multiple records by their IDs, splitting long ID lists into concurrent chunks."""
+        parse_mode = parse_mode or self.parse_mode
+        requests = chunk_request(request, batch_size)
+
+        if len(requests) > 1 and parse_mode is ParseMode.Bytes:
+            raise ValueError("Bytes results cannot be merged across chunks; use a batch_size covering every ID")
+
+        fetch = partial(self._get_records_by_ids_chunk, parse_mode=parse_mode)
+
+        return merge_batch_records(fetch_chunks(fetch, requests, max_concurrency))
+
+    def _get_records_by_ids_chunk(
+        self, request: GetBatchRecordsRequest, parse_mode: ParseMode | None = None
+    ) -> ApiResponse[GetBatchRecordsResponse]:
+        """Get a single chunk of records by their IDs."""
+        response = self._send(
+            "POST",
             get_records_by_ids_endpoint(self.base_url),
             content=json.dumps(request.model_dump(by_alias=True, exclude_none=True, mode="json")),
             headers=_JSON_HEADERS,
+            retryable=True,
         )
 
-        return handle_get_records_by_ids_response(response)
+        return self._finish_response(handle_get_records_by_ids_response(response, parse_mode or self.parse_mode))
 
-    def query_records(self, request: QueryRecordsRequest) -> ApiResponse[GetRecordsResponse]:
+    def query_records(
+        self, request: QueryRecordsRequest, parse_mode: ParseMode | None = None
+    ) -> ApiResponse[GetRecordsResponse]:
         """Query records using a structured query request."""
         exclude = {"page_number", "page_size"}
         payload = request.model_dump(by_alias=True, exclude=exclude, exclude_none=True, mode="json")
         params = {"pageNumber": request.page_number, "pageSize": request.page_size}
 
-        response = self.client.post(
+        response = self._send(
+            "POST",
             query_records_endpoint(self.base_url),
             content=json.dumps(payload),
             params=params,
             headers=_JSON_HEADERS,
+            retryable=True,
         )
 
-        return handle_query_records_response(response)
+        return self._finish_response(handle_query_records_response(response, parse_mode or self.parse_mode))
+
+    def query_all_records(
+        self, request: QueryRecordsRequest, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> list[ApiResponse[GetRecordsResponse]]:
+        """Get every page of records matching a query, fetching pages after the first on a thread pool."""
+        return fetch_all_pages(self.query_records, request, max_concurrency)
+
+    def iter_records_by_app_id(
+        self, request: GetRecordsByAppRequest, prefetch: int = DEFAULT_PREFETCH
+    ) -> Iterator[Record]:
+        """Iterate over every record in an app, prefetching upcoming pages on background threads."""
+        for page in iter_pages(self.get_records_by_app_id, request, prefetch):
+            yield from page.records
+
+    def iter_query_records(self, request: QueryRecordsRequest, prefetch: int = DEFAULT_PREFETCH) -> Iterator[Record]:
+        """Iterate over every record matching a query, prefetching upcoming pages on background threads."""
+        for page in iter_pages(self.query_records, request, prefetch):
+            yield from page.records
+
+    def get_records_table_by_app_id(
+        self, request: GetRecordsByAppRequest, prefetch: int = DEFAULT_PREFETCH
+    ) -> RecordTable:
+        """Collect every record in an app, starting at the request's page, into a ``RecordTable``."""
+        fetch = partial(self.get_records_by_app_id, parse_mode=ParseMode.Lazy)
+        table = RecordTable()
+
+        for page in iter_pages(fetch, request, prefetch):
+            table.extend(page.records)
+
+        return table
+
+    def query_records_table(self, request: QueryRecordsRequest, prefetch: int = DEFAULT_PREFETCH) -> RecordTable:
+        """Collect every record matching a query, starting at the request's page, into a ``RecordTable``."""
+        fetch = partial(self.query_records, parse_mode=ParseMode.Lazy)
+        table = RecordTable()
+
+        for page in iter_pages(fetch, request, prefetch):
+            table.extend(page.records)
+
+        return table
+
+    def export_records(
+        self,
+        app_id: int,
+        destination: TextDestination,
+        format: ExportFormat = ExportFormat.JsonLines,
+        field_ids: Sequence[int] | None = None,
+        data_format: DataFormat = DataFormat.Raw,
+        filter: str | None = None,
+        page_size: int = DEFAULT_EXPORT_PAGE_SIZE,
+        prefetch: int = DEFAULT_PREFETCH,
+        progress: ExportProgress | None = None,
+    ) -> int:
+        """Write every record in an app to a CSV or JSON Lines file and return the number written."""
+        columns = list(field_ids) if field_ids else self._get_field_ids(app_id)
+        options = {
+            "app_id": app_id,
+            "field_ids": field_ids or [],
+            "data_format": data_format.name,
+            "page_size": page_size,
+        }
+
+        if filter is None:
+            request = GetRecordsByAppRequest(**options)
+            fetch = partial(self.get_records_by_app_id, parse_mode=ParseMode.Lazy)
+        else:
+            request = QueryRecordsRequest(**options, filter=filter)
+            fetch = partial(self.query_records, parse_mode=ParseMode.Lazy)
+
+        written = 0
+
+        with open_writer(destination, record_columns(columns), format) as write:
+            for page in iter_pages(fetch, request, prefetch):
+                written += write(record_rows(page.records, columns))
+
+                if progress is not None:
+                    progress(written, page.total_records)
+
+        return written
+
+    def iter_changed_records(
+        self,
+        app_id: int,
+        modified_field_id: int,
+        checkpoints: CheckpointStore,
+        field_ids: Sequence[int] | None = None,
+        filter: str | None = None,
+        overlap: timedelta = DEFAULT_OVERLAP,
+        page_size: int = DEFAULT_CHANGES_PAGE_SIZE,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> Iterator[Record]:
+        """Iterate over the records in an app that changed since its checkpoint, then save a new one."""
+        scan = ChangeScan(modified_field_id, checkpoints.load(app_id), overlap)
+        fetch, request = self._changed_records_request(app_id, scan, field_ids, filter, page_size)
+
+        for page in iter_pages(fetch, request, prefetch):
+            for record in page.records:
+                if scan.accept(record):
+                    yield record
+
+        checkpoint = scan.checkpoint()
+
+        if checkpoint is not None:
+            checkpoints.save(app_id, checkpoint)
+
+    def _changed_records_request(
+        self, app_id: int, scan: ChangeScan, field_ids: Sequence[int] | None, filter: str | None, page_size: int
+    ) -> tuple[Callable, GetRecordsByAppRequest | QueryRecordsRequest]:
+        if field_ids and scan.modified_field_id not in field_ids:
+            field_ids = [*field_ids, scan.modified_field_id]
+
+        options = {"app_id": app_id, "field_ids": list(field_ids or []), "page_size": page_size}
+        query = scan.filter(filter)
+
+        if query is None:
+            return self.get_records_by_app_id, GetRecordsByAppRequest(**options)
+
+        return self.query_records, QueryRecordsRequest(**options, filter=query)
+
+    def _get_field_ids(self, app_id: int) -> list[int]:
+        field_ids = []
+
+        for response in self.get_all_fields_by_app_id(app_id):
+            response.raise_for_status()
+            field_ids.extend(field.id for field in response.data.fields)
+
+        return field_ids
 
     def add_or_update_record(self, record: Record) -> ApiResponse[AddOrUpdateRecordResponse]:
         """Add or update a record."""
-        fields_dict = {}
-
-        for field in record.fields:
-            fields_dict[field.field_id] = field.value
+        fields_dict = {field_id: field.value for field_id, field in record.field_map.items()}
 
         payload = record.model_dump(by_alias=True, exclude={"fields"}, exclude_none=True, mode="json")
         payload["fields"] = fields_dict
 
-        response = self.client.put(
+        response = self._send(
+            "PUT",
             add_or_update_record_endpoint(self.base_url),
             content=json.dumps(payload, default=str),
             headers=_JSON_HEADERS,
         )
 
-        return handle_add_or_update_record_response(response)
-
-    def delete_records_by_ids(self, request: DeleteBatchRecordsRequest) -> ApiResponse[None]:
-        """Delete multiple records by their IDs."""
-        response = self.client.post(
+        return self._finish_response(handle_add_or_update_record_response(response, self.parse_mode))
+
+    def add_or_update_records(
+        self, records: Iterable[Record], max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> list[ApiResponse[AddOrUpdateRecordResponse] | Exception]:
+        """Add or update many records with up to ``max_concurrency`` requests in flight."""
+        return map_bounded(self.add_or_update_record, records, max_concurrency)
+
+    def delete_records_by_ids(
+        self,
+        request: DeleteBatchRecordsRequest,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> ApiResponse[DeleteBatchRecordsReport]:
+        """Delete multiple records by their IDs, splitting long ID lists into concurrent chunks."""
+        requests = chunk_request(request, batch_size)
+        responses = fetch_chunks(self._delete_records_by_ids_chunk, requests, max_concurrency)
+
+        return build_delete_report(requests, responses)
+
+    def _delete_records_by_ids_chunk(self, request: DeleteBatchRecordsRequest) -> ApiResponse[None]:
+        """Delete a single chunk of records by their IDs."""
+        response = self._send(
+            "POST",
             delete_records_by_ids_endpoint(self.base_url),
             content=json.dumps(request.model_dump(by_alias=True, exclude_none=True, mode="json")),
             headers=_JSON_HEADERS,
         )
 
-        return handle_delete_records_by_ids_response(response)
+        return self._finish_response(handle_delete_records_by_ids_response(response))
 
-    def get_report_by_id(self, request: GetReportByIdRequest) -> ApiResponse[GetReportByIdResponse]:
+    def get_report_by_id(
+        self, request: GetReportByIdRequest, parse_mode: ParseMode | None = None
+    ) -> ApiResponse[GetReportByIdResponse]:
         """Get a report by its ID."""
         params = request.model_dump(by_alias=True, exclude={"report_id"}, exclude_none=True)
 
-        response = self.client.get(
+        response = self._send(
+            "GET",
             get_report_by_id_endpoint(self.base_url, request.report_id),
             params=params,
+            retryable=True,
+            cacheable=True,
         )
 
-        return handle_get_report_by_id_response(response)
+        return self._finish_response(handle_get_report_by_id_response(response, parse_mode or self.parse_mode))
 
     def get_reports_by_app_id(
-        self, app_id: int, paging_request: PagingRequest | None = None
+        self, app_id: int, paging_request: PagingRequest | None = None, parse_mode: ParseMode | None = None
     ) -> ApiResponse[GetReportsByAppIdResponse]:
         """Get all reports for an app with optional paging."""
+        parse_mode = parse_mode or self.parse_mode
+        cache = None if is_raw(parse_mode) else self.metadata_cache
+
         if paging_request is None:
             paging_request = PagingRequest()
 
-        response = self.client.get(
+        if cache is not None:
+            page = cache.get_reports_page(app_id, paging_request)
+
+            if page is not None:
+                return ApiResponse(status_code=200, data=page)
+
+        response = self._send(
+            "GET",
             get_reports_by_app_id_endpoint(self.base_url, app_id),
             params=paging_request.model_dump(by_alias=True, exclude_none=True),
+            retryable=True,
+            cacheable=True,
         )
+        result = self._finish_response(handle_get_reports_by_app_id_response(response, parse_mode))
+
+        if cache is not None and result.is_successful:
+            cache.set_reports_page(app_id, paging_request, result.data)
+
+        return result
+
+    def get_all_reports_by_app_id(
+        self, app_id: int, paging_request: PagingRequest | None = None, max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> list[ApiResponse[GetReportsByAppIdResponse]]:
+        """Get every page of reports for an app, fetching pages after the first on a thread pool."""
+        if paging_request is None:
+            paging_request = PagingRequest()
 
-        return handle_get_reports_by_app_id_response(response)
+        return fetch_all_pages(partial(self.get_reports_by_app_id, app_id), paging_request, max_concurrency)
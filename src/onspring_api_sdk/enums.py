@@ -52,3 +52,39 @@ class Recurrence(Enum):
     Empty: str = "None"
     EndByDate: str = "EndByDate"
     EndAfterOccurrences: str = "EndAfterOccurrences"
+
+
+class ParseMode(Enum):
+    """How response bodies are deserialized.
+
+    ``Validated`` decodes the JSON into Python objects before validating them.
+    ``Lazy`` validates the raw bytes but leaves each record's field values
+    unparsed until they are accessed. ``Json`` returns the decoded JSON and
+    ``Bytes`` the raw body without building any models; these are only
+    accepted per call.
+    """
+
+    Validated: str = "Validated"
+    Lazy: str = "Lazy"
+    Json: str = "Json"
+    Bytes: str = "Bytes"
+
+
+class RawResponseMode(Enum):
+    """How much of the underlying ``httpx.Response`` an ``ApiResponse`` keeps.
+
+    ``Full`` keeps the response, including its body buffer. ``Metadata`` keeps
+    only the headers and elapsed time so the body can be freed once parsed.
+    ``Off`` keeps neither.
+    """
+
+    Full: str = "Full"
+    Metadata: str = "Metadata"
+    Off: str = "Off"
+
+
+class ExportFormat(Enum):
+    """File formats records can be exported to."""
+
+    Csv: str = "Csv"
+    JsonLines: str = "JsonLines"
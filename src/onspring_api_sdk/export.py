@@ -0,0 +1,140 @@
+"""Streaming CSV and JSON Lines writers for tabular record and report data."""
+
+import csv
+import json
+import os
+import uuid
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from datetime import datetime
+from decimal import Decimal
+from typing import IO, Any
+
+from pydantic import BaseModel
+
+from onspring_api_sdk._download import remove_partial
+from onspring_api_sdk.enums import ExportFormat
+from onspring_api_sdk.models import Record
+
+DEFAULT_EXPORT_PAGE_SIZE = 1000
+
+TextDestination = str | os.PathLike[str] | IO[str]
+RowWriter = Callable[[Iterable[Sequence[Any]]], int]
+ExportProgress = Callable[[int, int], None]
+
+
+@contextmanager
+def _open_text(destination: TextDestination) -> Iterator[IO[str]]:
+    if not isinstance(destination, (str, os.PathLike)):
+        yield destination
+        return
+
+    try:
+        with open(destination, "w", newline="", encoding="utf-8") as f:
+            yield f
+    except BaseException:
+        remove_partial(destination)
+        raise
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+
+    if isinstance(value, Decimal):
+        return float(value)
+
+    if isinstance(value, uuid.UUID):
+        return str(value)
+
+    if isinstance(value, BaseModel):
+        return value.model_dump(by_alias=True, mode="json")
+
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+
+    if isinstance(value, datetime):
+        return value.isoformat()
+
+    if isinstance(value, (list, dict, BaseModel)):
+        return json.dumps(value, default=_json_default)
+
+    return value
+
+
+@contextmanager
+def open_writer(destination: TextDestination, columns: Sequence[str], format: ExportFormat) -> Iterator[RowWriter]:
+    """Open a destination for writing rows in the given format.
+
+    Yields a function that writes an iterable of rows and returns how many it
+    wrote, so rows can be written in batches as they become available. A CSV
+    header is written when the destination is opened. A path is opened and
+    closed here, and removed again if writing fails; a text stream is
+    written to and left open.
+    """
+    with _open_text(destination) as f:
+        if format is ExportFormat.Csv:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+
+            def _write(rows: Iterable[Sequence[Any]]) -> int:
+                count = 0
+
+                for row in rows:
+                    writer.writerow([_csv_value(value) for value in row])
+                    count += 1
+
+                return count
+        else:
+
+            def _write(rows: Iterable[Sequence[Any]]) -> int:
+                count = 0
+
+                for row in rows:
+                    f.write(json.dumps(dict(zip(columns, row)), default=_json_default))
+                    f.write("\n")
+                    count += 1
+
+                return count
+
+        yield _write
+
+
+def write_csv(destination: TextDestination, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> int:
+    """Write a header and each row as CSV and return the number of rows written.
+
+    Rows are written as they are produced. Missing values are written as empty
+    cells, dates in ISO 8601 format and lists or nested values as JSON.
+    """
+    with open_writer(destination, columns, ExportFormat.Csv) as write:
+        return write(rows)
+
+
+def write_jsonl(destination: TextDestination, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> int:
+    """Write each row as a JSON object keyed by column on its own line and return the number of rows written.
+
+    Rows are written as they are produced. Dates are written in ISO 8601
+    format, decimals as numbers and GUIDs as strings.
+    """
+    with open_writer(destination, columns, ExportFormat.JsonLines) as write:
+        return write(rows)
+
+
+def record_columns(field_ids: Sequence[int]) -> list[str]:
+    """Return the column names for exported records: ``recordId`` followed by each field ID."""
+    return ["recordId", *(str(field_id) for field_id in field_ids)]
+
+
+def record_rows(records: Iterable[Record], field_ids: Sequence[int]) -> Iterator[list[Any]]:
+    """Yield each record's ID and the values of ``field_ids``, with ``None`` for fields it does not have.
+
+    Values of lazily parsed records are passed through as they appeared in
+    the JSON.
+    """
+    for record in records:
+        values = {field_id: value for field_id, _, value in record.iter_entries()}
+        yield [record.record_id, *(values.get(field_id) for field_id in field_ids)]
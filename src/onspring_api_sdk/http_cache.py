@@ -0,0 +1,201 @@
+"""Conditional GET response cache for rarely changing endpoints."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+import httpx
+
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+DEFAULT_TTL = 300.0
+
+PARSED_MODELS = "onspring_parsed_models"
+
+_DROPPED_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+_KEY_HEADERS = ("x-apikey",)
+
+
+class CachedResponse:
+    """A stored response body with its validators and the models parsed from it."""
+
+    __slots__ = ("body", "headers", "etag", "last_modified", "vary", "expires_at", "parsed")
+
+    def __init__(self, response: httpx.Response, ttl: float):
+        """Store the body and headers of a successful response."""
+        self.body = response.content
+        self.headers = httpx.Headers(
+            [(name, value) for name, value in response.headers.multi_items() if name.lower() not in _DROPPED_HEADERS]
+        )
+        self.etag = response.headers.get("etag")
+        self.last_modified = response.headers.get("last-modified")
+        self.vary = tuple((name, response.request.headers.get(name)) for name in _vary(response))
+        self.expires_at = time.monotonic() + ttl
+        self.parsed: dict[Any, Any] = {}
+
+    @property
+    def has_validators(self) -> bool:
+        """Return whether the response can be revalidated with a conditional request."""
+        return self.etag is not None or self.last_modified is not None
+
+    def matches(self, request: httpx.Request) -> bool:
+        """Return whether ``request`` has the same values as the stored one for the headers listed in ``Vary``."""
+        return all(request.headers.get(name) == value for name, value in self.vary)
+
+    def is_fresh(self) -> bool:
+        """Return whether the response can be served without asking the server, because it has no validators."""
+        return not self.has_validators and self.expires_at > time.monotonic()
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Return the headers asking the server to reply 304 if the response has not changed."""
+        headers = {}
+
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+
+        return headers
+
+    def to_response(self, request: httpx.Request, extensions: dict[str, Any] | None = None) -> httpx.Response:
+        """Build a 200 response for ``request`` from the stored body, sharing the models already parsed from it."""
+        return httpx.Response(
+            200,
+            headers=self.headers,
+            content=self.body,
+            request=request,
+            extensions={**(extensions or {}), PARSED_MODELS: self.parsed},
+        )
+
+
+class ResponseCache:
+    """Thread-safe, size-bounded cache of GET responses revalidated with ETag and Last-Modified.
+
+    Responses carrying an ``ETag`` or ``Last-Modified`` header are revalidated
+    on every request with ``If-None-Match`` or ``If-Modified-Since``; when the
+    server replies 304 the stored body, and any models already parsed from
+    it, are reused. Responses without validators are served without a
+    request until ``ttl`` seconds after they were stored. Bodies are evicted
+    least recently used first once they total more than ``max_bytes``.
+    Responses are stored per URL and API key, so clients with different
+    keys can share a cache, and a stored response is only served to requests
+    matching the headers named in its ``Vary`` header. Parsed models are
+    shared between the responses served from one entry and should not be
+    modified.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, ttl: float = DEFAULT_TTL):
+        """Create a cache holding at most ``max_bytes`` of bodies, keeping unvalidated ones for ``ttl`` seconds."""
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+
+        if ttl <= 0:
+            raise ValueError("ttl must be greater than 0")
+
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.size = 0
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[tuple[str | None, ...], CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of stored responses."""
+        return len(self._entries)
+
+    def lookup(self, request: httpx.Request) -> tuple[CachedResponse | None, httpx.Response | None]:
+        """Return the stored entry for a request, and a response to serve without a request if it is still fresh.
+
+        Expired entries without validators are dropped.
+        """
+        key = _key(request)
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or not entry.matches(request):
+                return None, None
+
+            self._entries.move_to_end(key)
+
+            if entry.is_fresh():
+                self.hits += 1
+                return entry, entry.to_response(request)
+
+            if not entry.has_validators:
+                self._remove(key)
+                return None, None
+
+            return entry, None
+
+    def store(self, response: httpx.Response, entry: CachedResponse | None) -> httpx.Response:
+        """Cache a response to a request made after ``lookup`` and return the response to handle.
+
+        A 304 is answered from ``entry``, a cacheable 200 replaces it and any
+        other response is returned unchanged, dropping the entry unless the
+        server failed.
+        """
+        key = _key(response.request)
+
+        if response.status_code == 304 and entry is not None:
+            with self._lock:
+                self.revalidations += 1
+
+            return entry.to_response(response.request, response.extensions)
+
+        with self._lock:
+            self.misses += 1
+
+            if (
+                response.status_code == 200
+                and "no-store" not in response.headers.get("cache-control", "")
+                and "*" not in _vary(response)
+            ):
+                new_entry = CachedResponse(response, self.ttl)
+
+                if len(new_entry.body) <= self.max_bytes:
+                    self._remove(key)
+                    self._entries[key] = new_entry
+                    self.size += len(new_entry.body)
+                    response.extensions[PARSED_MODELS] = new_entry.parsed
+
+                    while self.size > self.max_bytes:
+                        self._remove(next(iter(self._entries)))
+                        self.evictions += 1
+
+                    return response
+
+            if response.status_code < 500:
+                self._remove(key)
+
+        return response
+
+    def invalidate(self, url: str | httpx.URL) -> None:
+        """Remove the stored responses for a URL, including its query string, for every API key."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == str(url)]:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Remove every stored response."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _remove(self, key: tuple[str | None, ...]) -> None:
+        entry = self._entries.pop(key, None)
+
+        if entry is not None:
+            self.size -= len(entry.body)
+
+
+def _key(request: httpx.Request) -> tuple[str | None, ...]:
+    return (str(request.url), *(request.headers.get(name) for name in _KEY_HEADERS))
+
+
+def _vary(response: httpx.Response) -> list[str]:
+    return [name.strip().lower() for name in response.headers.get("vary", "").split(",") if name.strip()]
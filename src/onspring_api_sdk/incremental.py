@@ -0,0 +1,207 @@
+"""Checkpoints and change tracking for incrementally syncing an app's records."""
+
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+
+from onspring_api_sdk._download import remove_partial
+from onspring_api_sdk.models import Record
+
+DEFAULT_OVERLAP = timedelta(minutes=5)
+DEFAULT_CHANGES_PAGE_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    """How far an app's records have been synced.
+
+    ``high_water_mark`` is the last modified date up to which every change
+    has been seen. ``seen`` maps the ID of each record modified within the
+    overlap window before it to that record's last modified date, so those
+    records are not yielded again unless they change.
+    """
+
+    high_water_mark: datetime
+    seen: Mapping[int, datetime] = field(default_factory=lambda: MappingProxyType({}))
+
+    def to_dict(self) -> dict:
+        """Return the checkpoint as JSON-compatible data."""
+        return {
+            "highWaterMark": self.high_water_mark.isoformat(),
+            "seen": {str(record_id): modified.isoformat() for record_id, modified in self.seen.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "Checkpoint":
+        """Build a checkpoint from data returned by ``to_dict``."""
+        return cls(
+            high_water_mark=datetime.fromisoformat(data["highWaterMark"]),
+            seen=MappingProxyType(
+                {int(record_id): datetime.fromisoformat(modified) for record_id, modified in data["seen"].items()}
+            ),
+        )
+
+
+class CheckpointStore(ABC):
+    """Keeps one checkpoint per app. Subclass to store checkpoints elsewhere."""
+
+    @abstractmethod
+    def load(self, app_id: int) -> Checkpoint | None:
+        """Return the app's checkpoint, or ``None`` if it has never been synced."""
+
+    @abstractmethod
+    def save(self, app_id: int, checkpoint: Checkpoint) -> None:
+        """Replace the app's checkpoint."""
+
+
+class MemoryCheckpointStore(CheckpointStore):
+    """Keeps checkpoints in memory for the life of the process."""
+
+    def __init__(self):
+        """Create an empty store."""
+        self._checkpoints: dict[int, Checkpoint] = {}
+
+    def load(self, app_id: int) -> Checkpoint | None:
+        """Return the app's checkpoint, or ``None`` if it has never been synced."""
+        return self._checkpoints.get(app_id)
+
+    def save(self, app_id: int, checkpoint: Checkpoint) -> None:
+        """Replace the app's checkpoint."""
+        self._checkpoints[app_id] = checkpoint
+
+
+class FileCheckpointStore(CheckpointStore):
+    """Keeps the checkpoints of every app in a JSON file.
+
+    The file is rewritten on each save by writing a temporary file and
+    renaming it over the old one, so an interrupted save never leaves a
+    partial file behind.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]):
+        """Use the JSON file at ``path``, which is created on the first save."""
+        self.path = path
+        self._lock = threading.Lock()
+
+    def load(self, app_id: int) -> Checkpoint | None:
+        """Return the app's checkpoint, or ``None`` if it has never been synced."""
+        with self._lock:
+            data = self._read().get(str(app_id))
+
+        return Checkpoint.from_dict(data) if data is not None else None
+
+    def save(self, app_id: int, checkpoint: Checkpoint) -> None:
+        """Replace the app's checkpoint."""
+        with self._lock:
+            data = self._read()
+            data[str(app_id)] = checkpoint.to_dict()
+            temp_path = f"{os.fspath(self.path)}.tmp"
+
+            try:
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+
+                os.replace(temp_path, self.path)
+            except BaseException:
+                remove_partial(temp_path)
+                raise
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+
+def modified_since_filter(modified_field_id: int, since: datetime) -> str:
+    """Return a query filter matching records whose date field ``modified_field_id`` is after ``since``."""
+    return f"{modified_field_id} gt '{_as_utc(since):%Y-%m-%dT%H:%M:%SZ}'"
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+class ChangeScan:
+    """Filters one pass over an app's records down to the changes since its checkpoint.
+
+    Records are requested from ``overlap`` before the checkpoint's high
+    water mark, so changes made while the previous pass was running, or
+    recorded with a slightly skewed clock, are not missed. Records seen in
+    the previous pass with the same modified date are skipped, as are
+    records returned again in this pass with the same modified date, for
+    example because other edits moved them between pages.
+    """
+
+    def __init__(self, modified_field_id: int, checkpoint: Checkpoint | None, overlap: timedelta = DEFAULT_OVERLAP):
+        """Start a pass from ``checkpoint``, or over every record when there is none."""
+        self.modified_field_id = modified_field_id
+        self.previous = checkpoint
+        self.overlap = overlap
+        self.started_at = datetime.now(timezone.utc)
+        self.yielded = 0
+        self.skipped = 0
+        self._returned: dict[int, datetime | None] = {}
+
+    def filter(self, filter: str | None = None) -> str | None:
+        """Return the query filter for this pass, combined with ``filter`` if given.
+
+        Returns ``filter`` itself on the first pass of an app.
+        """
+        if self.previous is None:
+            return filter
+
+        since = modified_since_filter(self.modified_field_id, self.previous.high_water_mark - self.overlap)
+
+        return since if filter is None else f"({filter}) and ({since})"
+
+    def accept(self, record: Record) -> bool:
+        """Return whether a record is a change that has not been yielded yet, remembering it either way."""
+        value = record.get(self.modified_field_id)
+        modified = _as_utc(value.value) if value is not None and isinstance(value.value, datetime) else None
+
+        if record.record_id in self._returned and self._returned[record.record_id] == modified:
+            self.skipped += 1
+            return False
+
+        self._returned[record.record_id] = modified
+
+        if modified is not None and self.previous is not None and self.previous.seen.get(record.record_id) == modified:
+            self.skipped += 1
+            return False
+
+        self.yielded += 1
+        return True
+
+    def checkpoint(self) -> Checkpoint | None:
+        """Return the checkpoint to save once every page of the pass has been read.
+
+        The high water mark advances to the newest modified date returned,
+        but never past the time the pass started, since records changed
+        during the pass may have been missed. It stays where it was when no
+        dated records were returned.
+        """
+        dates = [modified for modified in self._returned.values() if modified is not None]
+
+        if not dates:
+            return self.previous
+
+        high_water_mark = min(max(dates), self.started_at)
+
+        if self.previous is not None:
+            high_water_mark = max(high_water_mark, self.previous.high_water_mark)
+
+        window_start = high_water_mark - self.overlap
+        seen = {
+            record_id: modified
+            for record_id, modified in self._returned.items()
+            if modified is not None and modified >= window_start
+        }
+
+        return Checkpoint(high_water_mark, MappingProxyType(seen))
@@ -0,0 +1,160 @@
+"""Per-request timing and observer hooks for the Onspring API clients."""
+
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import httpx
+
+_ID_SEGMENT = re.compile(
+    r"(?<=/)(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})(?=/|$)"
+)
+
+
+def endpoint_name(url: str | httpx.URL) -> str:
+    """Return the URL's path with numeric and GUID segments replaced by ``{id}``, e.g. ``/Records/appId/{id}``."""
+    return _ID_SEGMENT.sub("{id}", httpx.URL(url).path)
+
+
+@dataclass(frozen=True)
+class RequestStart:
+    """Describes a request the client is about to send."""
+
+    endpoint: str
+    method: str
+    url: str
+
+
+@dataclass(frozen=True)
+class RequestTiming:
+    """Where the time went for one client call, from sending the request to handling its response.
+
+    ``queue_seconds`` is time spent waiting on the rate limiter and between
+    retries. ``network_seconds`` is time spent in the HTTP client across every
+    attempt, and includes reading the body unless the response was streamed.
+    ``connect_seconds``, ``server_seconds`` (from sending the request to
+    receiving the response headers) and ``download_seconds`` break down the
+    last attempt when the transport reports them, and are ``None`` otherwise,
+    for example with a mock transport or a reused connection.
+    ``parse_seconds`` is time spent turning the response into an
+    ``ApiResponse``. ``retry_reasons`` holds the status code or transport
+    error name that triggered each retry, as in ``RetryStats``. ``error``
+    holds the exception when the request failed without a response, or
+    while a streamed body was being read.
+    """
+
+    endpoint: str
+    method: str
+    url: str
+    status_code: Optional[int]
+    request_bytes: int
+    response_bytes: int
+    retries: int
+    retry_reasons: tuple[str, ...]
+    queue_seconds: float
+    network_seconds: float
+    connect_seconds: Optional[float]
+    server_seconds: Optional[float]
+    download_seconds: Optional[float]
+    parse_seconds: float
+    total_seconds: float
+    error: Optional[BaseException] = None
+
+
+class RequestObserver:
+    """Receives lifecycle events for every request a client sends.
+
+    Subclass and override the methods you need, then pass instances to a
+    client's ``observers``. Methods are called on the thread or event loop
+    making the request and should return quickly.
+    """
+
+    def on_request_start(self, event: RequestStart) -> None:
+        """Handle a request that is about to be sent, before any rate limiting."""
+
+    def on_request_end(self, timing: RequestTiming) -> None:
+        """Handle a request whose response has been handled or that failed without a response."""
+
+
+_TIMER_KEY = "onspring_timer"
+
+
+class _RequestTimer:
+    """Accumulates the timing of one client call while it is in progress."""
+
+    def __init__(self, method: str, url: str):
+        self.start = RequestStart(endpoint_name(url), method, str(url))
+        self.started = time.perf_counter()
+        self.retry_reasons: list[str] = []
+        self.queue_seconds = 0.0
+        self.network_seconds = 0.0
+        self.network_end = self.started
+        self._events: dict[str, float] = {}
+
+    def trace(self, name: str, info: dict[str, Any]) -> None:
+        self._events[name.split(".", 1)[1]] = time.perf_counter()
+
+    async def atrace(self, name: str, info: dict[str, Any]) -> None:
+        self.trace(name, info)
+
+    def begin_attempt(self) -> float:
+        self._events.clear()
+        return time.perf_counter()
+
+    def end_attempt(self, attempt_started: float) -> None:
+        self.network_end = time.perf_counter()
+        self.network_seconds += self.network_end - attempt_started
+
+    def attach(self, response: httpx.Response) -> None:
+        response.extensions[_TIMER_KEY] = self
+
+    def finish(self, response: httpx.Response | None = None, error: BaseException | None = None) -> RequestTiming:
+        now = time.perf_counter()
+        body_end = self._events.get("receive_response_body.complete", self.network_end)
+        request = response.request if response is not None else None
+
+        return RequestTiming(
+            endpoint=self.start.endpoint,
+            method=self.start.method,
+            url=self.start.url,
+            status_code=response.status_code if response is not None else None,
+            request_bytes=int(request.headers.get("content-length", 0)) if request is not None else 0,
+            response_bytes=response.num_bytes_downloaded if response is not None else 0,
+            retries=len(self.retry_reasons),
+            retry_reasons=tuple(self.retry_reasons),
+            queue_seconds=self.queue_seconds,
+            network_seconds=self.network_seconds,
+            connect_seconds=self._between("connect_tcp.started", ("start_tls.complete", "connect_tcp.complete")),
+            server_seconds=self._between(
+                ("send_request_body.complete", "send_request_headers.complete"), "receive_response_headers.complete"
+            ),
+            download_seconds=self._between("receive_response_body.started", "receive_response_body.complete"),
+            parse_seconds=max(0.0, now - max(self.network_end, body_end)),
+            total_seconds=now - self.started,
+            error=error,
+        )
+
+    def _between(self, start: str | tuple[str, ...], end: str | tuple[str, ...]) -> float | None:
+        started = self._first(start)
+        ended = self._first(end)
+
+        if started is None or ended is None:
+            return None
+
+        return ended - started
+
+    def _first(self, names: str | tuple[str, ...]) -> float | None:
+        for name in (names,) if isinstance(names, str) else names:
+            if name in self._events:
+                return self._events[name]
+
+        return None
+
+
+def pop_timer(response: httpx.Response | None) -> _RequestTimer | None:
+    """Remove and return the timer a client attached to a response, if any."""
+    if response is None:
+        return None
+
+    return response.extensions.pop(_TIMER_KEY, None)
@@ -0,0 +1,230 @@
+"""Per-endpoint request metrics with Prometheus text format export."""
+
+import math
+import threading
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from onspring_api_sdk.instrumentation import RequestObserver, RequestTiming
+
+DEFAULT_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+DEFAULT_NAMESPACE = "onspring"
+ERROR_STATUS = "error"
+
+_COUNTERS = (
+    ("request_bytes_total", "request_bytes", "Bytes sent in request bodies."),
+    ("response_bytes_total", "response_bytes", "Bytes received in response bodies."),
+    ("rate_limited_total", "rate_limited", "Responses with status 429, including retried ones."),
+    ("retries_total", "retries", "Attempts retried after a transient failure."),
+    ("network_seconds_total", "network_seconds", "Time spent sending requests and receiving responses."),
+    ("parse_seconds_total", "parse_seconds", "Time spent deserializing responses."),
+)
+
+
+class Histogram:
+    """Fixed-bucket histogram of observed values, cumulative in the Prometheus style.
+
+    ``buckets`` are the inclusive upper bounds, in increasing order; values
+    above the last bound are counted in an implicit ``+Inf`` bucket.
+    """
+
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """Create an empty histogram with the given bucket upper bounds."""
+        if not buckets or any(upper <= lower for lower, upper in zip(buckets, buckets[1:])):
+            raise ValueError("buckets must be a non-empty increasing sequence")
+
+        self.buckets = tuple(float(bound) for bound in buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Add a value to the histogram."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative_counts(self) -> list[int]:
+        """Return the number of values at or below each bound, ending with the ``+Inf`` bucket."""
+        total = 0
+        cumulative = []
+
+        for count in self.counts:
+            total += count
+            cumulative.append(total)
+
+        return cumulative
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate the ``q`` quantile (0 to 1) by interpolating within its bucket, like ``histogram_quantile``.
+
+        Returns ``None`` when nothing has been observed. Quantiles falling in
+        the ``+Inf`` bucket are reported as the largest bound.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+
+        if self.count == 0:
+            return None
+
+        rank = q * self.count
+        below = 0
+
+        for index, count in enumerate(self.counts):
+            if count and below + count >= rank:
+                if index == len(self.buckets):
+                    return self.buckets[-1]
+
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                upper = self.buckets[index]
+
+                return lower + (upper - lower) * (rank - below) / count
+
+            below += count
+
+        return self.buckets[-1]
+
+
+@dataclass
+class EndpointMetrics:
+    """Aggregated metrics for one method and endpoint.
+
+    ``requests_by_status`` is keyed by status code, or ``"error"`` for calls
+    that failed without a response. ``rate_limited`` counts 429 responses,
+    including those that were retried.
+    """
+
+    latency: Histogram
+    requests_by_status: Counter = field(default_factory=Counter)
+    request_bytes: int = 0
+    response_bytes: int = 0
+    rate_limited: int = 0
+    retries: int = 0
+    network_seconds: float = 0.0
+    parse_seconds: float = 0.0
+
+    @property
+    def requests(self) -> int:
+        """Return the total number of calls."""
+        return self.latency.count
+
+
+class MetricsCollector(RequestObserver):
+    """Observer that aggregates latency histograms, status counts and sizes per endpoint.
+
+    Pass it in a client's ``observers``; one collector may be shared by
+    several clients. Latency is the total time of each call, including
+    queueing, retries and parsing. Call ``render_prometheus`` to export the
+    metrics in the Prometheus text exposition format.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, namespace: str = DEFAULT_NAMESPACE):
+        """Create an empty collector using the given latency bucket bounds and metric name prefix."""
+        self.buckets = Histogram(buckets).buckets
+        self.namespace = namespace
+        self._endpoints: dict[tuple[str, str], EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    def on_request_end(self, timing: RequestTiming) -> None:
+        """Record a finished call."""
+        status = ERROR_STATUS if timing.status_code is None else str(timing.status_code)
+        rate_limited = timing.retry_reasons.count("429") + (timing.status_code == 429)
+
+        with self._lock:
+            metrics = self._endpoints.get((timing.method, timing.endpoint))
+
+            if metrics is None:
+                metrics = self._endpoints[(timing.method, timing.endpoint)] = EndpointMetrics(Histogram(self.buckets))
+
+            metrics.latency.observe(timing.total_seconds)
+            metrics.requests_by_status[status] += 1
+            metrics.request_bytes += timing.request_bytes
+            metrics.response_bytes += timing.response_bytes
+            metrics.rate_limited += rate_limited
+            metrics.retries += timing.retries
+            metrics.network_seconds += timing.network_seconds
+            metrics.parse_seconds += timing.parse_seconds
+
+    def endpoint(self, method: str, endpoint: str) -> EndpointMetrics | None:
+        """Return the metrics for a method and endpoint, such as ``("GET", "/Apps/id/{id}")``, if it was called."""
+        with self._lock:
+            return self._endpoints.get((method, endpoint))
+
+    def endpoints(self) -> list[tuple[str, str]]:
+        """Return the method and endpoint of every call recorded so far, sorted."""
+        with self._lock:
+            return sorted(self._endpoints)
+
+    def quantile(self, method: str, endpoint: str, q: float) -> float | None:
+        """Estimate a latency quantile in seconds for one endpoint, e.g. ``q=0.99`` for p99."""
+        with self._lock:
+            metrics = self._endpoints.get((method, endpoint))
+
+            return metrics.latency.quantile(q) if metrics is not None else None
+
+    def reset(self) -> None:
+        """Discard every recorded metric."""
+        with self._lock:
+            self._endpoints.clear()
+
+    def render_prometheus(self) -> str:
+        """Return every metric in the Prometheus text exposition format."""
+        prefix = self.namespace
+        lines: list[str] = []
+
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+
+            lines.append(f"# HELP {prefix}_request_duration_seconds Total time of each call, including retries.")
+            lines.append(f"# TYPE {prefix}_request_duration_seconds histogram")
+
+            for (method, endpoint), metrics in endpoints:
+                labels = _labels(method=method, endpoint=endpoint)
+                histogram = metrics.latency
+
+                for bound, count in zip((*histogram.buckets, math.inf), histogram.cumulative_counts()):
+                    bucket_labels = _labels(method=method, endpoint=endpoint, le=_format(bound))
+                    lines.append(f"{prefix}_request_duration_seconds_bucket{bucket_labels} {count}")
+
+                lines.append(f"{prefix}_request_duration_seconds_sum{labels} {_format(histogram.sum)}")
+                lines.append(f"{prefix}_request_duration_seconds_count{labels} {histogram.count}")
+
+            lines.append(f"# HELP {prefix}_requests_total Calls by final status code.")
+            lines.append(f"# TYPE {prefix}_requests_total counter")
+
+            for (method, endpoint), metrics in endpoints:
+                for status, count in sorted(metrics.requests_by_status.items()):
+                    labels = _labels(method=method, endpoint=endpoint, status=status)
+                    lines.append(f"{prefix}_requests_total{labels} {count}")
+
+            for name, attribute, help_text in _COUNTERS:
+                lines.append(f"# HELP {prefix}_{name} {help_text}")
+                lines.append(f"# TYPE {prefix}_{name} counter")
+
+                for (method, endpoint), metrics in endpoints:
+                    labels = _labels(method=method, endpoint=endpoint)
+                    lines.append(f"{prefix}_{name}{labels} {_format(getattr(metrics, attribute))}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _format(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+
+    return repr(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
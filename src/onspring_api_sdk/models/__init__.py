@@ -10,6 +10,8 @@ from onspring_api_sdk.models.field import (
     OnspringField,
 )
 from onspring_api_sdk.models.file import (
+    DownloadedFile,
+    DownloadFileResponse,
     File,
     FileInfo,
     GetFileByIdResponse,
@@ -24,6 +26,8 @@ from onspring_api_sdk.models.record import (
     AttachmentListValue,
     DateFieldValue,
     DecimalFieldValue,
+    DeleteBatchRecordsChunkResult,
+    DeleteBatchRecordsReport,
     DeleteBatchRecordsRequest,
     FileListValue,
     GetBatchRecordsRequest,
@@ -35,6 +39,7 @@ from onspring_api_sdk.models.record import (
     GuidListValue,
     IntegerFieldValue,
     IntegerListValue,
+    LazyFieldList,
     QueryRecordsRequest,
     Record,
     RecordFieldValue,
@@ -82,6 +87,7 @@ __all__ = [
     "ScoringGroupListValue",
     "FileListValue",
     "Record",
+    "LazyFieldList",
     "GetRecordsByAppRequest",
     "QueryRecordsRequest",
     "GetRecordsResponse",
@@ -90,6 +96,8 @@ __all__ = [
     "GetBatchRecordsResponse",
     "AddOrUpdateRecordResponse",
     "DeleteBatchRecordsRequest",
+    "DeleteBatchRecordsChunkResult",
+    "DeleteBatchRecordsReport",
     "Row",
     "Report",
     "GetReportByIdRequest",
@@ -99,6 +107,8 @@ __all__ = [
     "FileInfo",
     "GetFileInfoByIdResponse",
     "GetFileByIdResponse",
+    "DownloadedFile",
+    "DownloadFileResponse",
     "SaveFileRequest",
     "SaveFileResponse",
     "ListItemRequest",
@@ -1,8 +1,9 @@
 """Shared Pydantic models for paging and generic API responses."""
 
+from datetime import timedelta
 from typing import Generic, Optional, TypeVar
 
-from httpx import Response
+from httpx import Headers, Response
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from onspring_api_sdk.errors import (
@@ -11,6 +12,7 @@ from onspring_api_sdk.errors import (
     OnspringNotFoundError,
     OnspringRateLimitError,
 )
+from onspring_api_sdk.instrumentation import RequestTiming
 
 T = TypeVar("T")
 
@@ -34,6 +36,9 @@ class ApiResponse(BaseModel, Generic[T]):
     message: Optional[str] = None
     data: Optional[T] = None
     raw_response: Optional[Response] = None
+    headers: Optional[Headers] = None
+    elapsed: Optional[timedelta] = None
+    timing: Optional[RequestTiming] = None
 
     @model_validator(mode="before")
     @classmethod
@@ -43,6 +48,31 @@ class ApiResponse(BaseModel, Generic[T]):
             data["is_successful"] = int(data["status_code"]) < 400
         return data
 
+    @model_validator(mode="after")
+    def set_response_metadata(self):
+        """Copy the headers and elapsed time from the raw response so they outlive it."""
+        if self.raw_response is not None:
+            if self.headers is None:
+                self.headers = self.raw_response.headers
+
+            if self.elapsed is None:
+                try:
+                    self.elapsed = self.raw_response.elapsed
+                except RuntimeError:
+                    pass
+
+        return self
+
+    @property
+    def network_seconds(self) -> Optional[float]:
+        """Seconds spent sending the request and receiving the response, or ``None`` if it was not timed."""
+        return self.timing.network_seconds if self.timing is not None else None
+
+    @property
+    def parse_seconds(self) -> Optional[float]:
+        """Seconds spent deserializing the response, or ``None`` if it was not timed."""
+        return self.timing.parse_seconds if self.timing is not None else None
+
     def raise_for_status(self):
         """Raise the appropriate exception if the request was not successful."""
         if not self.is_successful:
@@ -45,15 +45,35 @@ class GetFileByIdResponse(BaseModel):
     file: File
 
 
+class DownloadedFile(BaseModel):
+    """Metadata about a file that was streamed to a destination instead of loaded into memory."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    name: str
+    content_type: str = Field(alias="contentType")
+    content_length: int = Field(alias="contentLength")
+    bytes_written: int = Field(alias="bytesWritten")
+
+
+class DownloadFileResponse(BaseModel):
+    """Response describing a file written to a destination."""
+
+    file: DownloadedFile
+
+
 class SaveFileRequest(BaseModel):
-    """Request payload for uploading a file to a record field."""
+    """Request payload for uploading a file to a record field.
+
+    ``file_path`` may be omitted when the content is passed to ``save_file`` directly.
+    """
 
     model_config = ConfigDict(populate_by_name=True)
 
     record_id: int = Field(alias="recordId")
     field_id: int = Field(alias="fieldId")
     file_name: str = Field(alias="fileName")
-    file_path: str = Field(alias="filePath")
+    file_path: Optional[str] = Field(default=None, alias="filePath")
     content_type: str = Field(alias="contentType")
     notes: Optional[str] = None
     modified_date: Optional[datetime] = Field(default=None, alias="modifiedDate")
@@ -1,11 +1,24 @@
 """Pydantic models for Onspring record data, requests, and responses."""
 
 import uuid
+from collections.abc import Iterator, Mapping, Sequence
 from datetime import datetime
 from decimal import Decimal
-from typing import Annotated, Literal, Optional, Union
-
-from pydantic import BaseModel, ConfigDict, Field, Tag
+from typing import Annotated, Any, Literal, Optional, Union, overload
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    SerializerFunctionWrapHandler,
+    Tag,
+    TypeAdapter,
+    ValidationInfo,
+    ValidatorFunctionWrapHandler,
+    field_serializer,
+    field_validator,
+)
 
 from onspring_api_sdk.enums import DataFormat
 
@@ -158,8 +171,135 @@ FieldValue = Annotated[
 ]
 
 
+LAZY_FIELDS = "lazy_fields"
+
+_FIELD_VALUE_ADAPTER: TypeAdapter[FieldValue] = TypeAdapter(FieldValue)
+
+
+class LazyFieldList(Sequence[FieldValue]):
+    """Read-only sequence of field values that are validated the first time each one is accessed.
+
+    Holds the raw ``fieldData`` entries of a record so that reading a few
+    fields of a wide record does not pay for parsing all of them. Iterating,
+    indexing and ``len`` behave like the list of field values it stands in
+    for, and an entry that fails validation raises when it is accessed.
+    """
+
+    __slots__ = ("_raw", "_values")
+
+    def __init__(self, raw: list[Any]):
+        """Wrap the raw field data entries of a record."""
+        self._raw = raw
+        self._values: list[FieldValue | None] = [None] * len(raw)
+
+    def __len__(self) -> int:
+        """Return the number of field values."""
+        return len(self._raw)
+
+    @overload
+    def __getitem__(self, index: int) -> FieldValue: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[FieldValue]: ...
+
+    def __getitem__(self, index: int | slice) -> FieldValue | list[FieldValue]:
+        """Return the field value at ``index``, validating it if it has not been accessed yet."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        value = self._values[index]
+
+        if value is None:
+            value = _FIELD_VALUE_ADAPTER.validate_python(self._raw[index])
+            self._values[index] = value
+
+        return value
+
+    def __iter__(self) -> Iterator[FieldValue]:
+        """Yield each field value in order."""
+        for index in range(len(self)):
+            yield self[index]
+
+    def __eq__(self, other: object) -> bool:
+        """Compare equal to another sequence holding the same field values."""
+        if isinstance(other, (LazyFieldList, list)):
+            return list(self) == list(other)
+
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return a representation listing every field value."""
+        return f"{type(self).__name__}({list(self)!r})"
+
+    @property
+    def materialized_count(self) -> int:
+        """Number of field values validated so far."""
+        return sum(value is not None for value in self._values)
+
+    def iter_entries(self) -> Iterator[tuple[Any, Any, Any]]:
+        """Yield ``(field_id, type, value)`` for each entry, without validating values not yet accessed.
+
+        Values that have been accessed are yielded typed. The rest are yielded
+        as they appeared in the JSON.
+        """
+        for index, value in enumerate(self._values):
+            if value is None:
+                raw = self._raw[index]
+
+                if isinstance(raw, dict) and "fieldId" in raw and "type" in raw:
+                    yield raw["fieldId"], raw["type"], raw.get("value")
+                    continue
+
+                value = self[index]
+
+            yield value.field_id, value.type, value.value
+
+    def field_id_at(self, index: int) -> Any:
+        """Return the field ID of the entry at ``index`` without validating its value when possible."""
+        value = self._values[index]
+
+        if value is not None:
+            return value.field_id
+
+        raw = self._raw[index]
+
+        if isinstance(raw, dict) and "fieldId" in raw:
+            return raw["fieldId"]
+
+        return self[index].field_id
+
+
+class _FieldMap(Mapping[int, FieldValue]):
+    """Read-only view of a record's field values keyed by field ID."""
+
+    __slots__ = ("_record",)
+
+    def __init__(self, record: "Record"):
+        self._record = record
+
+    def __getitem__(self, field_id: int) -> FieldValue:
+        return self._record[field_id]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._record._get_field_index())
+
+    def __len__(self) -> int:
+        return len(self._record._get_field_index())
+
+
 class Record(BaseModel):
-    """A record containing typed field values for a specific app."""
+    """A record containing typed field values for a specific app.
+
+    When validated with ``context={"lazy_fields": True}``,
+    ``fields`` is a ``LazyFieldList`` that validates each value on access.
+
+    Field values can be looked up by field ID with ``record[field_id]``,
+    ``record.get(field_id)`` or ``record.field_map``. These share an index
+    built on first use and rebuilt when ``fields`` is reassigned or changes
+    length. When a field ID appears more than once, the last entry wins.
+    """
 
     model_config = ConfigDict(populate_by_name=True)
 
@@ -167,6 +307,82 @@ class Record(BaseModel):
     record_id: Optional[int] = Field(default=None, alias="recordId")
     fields: list[FieldValue] = Field(default_factory=list, alias="fieldData")
 
+    _field_index: Optional[tuple[Sequence[FieldValue], int, dict[int, int]]] = PrivateAttr(default=None)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare field data only, ignoring the lookup index."""
+        if type(other) is not type(self):
+            return NotImplemented
+
+        return self.__dict__ == other.__dict__
+
+    def __getitem__(self, field_id: int) -> FieldValue:
+        """Return the value of the field with ``field_id``, raising ``KeyError`` if the record has none."""
+        index = self._get_field_index().get(field_id)
+
+        if index is not None:
+            value = self.fields[index]
+
+            if value.field_id == field_id:
+                return value
+
+        index = self._get_field_index(rebuild=True).get(field_id)
+
+        if index is None:
+            raise KeyError(field_id)
+
+        return self.fields[index]
+
+    def get(self, field_id: int, default: Any = None) -> Any:
+        """Return the value of the field with ``field_id``, or ``default`` if the record has none."""
+        try:
+            return self[field_id]
+        except KeyError:
+            return default
+
+    def iter_entries(self) -> Iterator[tuple[Any, Any, Any]]:
+        """Yield ``(field_id, type, value)`` for each field.
+
+        Values of a lazily parsed record that have not been accessed are
+        yielded as they appeared in the JSON, without validating them.
+        """
+        if isinstance(self.fields, LazyFieldList):
+            return self.fields.iter_entries()
+
+        return ((field.field_id, field.type, field.value) for field in self.fields)
+
+    @property
+    def field_map(self) -> Mapping[int, FieldValue]:
+        """Read-only mapping of field ID to field value backed by the record's lookup index."""
+        return _FieldMap(self)
+
+    def _get_field_index(self, rebuild: bool = False) -> dict[int, int]:
+        fields = self.fields
+        cached = self._field_index
+
+        if not rebuild and cached is not None and cached[0] is fields and cached[1] == len(fields):
+            return cached[2]
+
+        if isinstance(fields, LazyFieldList):
+            index = {fields.field_id_at(i): i for i in range(len(fields))}
+        else:
+            index = {field.field_id: i for i, field in enumerate(fields)}
+
+        self._field_index = (fields, len(fields), index)
+        return index
+
+    @field_validator("fields", mode="wrap")
+    @classmethod
+    def _defer_field_values(cls, value: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo) -> Any:
+        if info.context and info.context.get(LAZY_FIELDS) and isinstance(value, list):
+            return LazyFieldList(value)
+
+        return handler(value)
+
+    @field_serializer("fields", mode="wrap")
+    def _serialize_field_values(self, value: Any, handler: SerializerFunctionWrapHandler) -> Any:
+        return handler(list(value) if isinstance(value, LazyFieldList) else value)
+
 
 class GetRecordsByAppRequest(BaseModel):
     """Request parameters for fetching records by app ID."""
@@ -245,6 +461,31 @@ class GetBatchRecordsResponse(BaseModel):
     records: list[Record] = Field(alias="items")
 
 
+class DeleteBatchRecordsChunkResult(BaseModel):
+    """Outcome of deleting one chunk of a batch delete."""
+
+    record_ids: list[int]
+    status_code: int
+    is_successful: bool
+    message: Optional[str] = None
+
+
+class DeleteBatchRecordsReport(BaseModel):
+    """Per-chunk outcome of a batch delete that was split into several requests."""
+
+    chunks: list[DeleteBatchRecordsChunkResult] = Field(default_factory=list)
+
+    @property
+    def deleted_record_ids(self) -> list[int]:
+        """IDs from every chunk that was deleted successfully."""
+        return [record_id for chunk in self.chunks if chunk.is_successful for record_id in chunk.record_ids]
+
+    @property
+    def failed_record_ids(self) -> list[int]:
+        """IDs from every chunk whose request failed."""
+        return [record_id for chunk in self.chunks if not chunk.is_successful for record_id in chunk.record_ids]
+
+
 class AddOrUpdateRecordResponse(BaseModel):
     """Response containing the ID and warnings from an add/update operation."""
 
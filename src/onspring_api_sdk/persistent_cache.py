@@ -0,0 +1,183 @@
+"""SQLite-backed metadata cache that survives restarts."""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Hashable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from pydantic import BaseModel, ValidationError
+
+from onspring_api_sdk.cache import DEFAULT_MAX_ENTRIES, DEFAULT_TTL, MetadataCache
+from onspring_api_sdk.models import (
+    App,
+    GetFieldsByAppIdResponse,
+    GetReportsByAppIdResponse,
+    OnspringField,
+    PagingRequest,
+)
+
+DEFAULT_VERSION = "1"
+
+SCHEMA_VERSION = 1
+
+_MODELS: dict[str, type[BaseModel]] = {
+    "app": App,
+    "field": OnspringField,
+    "fields_by_app": GetFieldsByAppIdResponse,
+    "reports_by_app": GetReportsByAppIdResponse,
+}
+
+
+def _kind(key: Hashable) -> str | None:
+    kind = key[0] if isinstance(key, tuple) and key else None
+
+    return kind if kind in _MODELS else None
+
+
+class PersistentMetadataCache(MetadataCache):
+    """Metadata cache that also writes apps, fields and pages of fields and reports to a SQLite file.
+
+    Opening the cache loads the entries stored by earlier runs, so a new
+    client starts warm. Entries keep their age across runs: they are fresh
+    for ``ttl`` seconds after they were fetched and then served as stale for
+    up to ``stale_ttl`` more, until ``revalidate`` or ``arevalidate``
+    refreshes them. Nothing is refreshed automatically, so pass ``stale_ttl``
+    only when something calls one of them. Entries written with
+    a different ``version`` are discarded, so bump it to drop everything
+    stored by older code. Other keys are cached in memory only.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        stale_ttl: float = 0.0,
+        version: str = DEFAULT_VERSION,
+    ):
+        """Open or create the cache file at ``path`` and load its unexpired entries."""
+        super().__init__(ttl=ttl, max_entries=max_entries, stale_ttl=stale_ttl)
+
+        self.path = path
+        self.version = version
+        self.loaded = 0
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db_lock = threading.Lock()
+        self._batch_depth = 0
+        self._closed = False
+
+        with self._db_lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+
+            if self._connection.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                self._connection.execute("DROP TABLE IF EXISTS entries")
+                self._connection.execute(
+                    "CREATE TABLE entries (key TEXT PRIMARY KEY, version TEXT NOT NULL, "
+                    "stored_at REAL NOT NULL, value TEXT NOT NULL)"
+                )
+                self._connection.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+        self._load()
+
+    def close(self) -> None:
+        """Close the cache file. Entries stay available in memory but are no longer written to disk."""
+        with self._db_lock:
+            self._connection.close()
+            self._closed = True
+
+    def __enter__(self) -> "PersistentMetadataCache":
+        """Enter the runtime context for the cache."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Exit the runtime context and close the cache file."""
+        self.close()
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store ``value`` under ``key``, also writing it to disk if it is an app, field or page."""
+        super().set(key, value)
+
+        if _kind(key) is not None:
+            self._write(
+                "INSERT OR REPLACE INTO entries (key, version, stored_at, value) VALUES (?, ?, ?, ?)",
+                (json.dumps(key), self.version, time.time(), value.model_dump_json(by_alias=True)),
+            )
+
+    def set_fields_page(self, app_id: int, paging_request: PagingRequest, page: GetFieldsByAppIdResponse) -> None:
+        """Cache a page of fields for an app along with each field on it, writing them in one transaction."""
+        with self._batch():
+            super().set_fields_page(app_id, paging_request, page)
+
+    def clear(self) -> None:
+        """Remove every entry, from memory and from disk."""
+        super().clear()
+        self._write("DELETE FROM entries", ())
+
+    def _delete(self, key: Hashable) -> None:
+        super()._delete(key)
+
+        if _kind(key) is not None:
+            self._write("DELETE FROM entries WHERE key = ?", (json.dumps(key),))
+
+    def _load(self) -> None:
+        """Read the newest ``max_entries`` entries that have not outlived ``ttl`` plus ``stale_ttl``."""
+        oldest = time.time() - self.ttl - self.stale_ttl
+
+        with self._db_lock:
+            self._connection.execute("DELETE FROM entries WHERE version != ? OR stored_at <= ?", (self.version, oldest))
+            rows = self._connection.execute(
+                "SELECT key, stored_at, value FROM entries ORDER BY stored_at DESC LIMIT ?", (self.max_entries,)
+            ).fetchall()
+
+        invalid = []
+        offset = time.monotonic() - time.time()
+
+        with self._lock:
+            for raw_key, stored_at, raw_value in reversed(rows):
+                key = tuple(json.loads(raw_key))
+                kind = _kind(key)
+
+                try:
+                    value = _MODELS[kind].model_validate_json(raw_value) if kind is not None else None
+                except ValidationError:
+                    value = None
+
+                if value is None:
+                    invalid.append(raw_key)
+                    continue
+
+                self._entries[key] = (stored_at + offset + self.ttl, value)
+                self.loaded += 1
+
+        if invalid:
+            self._write_many("DELETE FROM entries WHERE key = ?", [(raw_key,) for raw_key in invalid])
+
+    @contextmanager
+    def _batch(self) -> Iterator[None]:
+        with self._db_lock:
+            if self._batch_depth == 0 and not self._closed:
+                self._connection.execute("BEGIN")
+
+            self._batch_depth += 1
+
+        try:
+            yield
+        finally:
+            with self._db_lock:
+                self._batch_depth -= 1
+
+                if self._batch_depth == 0 and not self._closed:
+                    self._connection.execute("COMMIT")
+
+    def _write(self, sql: str, parameters: tuple) -> None:
+        self._write_many(sql, [parameters])
+
+    def _write_many(self, sql: str, parameters: list[tuple]) -> None:
+        with self._db_lock:
+            if not self._closed:
+                self._connection.executemany(sql, parameters)
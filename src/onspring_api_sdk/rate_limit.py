@@ -0,0 +1,67 @@
+"""Client-side token-bucket rate limiting for Onspring API requests."""
+
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    """Token bucket that paces requests to ``rate`` per second with bursts of up to ``burst``.
+
+    A single limiter can be shared by any number of threads, coroutines and
+    clients. Each request reserves a token under a lock and then waits outside
+    of it, so callers are released in the order they arrived without holding
+    the lock while sleeping.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """Create a limiter allowing ``rate`` requests per second and bursts of ``burst`` requests."""
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.rate = rate
+        self.burst = burst
+        self.requests = 0
+        self.delayed_requests = 0
+        self.wait_seconds = 0.0
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token and return how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+            self.requests += 1
+
+            if delay > 0:
+                self.delayed_requests += 1
+                self.wait_seconds += delay
+
+            return delay
+
+    def acquire(self) -> float:
+        """Block the current thread until a request may be sent and return the seconds waited."""
+        delay = self._reserve()
+
+        if delay > 0:
+            time.sleep(delay)
+
+        return delay
+
+    async def acquire_async(self) -> float:
+        """Suspend the current coroutine until a request may be sent and return the seconds waited."""
+        delay = self._reserve()
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        return delay
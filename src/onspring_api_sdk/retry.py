@@ -0,0 +1,119 @@
+"""Retry policy and statistics for transient Onspring API failures."""
+
+import random
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+DEFAULT_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+DEFAULT_RETRY_EXCEPTIONS = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given either as seconds or as an HTTP date."""
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Controls how the clients retry idempotent requests that fail transiently.
+
+    Only reads are retried: every ``GET`` request, plus the reads sent as
+    ``POST`` by ``get_apps_by_ids``, ``get_fields_by_ids``,
+    ``get_records_by_ids`` and ``query_records``. Requests that change data,
+    such as saving files or records and deleting anything, are never retried.
+    Delays use full-jitter exponential backoff, so concurrent workers spread
+    their retries out instead of retrying in lockstep. A ``Retry-After``
+    header on the response takes precedence over the computed delay and is
+    waited out in full; when it asks for more than ``max_retry_after``
+    seconds the response is returned instead of being retried early.
+    """
+
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    retry_statuses: frozenset[int] = DEFAULT_RETRY_STATUSES
+    retry_exceptions: tuple[type[Exception], ...] = DEFAULT_RETRY_EXCEPTIONS
+    respect_retry_after: bool = True
+    max_retry_after: float = 120.0
+
+    def should_retry_response(self, response: httpx.Response) -> bool:
+        """Return whether the response status is considered transient and any ``Retry-After`` can be waited out."""
+        if response.status_code not in self.retry_statuses:
+            return False
+
+        retry_after = self._retry_after(response)
+
+        return retry_after is None or retry_after <= self.max_retry_after
+
+    def should_retry_error(self, error: Exception) -> bool:
+        """Return whether the transport error is considered transient."""
+        return isinstance(error, self.retry_exceptions)
+
+    def get_delay(self, attempt: int, response: httpx.Response | None = None) -> float:
+        """Return the number of seconds to wait before the given retry attempt (starting at 0)."""
+        retry_after = self._retry_after(response) if response is not None else None
+
+        if retry_after is not None:
+            return retry_after
+
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    def _retry_after(self, response: httpx.Response) -> float | None:
+        if not self.respect_retry_after:
+            return None
+
+        return _parse_retry_after(response.headers.get("retry-after"))
+
+
+@dataclass
+class RetryStats:
+    """Thread-safe counters describing every attempt a client has made.
+
+    ``retries_by_reason`` is keyed by status code (e.g. ``"429"``) or by the
+    name of the transport error that triggered the retry.
+    """
+
+    attempts: int = 0
+    retries: int = 0
+    exhausted: int = 0
+    backoff_seconds: float = 0.0
+    retries_by_reason: Counter = field(default_factory=Counter)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    def record_attempt(self) -> None:
+        """Record that a request attempt was sent."""
+        with self._lock:
+            self.attempts += 1
+
+    def record_retry(self, reason: str, delay: float) -> None:
+        """Record that an attempt failed transiently and will be retried after ``delay`` seconds."""
+        with self._lock:
+            self.retries += 1
+            self.backoff_seconds += delay
+            self.retries_by_reason[reason] += 1
+
+    def record_exhausted(self) -> None:
+        """Record that a request still failed after its last allowed retry."""
+        with self._lock:
+            self.exhausted += 1
@@ -0,0 +1,395 @@
+"""Compact columnar storage for records and reports."""
+
+import re
+from array import array
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from itertools import zip_longest
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from onspring_api_sdk.export import TextDestination, write_csv, write_jsonl
+from onspring_api_sdk.models import (
+    AttachmentListValue,
+    DateFieldValue,
+    DecimalFieldValue,
+    FileListValue,
+    GetReportByIdResponse,
+    GuidFieldValue,
+    GuidListValue,
+    IntegerFieldValue,
+    IntegerListValue,
+    Record,
+    ScoringGroupListValue,
+    StringFieldValue,
+    StringListValue,
+    TimeSpanValue,
+)
+
+_ARRAY_TYPECODES = {"Integer": "q", "Decimal": "d", "Date": "q"}
+
+_VALUE_ADAPTERS: dict[str, TypeAdapter[Any]] = {
+    model.model_fields["type"].default: TypeAdapter(model.model_fields["value"].annotation)
+    for model in (
+        StringFieldValue,
+        IntegerFieldValue,
+        DecimalFieldValue,
+        DateFieldValue,
+        GuidFieldValue,
+        TimeSpanValue,
+        StringListValue,
+        IntegerListValue,
+        GuidListValue,
+        AttachmentListValue,
+        ScoringGroupListValue,
+        FileListValue,
+    )
+}
+
+_ISO_DATETIME = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}")
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+class Column:
+    """Values of one field across every row of a ``RecordTable``.
+
+    ``Integer`` columns are stored in an ``array`` of 64-bit integers,
+    ``Decimal`` columns in an ``array`` of doubles and ``Date`` columns in an
+    ``array`` of microseconds since the Unix epoch. Other field types are kept
+    in a list of their typed values, and a column without a type holds values
+    as they are. An ``Integer`` column switches to a list once it holds a
+    value that does not fit in 64 bits. Missing values are tracked in
+    ``present``, a ``bytearray`` holding 1 for each row that has a value.
+    Reading a value converts it back to the type a ``Record`` would hold,
+    with naive dates taken as UTC.
+    """
+
+    __slots__ = ("field_id", "type", "values", "present")
+
+    def __init__(self, field_id: int | None, type: str | None):
+        """Create an empty column for a field of the given Onspring field type."""
+        if type is not None and type not in _VALUE_ADAPTERS:
+            raise ValueError(f"Unsupported field type: {type}")
+
+        typecode = _ARRAY_TYPECODES.get(type)
+
+        self.field_id = field_id
+        self.type = type
+        self.values: array | list[Any] = array(typecode) if typecode else []
+        self.present = bytearray()
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.present)
+
+    def __getitem__(self, index: int | slice) -> Any:
+        """Return the value at ``index``, or a new column holding the rows in a slice."""
+        if isinstance(index, slice):
+            column = Column(self.field_id, self.type)
+            column.values = self.values[index]
+            column.present = self.present[index]
+            return column
+
+        if not self.present[index]:
+            return None
+
+        return self._decode(self.values[index])
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yield each value in row order, with ``None`` for missing values."""
+        for index in range(len(self)):
+            yield self[index]
+
+    def __repr__(self) -> str:
+        """Return a summary of the column."""
+        return f"Column(field_id={self.field_id!r}, type={self.type!r}, length={len(self)})"
+
+    def to_list(self) -> list[Any]:
+        """Return every value as a list, with ``None`` for missing values."""
+        return list(self)
+
+    def append(self, value: Any) -> None:
+        """Append a raw JSON or typed value, or ``None`` for a missing value."""
+        if value is None:
+            self.values.append(0 if isinstance(self.values, array) else None)
+            self.present.append(0)
+            return
+
+        value = self._encode(value)
+
+        try:
+            self.values.append(value)
+        except OverflowError:
+            self.values = list(self.values)
+            self.values.append(value)
+
+        self.present.append(1)
+
+    def extend(self, values: Iterable[Any]) -> None:
+        """Append each value."""
+        for value in values:
+            self.append(value)
+
+    def _encode(self, value: Any) -> Any:
+        if self.type is None:
+            return value
+
+        if self.type == "Integer":
+            return value if type(value) is int else _VALUE_ADAPTERS["Integer"].validate_python(value)
+
+        if self.type == "Decimal":
+            if not isinstance(value, (int, float)):
+                value = _VALUE_ADAPTERS["Decimal"].validate_python(value)
+
+            return float(value)
+
+        if self.type == "Date":
+            if not isinstance(value, datetime):
+                value = _VALUE_ADAPTERS["Date"].validate_python(value)
+
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=timezone.utc)
+
+            return (value - _EPOCH) // _MICROSECOND
+
+        if self.type == "String" and type(value) is str:
+            return value
+
+        return _VALUE_ADAPTERS[self.type].validate_python(value)
+
+    def _decode(self, value: Any) -> Any:
+        if self.type == "Decimal":
+            return Decimal(repr(value))
+
+        if self.type == "Date":
+            return _EPOCH + value * _MICROSECOND
+
+        return value
+
+
+class RecordTable:
+    """Records stored as one typed column per field ID instead of one object per record.
+
+    Record IDs are kept in their own ``record_ids`` column. Every column has
+    one entry per row, with missing values for fields a record does not have.
+    Appending records parsed with ``ParseMode.Lazy`` reads their raw field
+    data directly, so no field value objects are built along the way.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty table."""
+        self.app_id: int | None = None
+        self.record_ids = Column(None, "Integer")
+        self.columns: dict[int, Column] = {}
+
+    @classmethod
+    def from_records(cls, records: Iterable[Record]) -> "RecordTable":
+        """Build a table from records."""
+        table = cls()
+        table.extend(records)
+        return table
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.record_ids)
+
+    def __getitem__(self, field_id: int) -> Column:
+        """Return the column for ``field_id``, raising ``KeyError`` if no record has the field."""
+        return self.columns[field_id]
+
+    def __contains__(self, field_id: object) -> bool:
+        """Return whether the table has a column for ``field_id``."""
+        return field_id in self.columns
+
+    def __repr__(self) -> str:
+        """Return a summary of the table."""
+        return f"RecordTable(app_id={self.app_id!r}, rows={len(self)}, columns={len(self.columns)})"
+
+    @property
+    def field_ids(self) -> list[int]:
+        """IDs of the fields with a column, in the order they were first seen."""
+        return list(self.columns)
+
+    def append(self, record: Record) -> None:
+        """Add a record as a new row."""
+        row = len(self)
+
+        if self.app_id is None:
+            self.app_id = record.app_id
+
+        self.record_ids.append(record.record_id)
+
+        for field_id, field_type, value in record.iter_entries():
+            column = self.columns.get(field_id)
+
+            if column is None:
+                column = Column(field_id, field_type)
+
+                for _ in range(row):
+                    column.append(None)
+
+                self.columns[field_id] = column
+            elif column.type != field_type:
+                raise ValueError(f"Field {field_id} has values of type {column.type} and {field_type}")
+
+            if len(column) > row:
+                del column.values[row:]
+                del column.present[row:]
+
+            column.append(value)
+
+        for column in self.columns.values():
+            if len(column) == row:
+                column.append(None)
+
+    def extend(self, records: Iterable[Record]) -> None:
+        """Add each record as a new row."""
+        for record in records:
+            self.append(record)
+
+    def select(self, field_ids: Iterable[int]) -> "RecordTable":
+        """Return a copy of the table holding only the given columns."""
+        return self._copy(slice(None), field_ids)
+
+    def slice(self, start: int | None = None, stop: int | None = None) -> "RecordTable":
+        """Return a copy of the table holding only the rows from ``start`` up to ``stop``."""
+        return self._copy(slice(start, stop), self.columns)
+
+    def to_dict(self) -> dict[int, list[Any]]:
+        """Return each column as a list keyed by field ID."""
+        return {field_id: column.to_list() for field_id, column in self.columns.items()}
+
+    def _copy(self, rows: slice, field_ids: Iterable[int]) -> "RecordTable":
+        table = RecordTable()
+        table.app_id = self.app_id
+        table.record_ids = self.record_ids[rows]
+        table.columns = {field_id: self.columns[field_id][rows] for field_id in field_ids}
+        return table
+
+
+class ReportTable:
+    """Report data stored as one column per report column instead of one object per row.
+
+    Each column's type is inferred from its cells. Columns holding only
+    integers are stored as ``Integer``, only numbers as ``Decimal``, only
+    ISO 8601 date strings as ``Date`` and only other strings as ``String``.
+    Anything else is kept untyped. Record IDs are kept in their own
+    ``record_ids`` column.
+    """
+
+    def __init__(self, columns: dict[str, Column], record_ids: Column):
+        """Create a table from columns keyed by report column name."""
+        self.columns = columns
+        self.record_ids = record_ids
+
+    @classmethod
+    def from_report(cls, report: GetReportByIdResponse | Mapping[str, Any]) -> "ReportTable":
+        """Transpose a report into columns.
+
+        Accepts a parsed report or its decoded JSON, as returned by
+        ``get_report_by_id`` with ``ParseMode.Json``. Building from the JSON
+        skips creating a ``Row`` for every row of the report.
+        """
+        if isinstance(report, GetReportByIdResponse):
+            names = report.columns
+            record_ids = [row.record_id for row in report.rows]
+            cells = [row.cells for row in report.rows]
+        else:
+            names = report["columns"]
+            record_ids = [row.get("recordId") for row in report["rows"]]
+            cells = [row["cells"] for row in report["rows"]]
+
+        record_id_column = Column(None, "Integer")
+        record_id_column.extend(record_ids)
+
+        values_by_column = list(zip_longest(*cells))
+        columns = {}
+
+        for index, name in enumerate(names):
+            values = values_by_column[index] if index < len(values_by_column) else (None,) * len(cells)
+            columns[name] = _build_column(values)
+
+        return cls(columns, record_id_column)
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.record_ids)
+
+    def __getitem__(self, name: str) -> Column:
+        """Return the column named ``name``, raising ``KeyError`` if the report has none."""
+        return self.columns[name]
+
+    def __contains__(self, name: object) -> bool:
+        """Return whether the report has a column named ``name``."""
+        return name in self.columns
+
+    def __repr__(self) -> str:
+        """Return a summary of the table."""
+        return f"ReportTable(rows={len(self)}, columns={list(self.columns)!r})"
+
+    @property
+    def column_names(self) -> list[str]:
+        """Names of the report's columns in order."""
+        return list(self.columns)
+
+    def iter_rows(self) -> Iterator[tuple[Any, ...]]:
+        """Yield each row's values in column order, without its record ID."""
+        return zip(*self.columns.values())
+
+    def to_dict(self) -> dict[str, list[Any]]:
+        """Return each column as a list keyed by name."""
+        return {name: column.to_list() for name, column in self.columns.items()}
+
+    def to_csv(self, destination: TextDestination, include_record_id: bool = False) -> int:
+        """Write the report as CSV and return the number of rows written."""
+        return write_csv(destination, *self._export_rows(include_record_id))
+
+    def to_jsonl(self, destination: TextDestination, include_record_id: bool = False) -> int:
+        """Write the report as JSON Lines and return the number of rows written."""
+        return write_jsonl(destination, *self._export_rows(include_record_id))
+
+    def _export_rows(self, include_record_id: bool) -> tuple[list[str], Iterator[tuple[Any, ...]]]:
+        if include_record_id:
+            return ["recordId", *self.columns], zip(self.record_ids, *self.columns.values())
+
+        return self.column_names, self.iter_rows()
+
+
+def _build_column(values: Sequence[Any]) -> Column:
+    column = Column(None, _infer_type(values))
+
+    try:
+        column.extend(values)
+    except ValueError:
+        if column.type != "Date":
+            raise
+
+        column = Column(None, "String")
+        column.extend(values)
+
+    return column
+
+
+def _infer_type(values: Iterable[Any]) -> str | None:
+    kinds = {type(value) for value in values if value is not None}
+
+    if not kinds:
+        return None
+
+    if kinds == {int}:
+        return "Integer"
+
+    if kinds <= {int, float}:
+        return "Decimal"
+
+    if kinds == {str}:
+        if all(_ISO_DATETIME.match(value) for value in values if value is not None):
+            return "Date"
+
+        return "String"
+
+    return None
@@ -1,6 +1,10 @@
+import json
+from email.parser import BytesParser
+from email.policy import HTTP
 from pathlib import Path
 
 import pytest
+from httpx import Request, Response
 
 from onspring_api_sdk import AsyncOnspringClient, OnspringClient
 
@@ -120,6 +124,53 @@ MOCK_RECORDS_RESPONSE = {
     "items": [MOCK_RECORD],
 }
 
+
+def paged_side_effect(page: dict, total_pages: int):
+    def _side_effect(request):
+        page_number = int(request.url.params.get("pageNumber", 1))
+        return Response(200, json={**page, "pageNumber": page_number, "totalPages": total_pages})
+
+    return _side_effect
+
+
+def make_records_page(page_number: int, total_pages: int, page_size: int = 2) -> dict:
+    first_id = (page_number - 1) * page_size + 1
+
+    return {
+        "pageNumber": page_number,
+        "pageSize": page_size,
+        "totalPages": total_pages,
+        "totalRecords": total_pages * page_size,
+        "items": [{**MOCK_RECORD, "recordId": record_id} for record_id in range(first_id, first_id + page_size)],
+    }
+
+
+def records_page_side_effect(total_pages: int, page_size: int = 2):
+    def _side_effect(request):
+        page_number = int(request.url.params.get("pageNumber", 1))
+        return Response(200, json=make_records_page(page_number, total_pages, page_size))
+
+    return _side_effect
+
+
+def batch_records_side_effect(failing_ids: tuple[int, ...] = (), status: int = 200):
+    """Answer batch-get or batch-delete requests, failing any chunk that contains one of ``failing_ids``."""
+
+    def _side_effect(request):
+        record_ids = json.loads(request.content)["recordIds"]
+
+        if set(record_ids) & set(failing_ids):
+            return Response(400)
+
+        if status == 204:
+            return Response(204)
+
+        items = [{**MOCK_RECORD, "recordId": record_id} for record_id in record_ids]
+        return Response(200, json={"count": len(items), "items": items})
+
+    return _side_effect
+
+
 MOCK_RECORDS_BATCH_RESPONSE = {
     "count": 1,
     "items": [MOCK_RECORD],
@@ -174,3 +225,18 @@ def create_temp_file(name: str = "test.txt", content: bytes = b"Hello World!") -
     path = TEMP_DIR / name
     path.write_bytes(content)
     return path
+
+
+def parse_multipart(request: Request) -> dict[str, tuple[str | None, str, bytes]]:
+    """Parse a multipart request body into ``{name: (filename, content_type, content)}``."""
+    header = f"Content-Type: {request.headers['content-type']}\r\n\r\n".encode()
+    message = BytesParser(policy=HTTP).parsebytes(header + request.content)
+
+    return {
+        part.get_param("name", header="content-disposition"): (
+            part.get_filename(),
+            part.get_content_type(),
+            part.get_payload(decode=True),
+        )
+        for part in message.iter_parts()
+    }
@@ -0,0 +1,107 @@
+import time
+
+import pytest
+
+from onspring_api_sdk.cache import MetadataCache
+from onspring_api_sdk.models import App, GetFieldsByAppIdResponse, OnspringField, PagingRequest
+
+from .conftest import MOCK_APP, MOCK_FIELD, MOCK_FIELDS_RESPONSE, MOCK_LIST_FIELD
+
+
+class TestMetadataCache:
+    @pytest.mark.parametrize("ttl, max_entries, stale_ttl", [(0, 1, 0), (1, 0, 0), (1, 1, -1)])
+    def test_invalid_arguments(self, ttl, max_entries, stale_ttl):
+        with pytest.raises(ValueError):
+            MetadataCache(ttl=ttl, max_entries=max_entries, stale_ttl=stale_ttl)
+
+    def test_get_and_set(self):
+        cache = MetadataCache()
+
+        assert cache.get("key") is None
+
+        cache.set("key", "value")
+
+        assert cache.get("key") == "value"
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_entries_expire(self):
+        cache = MetadataCache(ttl=0.01)
+        cache.set("key", "value")
+
+        time.sleep(0.02)
+
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_stale_entries_are_served(self):
+        cache = MetadataCache(ttl=0.01, stale_ttl=60)
+        cache.set("key", "value")
+
+        time.sleep(0.02)
+
+        assert cache.get("key") == "value"
+        assert cache.stale_hits == 1
+
+    def test_evicts_least_recently_used(self):
+        cache = MetadataCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        assert cache.evictions == 1
+
+    def test_fields_page_caches_each_field(self):
+        cache = MetadataCache()
+        page = GetFieldsByAppIdResponse.model_validate(MOCK_FIELDS_RESPONSE)
+
+        cache.set_fields_page(10, PagingRequest(), page)
+
+        assert cache.get_fields_page(10, PagingRequest()) is page
+        assert cache.get_fields_page(10, PagingRequest(page_number=2)) is None
+        assert cache.get_field(1).name == "Test Field"
+        assert cache.get_field(2).name == "List Field"
+
+    def test_invalidate_app(self):
+        cache = MetadataCache()
+        cache.set_app(App.model_validate(MOCK_APP))
+        cache.set_fields_page(10, PagingRequest(), GetFieldsByAppIdResponse.model_validate(MOCK_FIELDS_RESPONSE))
+        cache.set_field(OnspringField.model_validate({**MOCK_FIELD, "id": 3, "appId": 20}))
+
+        cache.invalidate_app(10)
+
+        assert cache.get_fields_page(10, PagingRequest()) is None
+        assert cache.get_field(1) is None
+        assert cache.get_field(3) is not None
+        assert cache.get_app(1) is not None
+
+        cache.invalidate_app(1)
+
+        assert cache.get_app(1) is None
+
+    def test_invalidate_field(self):
+        cache = MetadataCache()
+        cache.set_fields_page(10, PagingRequest(), GetFieldsByAppIdResponse.model_validate(MOCK_FIELDS_RESPONSE))
+
+        cache.invalidate_field(2)
+
+        assert cache.get_field(2) is None
+        assert cache.get_field(1) is not None
+        assert cache.get_fields_page(10, PagingRequest()) is None
+
+    def test_invalidate_and_clear(self):
+        cache = MetadataCache()
+        cache.set_field(OnspringField.model_validate(MOCK_LIST_FIELD))
+        cache.set("other", 1)
+
+        cache.invalidate(("field", 2))
+
+        assert cache.get_field(2) is None
+
+        cache.clear()
+
+        assert len(cache) == 0
@@ -0,0 +1,98 @@
+import csv
+import io
+import json
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from onspring_api_sdk.export import write_csv, write_jsonl
+from onspring_api_sdk.models import TimeSpanData
+from onspring_api_sdk.table import ReportTable
+
+from .conftest import TEMP_DIR
+
+COLUMNS = ["id", "name", "amount", "created", "guid", "tags", "span"]
+ROWS = [
+    (
+        1,
+        "a",
+        Decimal("1.5"),
+        datetime(2024, 1, 2, tzinfo=timezone.utc),
+        uuid.UUID("3fa85f64-5717-4562-b3fc-2c963f66afa6"),
+        ["x", "y"],
+        TimeSpanData(quantity=1, increment="Day(s)"),
+    ),
+    (2, None, None, None, None, None, None),
+]
+
+
+class TestWriteCsv:
+    def test_writes_rows_to_path(self):
+        path = TEMP_DIR / "out.csv"
+
+        count = write_csv(path, COLUMNS, iter(ROWS))
+
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+
+        assert count == 2
+        assert rows[0] == COLUMNS
+        assert rows[1][:6] == [
+            "1",
+            "a",
+            "1.5",
+            "2024-01-02T00:00:00+00:00",
+            "3fa85f64-5717-4562-b3fc-2c963f66afa6",
+            '["x", "y"]',
+        ]
+        assert json.loads(rows[1][6])["increment"] == "Day(s)"
+        assert rows[2] == ["2", "", "", "", "", "", ""]
+
+    def test_writes_to_stream_and_leaves_it_open(self):
+        stream = io.StringIO()
+
+        write_csv(stream, ["a"], [(1,)])
+
+        assert not stream.closed
+        assert stream.getvalue().splitlines() == ["a", "1"]
+
+
+class TestWriteJsonl:
+    def test_writes_one_object_per_line(self):
+        path = TEMP_DIR / "out.jsonl"
+
+        count = write_jsonl(path, COLUMNS, iter(ROWS))
+
+        lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+        assert count == 2
+        assert lines[0]["amount"] == 1.5
+        assert lines[0]["created"] == "2024-01-02T00:00:00+00:00"
+        assert lines[0]["guid"] == "3fa85f64-5717-4562-b3fc-2c963f66afa6"
+        assert lines[0]["span"]["quantity"] == "1"
+        assert lines[1] == dict.fromkeys(COLUMNS) | {"id": 2}
+
+
+class TestReportTableExport:
+    REPORT = {
+        "columns": ["Name", "Count"],
+        "rows": [{"recordId": 1, "cells": ["a", 1]}, {"recordId": 2, "cells": ["b", None]}],
+    }
+
+    def test_to_csv(self):
+        stream = io.StringIO()
+
+        count = ReportTable.from_report(self.REPORT).to_csv(stream, include_record_id=True)
+
+        assert count == 2
+        assert stream.getvalue().splitlines() == ["recordId,Name,Count", "1,a,1", "2,b,"]
+
+    def test_to_jsonl(self):
+        stream = io.StringIO()
+
+        ReportTable.from_report(self.REPORT).to_jsonl(stream)
+
+        assert [json.loads(line) for line in stream.getvalue().splitlines()] == [
+            {"Name": "a", "Count": 1},
+            {"Name": "b", "Count": None},
+        ]
@@ -0,0 +1,145 @@
+import httpx
+import pytest
+
+from onspring_api_sdk.http_cache import PARSED_MODELS, ResponseCache
+
+URL = "https://api.onspring.com/Apps/id/1"
+
+
+def _response(status_code: int = 200, content: bytes = b"{}", url: str = URL, **headers: str) -> httpx.Response:
+    return httpx.Response(status_code, content=content, headers=headers, request=httpx.Request("GET", url))
+
+
+class TestResponseCache:
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            ResponseCache(max_bytes=0)
+
+        with pytest.raises(ValueError):
+            ResponseCache(ttl=0)
+
+    def test_miss_then_revalidate(self):
+        cache = ResponseCache()
+        request = httpx.Request("GET", URL)
+
+        assert cache.lookup(request) == (None, None)
+
+        stored = cache.store(_response(etag='"v1"'), None)
+        entry, cached = cache.lookup(request)
+
+        assert cached is None
+        assert entry.conditional_headers() == {"If-None-Match": '"v1"'}
+        assert stored.extensions[PARSED_MODELS] is entry.parsed
+
+        served = cache.store(_response(304, b""), entry)
+
+        assert served.status_code == 200
+        assert served.content == b"{}"
+        assert served.headers["etag"] == '"v1"'
+        assert served.extensions[PARSED_MODELS] is entry.parsed
+
+    def test_served_response_keeps_extensions(self):
+        cache = ResponseCache()
+        cache.store(_response(etag='"v1"'), None)
+        entry, _ = cache.lookup(httpx.Request("GET", URL))
+        not_modified = _response(304, b"")
+        not_modified.extensions["test"] = 1
+
+        assert cache.store(not_modified, entry).extensions["test"] == 1
+
+    def test_entries_without_validators_expire(self, monkeypatch: pytest.MonkeyPatch):
+        now = [100.0]
+        monkeypatch.setattr("onspring_api_sdk.http_cache.time.monotonic", lambda: now[0])
+        cache = ResponseCache(ttl=10)
+        request = httpx.Request("GET", URL)
+
+        cache.store(_response(), None)
+
+        assert cache.lookup(request)[1].content == b"{}"
+
+        now[0] = 111.0
+
+        assert cache.lookup(request) == (None, None)
+        assert len(cache) == 0
+
+    def test_responses_are_stored_per_api_key(self):
+        cache = ResponseCache()
+        response = _response()
+        response.request.headers["x-apikey"] = "a"
+
+        cache.store(response, None)
+
+        assert cache.lookup(httpx.Request("GET", URL, headers={"x-apikey": "a"}))[1] is not None
+        assert cache.lookup(httpx.Request("GET", URL, headers={"x-apikey": "b"})) == (None, None)
+
+        cache.invalidate(URL)
+
+        assert len(cache) == 0
+
+    def test_vary_headers_must_match(self):
+        cache = ResponseCache()
+        response = _response(vary="Accept-Language")
+        response.request.headers["accept-language"] = "en"
+
+        cache.store(response, None)
+
+        assert cache.lookup(httpx.Request("GET", URL, headers={"accept-language": "en"}))[1] is not None
+        assert cache.lookup(httpx.Request("GET", URL, headers={"accept-language": "fr"})) == (None, None)
+
+        cache.store(_response(url=f"{URL}?x", vary="*"), None)
+
+        assert len(cache) == 1
+
+    def test_encoding_headers_are_dropped(self):
+        cache = ResponseCache()
+        cache.store(_response(content=b"{}", etag='"v1"'), None)
+        entry, _ = cache.lookup(httpx.Request("GET", URL))
+
+        assert "content-length" not in entry.headers
+        assert "content-encoding" not in entry.headers
+
+    def test_evicts_least_recently_used_by_size(self):
+        cache = ResponseCache(max_bytes=10)
+
+        cache.store(_response(content=b"aaaa", url=f"{URL}?a", etag="a"), None)
+        cache.store(_response(content=b"bbbb", url=f"{URL}?b", etag="b"), None)
+        cache.lookup(httpx.Request("GET", f"{URL}?a"))
+        cache.store(_response(content=b"cccc", url=f"{URL}?c", etag="c"), None)
+
+        assert cache.lookup(httpx.Request("GET", f"{URL}?b")) == (None, None)
+        assert cache.lookup(httpx.Request("GET", f"{URL}?a"))[0] is not None
+        assert cache.size == 8
+        assert cache.evictions == 1
+
+    def test_oversized_and_no_store_responses_are_not_cached(self):
+        cache = ResponseCache(max_bytes=4)
+
+        cache.store(_response(content=b"too large"), None)
+        cache.store(_response(content=b"{}", url=f"{URL}?x", **{"cache-control": "no-store"}), None)
+
+        assert len(cache) == 0
+
+    @pytest.mark.parametrize(("status_code", "kept"), [(404, False), (503, True)])
+    def test_errors(self, status_code: int, kept: bool):
+        cache = ResponseCache()
+        cache.store(_response(etag='"v1"'), None)
+        entry, _ = cache.lookup(httpx.Request("GET", URL))
+
+        response = cache.store(_response(status_code, b""), entry)
+
+        assert response.status_code == status_code
+        assert (len(cache) == 1) is kept
+
+    def test_invalidate_and_clear(self):
+        cache = ResponseCache()
+        cache.store(_response(etag='"v1"'), None)
+        cache.store(_response(url=f"{URL}?x", etag='"v1"'), None)
+
+        cache.invalidate(URL)
+
+        assert len(cache) == 1
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.size == 0
@@ -0,0 +1,126 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from onspring_api_sdk.incremental import (
+    ChangeScan,
+    Checkpoint,
+    CheckpointStore,
+    FileCheckpointStore,
+    MemoryCheckpointStore,
+    modified_since_filter,
+)
+from onspring_api_sdk.models import Record
+
+from .conftest import TEMP_DIR
+
+MODIFIED = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+
+def _record(record_id: int, modified: datetime | None = MODIFIED) -> Record:
+    field_data = [{"fieldId": 1, "value": "Test Value", "type": "String"}]
+
+    if modified is not None:
+        field_data.append({"fieldId": 3, "value": modified.isoformat(), "type": "Date"})
+
+    return Record.model_validate({"appId": 100, "recordId": record_id, "fieldData": field_data})
+
+
+class TestCheckpointStores:
+    def test_subclass_must_implement_load_and_save(self):
+        class LoadOnlyStore(CheckpointStore):
+            def load(self, app_id: int) -> Checkpoint | None:
+                return None
+
+        with pytest.raises(TypeError):
+            LoadOnlyStore()
+
+    def test_memory_store(self):
+        store = MemoryCheckpointStore()
+        checkpoint = Checkpoint(MODIFIED, {1: MODIFIED})
+
+        assert store.load(100) is None
+
+        store.save(100, checkpoint)
+
+        assert store.load(100) == checkpoint
+        assert store.load(200) is None
+
+    def test_file_store_round_trip(self):
+        path = TEMP_DIR / "checkpoints.json"
+        checkpoint = Checkpoint(MODIFIED, {1: MODIFIED - timedelta(minutes=1)})
+
+        assert FileCheckpointStore(path).load(100) is None
+
+        FileCheckpointStore(path).save(100, checkpoint)
+        FileCheckpointStore(path).save(200, Checkpoint(MODIFIED))
+
+        store = FileCheckpointStore(path)
+
+        assert store.load(100) == checkpoint
+        assert store.load(200) == Checkpoint(MODIFIED)
+        assert not (TEMP_DIR / "checkpoints.json.tmp").exists()
+
+
+class TestChangeScan:
+    def test_modified_since_filter(self):
+        since = datetime(2024, 1, 2, 4, 4, 5, tzinfo=timezone(timedelta(hours=1)))
+
+        assert modified_since_filter(3, since) == "3 gt '2024-01-02T03:04:05Z'"
+        assert modified_since_filter(3, since.replace(tzinfo=None)) == "3 gt '2024-01-02T04:04:05Z'"
+
+    def test_first_pass_reads_everything(self):
+        scan = ChangeScan(3, None)
+
+        assert scan.filter() is None
+        assert scan.filter("1 eq 'a'") == "1 eq 'a'"
+
+    def test_later_passes_overlap_the_checkpoint(self):
+        scan = ChangeScan(3, Checkpoint(MODIFIED), overlap=timedelta(minutes=5))
+
+        assert scan.filter() == "3 gt '2024-01-02T02:59:05Z'"
+        assert scan.filter("1 eq 'a'") == "(1 eq 'a') and (3 gt '2024-01-02T02:59:05Z')"
+
+    def test_skips_duplicates_and_unchanged_records(self):
+        scan = ChangeScan(3, Checkpoint(MODIFIED, {1: MODIFIED, 2: MODIFIED}))
+
+        accepted = [
+            scan.accept(_record(1)),
+            scan.accept(_record(2, MODIFIED + timedelta(seconds=1))),
+            scan.accept(_record(3)),
+            scan.accept(_record(3)),
+        ]
+
+        assert accepted == [False, True, True, False]
+        assert (scan.yielded, scan.skipped) == (2, 2)
+
+    def test_checkpoint_advances_to_newest_change(self):
+        scan = ChangeScan(3, None, overlap=timedelta(minutes=5))
+
+        scan.accept(_record(1, MODIFIED - timedelta(minutes=10)))
+        scan.accept(_record(2, MODIFIED - timedelta(minutes=1)))
+        scan.accept(_record(3))
+        scan.accept(_record(4, None))
+
+        assert scan.checkpoint() == Checkpoint(MODIFIED, {2: MODIFIED - timedelta(minutes=1), 3: MODIFIED})
+
+    def test_checkpoint_is_capped_at_scan_start(self):
+        scan = ChangeScan(3, None)
+        scan.accept(_record(1, scan.started_at + timedelta(days=1)))
+
+        assert scan.checkpoint().high_water_mark == scan.started_at
+
+    def test_checkpoint_never_moves_back(self):
+        previous = Checkpoint(MODIFIED)
+        scan = ChangeScan(3, previous)
+        scan.accept(_record(1, MODIFIED - timedelta(minutes=1)))
+
+        assert scan.checkpoint().high_water_mark == MODIFIED
+
+    def test_checkpoint_unchanged_without_dated_records(self):
+        previous = Checkpoint(MODIFIED)
+        scan = ChangeScan(3, previous)
+        scan.accept(_record(1, None))
+
+        assert scan.checkpoint() is previous
+        assert ChangeScan(3, None).checkpoint() is None
@@ -0,0 +1,70 @@
+import httpx
+import pytest
+
+from onspring_api_sdk.instrumentation import _RequestTimer, endpoint_name, pop_timer
+
+
+class TestEndpointName:
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            ("https://api.onspring.com/Apps", "/Apps"),
+            ("https://api.onspring.com/Apps/id/12?x=1", "/Apps/id/{id}"),
+            (
+                "https://api.onspring.com/Files/recordId/1/fieldId/2/fileId/3/file",
+                "/Files/recordId/{id}/fieldId/{id}/fileId/{id}/file",
+            ),
+            (
+                "https://api.onspring.com/ListItems/listId/3FA85F64-5717-4562-B3FC-2C963F66AFA6/itemId/1",
+                "/ListItems/listId/{id}/itemId/{id}",
+            ),
+            ("https://api.onspring.com/Records/v2", "/Records/v2"),
+        ],
+    )
+    def test_replaces_ids(self, url: str, expected: str):
+        assert endpoint_name(url) == expected
+
+
+class TestRequestTimer:
+    def test_phases_come_from_trace_events(self, monkeypatch: pytest.MonkeyPatch):
+        clock = iter([0.0, 1.0, 1.5, 2.0, 2.5, 4.0, 4.5, 6.0, 6.0, 7.0])
+        monkeypatch.setattr("onspring_api_sdk.instrumentation.time.perf_counter", lambda: next(clock))
+
+        timer = _RequestTimer("GET", "https://api.onspring.com/Apps")
+        attempt_started = timer.begin_attempt()
+        timer.trace("connection.connect_tcp.started", {})
+        timer.trace("connection.connect_tcp.complete", {})
+        timer.trace("http11.send_request_headers.complete", {})
+        timer.trace("http11.receive_response_headers.complete", {})
+        timer.trace("http11.receive_response_body.started", {})
+        timer.trace("http11.receive_response_body.complete", {})
+        timer.end_attempt(attempt_started)
+        timing = timer.finish()
+
+        assert timing.connect_seconds == 0.5
+        assert timing.server_seconds == 1.5
+        assert timing.download_seconds == 1.5
+        assert timing.network_seconds == 5.0
+        assert timing.parse_seconds == 1.0
+        assert timing.total_seconds == 7.0
+        assert timing.status_code is None
+
+    def test_phases_are_none_without_trace_events(self):
+        timer = _RequestTimer("GET", "https://api.onspring.com/Apps")
+        timer.end_attempt(timer.begin_attempt())
+
+        timing = timer.finish()
+
+        assert timing.connect_seconds is None
+        assert timing.server_seconds is None
+        assert timing.download_seconds is None
+
+    def test_attach_and_pop(self):
+        timer = _RequestTimer("GET", "https://api.onspring.com/Apps")
+        response = httpx.Response(200)
+
+        timer.attach(response)
+
+        assert pop_timer(response) is timer
+        assert pop_timer(response) is None
+        assert pop_timer(None) is None
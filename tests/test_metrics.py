@@ -0,0 +1,147 @@
+import pytest
+
+from onspring_api_sdk.instrumentation import RequestTiming
+from onspring_api_sdk.metrics import Histogram, MetricsCollector
+
+
+def _timing(
+    endpoint: str = "/Apps/id/{id}",
+    status_code: int | None = 200,
+    total_seconds: float = 0.2,
+    retry_reasons: tuple[str, ...] = (),
+) -> RequestTiming:
+    return RequestTiming(
+        endpoint=endpoint,
+        method="GET",
+        url=f"https://api.onspring.com{endpoint}",
+        status_code=status_code,
+        request_bytes=10,
+        response_bytes=100,
+        retries=len(retry_reasons),
+        retry_reasons=retry_reasons,
+        queue_seconds=0.0,
+        network_seconds=total_seconds / 2,
+        connect_seconds=None,
+        server_seconds=None,
+        download_seconds=None,
+        parse_seconds=total_seconds / 4,
+        total_seconds=total_seconds,
+    )
+
+
+class TestHistogram:
+    def test_bounds_are_inclusive(self):
+        histogram = Histogram([1, 2])
+
+        for value in (0.5, 1, 1.5, 2, 3):
+            histogram.observe(value)
+
+        assert histogram.counts == [2, 2, 1]
+        assert histogram.cumulative_counts() == [2, 4, 5]
+        assert histogram.count == 5
+        assert histogram.sum == 8
+
+    def test_quantile_interpolates_within_bucket(self):
+        histogram = Histogram([1, 2, 4])
+
+        for value in (0.5, 1.5, 1.5, 3):
+            histogram.observe(value)
+
+        assert histogram.quantile(0.5) == 1.5
+        assert histogram.quantile(1) == 4
+        assert histogram.quantile(0) == 0
+
+    def test_quantile_beyond_last_bucket(self):
+        histogram = Histogram([1])
+        histogram.observe(5)
+
+        assert histogram.quantile(0.99) == 1
+
+    def test_quantile_of_empty_histogram(self):
+        assert Histogram().quantile(0.5) is None
+
+    @pytest.mark.parametrize("buckets", [[], [2, 1], [1, 1]])
+    def test_invalid_buckets(self, buckets: list[float]):
+        with pytest.raises(ValueError):
+            Histogram(buckets)
+
+    def test_invalid_quantile(self):
+        with pytest.raises(ValueError):
+            Histogram().quantile(1.5)
+
+
+class TestMetricsCollector:
+    def test_aggregates_by_endpoint(self):
+        collector = MetricsCollector()
+
+        collector.on_request_end(_timing())
+        collector.on_request_end(_timing(status_code=404))
+        collector.on_request_end(_timing(endpoint="/Apps", status_code=None))
+
+        metrics = collector.endpoint("GET", "/Apps/id/{id}")
+
+        assert collector.endpoints() == [("GET", "/Apps"), ("GET", "/Apps/id/{id}")]
+        assert metrics.requests == 2
+        assert metrics.requests_by_status == {"200": 1, "404": 1}
+        assert metrics.request_bytes == 20
+        assert metrics.response_bytes == 200
+        assert collector.endpoint("GET", "/Apps").requests_by_status == {"error": 1}
+        assert collector.endpoint("GET", "/Fields") is None
+
+    def test_counts_rate_limited_responses(self):
+        collector = MetricsCollector()
+
+        collector.on_request_end(_timing(retry_reasons=("429", "503", "429")))
+        collector.on_request_end(_timing(status_code=429))
+
+        metrics = collector.endpoint("GET", "/Apps/id/{id}")
+
+        assert metrics.rate_limited == 3
+        assert metrics.retries == 3
+
+    def test_quantile(self):
+        collector = MetricsCollector(buckets=[0.1, 1])
+
+        for _ in range(99):
+            collector.on_request_end(_timing(total_seconds=0.05))
+
+        collector.on_request_end(_timing(total_seconds=0.5))
+
+        assert collector.quantile("GET", "/Apps/id/{id}", 0.5) == pytest.approx(0.05050505)
+        assert collector.quantile("GET", "/Apps/id/{id}", 0.999) == pytest.approx(0.91)
+        assert collector.quantile("GET", "/Apps", 0.5) is None
+
+    def test_render_prometheus(self):
+        collector = MetricsCollector(buckets=[0.1, 1], namespace="test")
+
+        collector.on_request_end(_timing(total_seconds=0.5))
+        collector.on_request_end(_timing(total_seconds=2.0, status_code=503))
+
+        lines = collector.render_prometheus().splitlines()
+        labels = 'method="GET",endpoint="/Apps/id/{id}"'
+
+        assert "# TYPE test_request_duration_seconds histogram" in lines
+        assert f'test_request_duration_seconds_bucket{{{labels},le="0.1"}} 0' in lines
+        assert f'test_request_duration_seconds_bucket{{{labels},le="1.0"}} 1' in lines
+        assert f'test_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in lines
+        assert f"test_request_duration_seconds_sum{{{labels}}} 2.5" in lines
+        assert f"test_request_duration_seconds_count{{{labels}}} 2" in lines
+        assert f'test_requests_total{{{labels},status="200"}} 1' in lines
+        assert f'test_requests_total{{{labels},status="503"}} 1' in lines
+        assert f"test_response_bytes_total{{{labels}}} 200" in lines
+        assert "# TYPE test_rate_limited_total counter" in lines
+
+    def test_render_escapes_labels(self):
+        collector = MetricsCollector()
+
+        collector.on_request_end(_timing(endpoint='/a"b\\c'))
+
+        assert 'endpoint="/a\\"b\\\\c"' in collector.render_prometheus()
+
+    def test_reset(self):
+        collector = MetricsCollector()
+        collector.on_request_end(_timing())
+
+        collector.reset()
+
+        assert collector.endpoints() == []
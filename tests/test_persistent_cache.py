@@ -0,0 +1,118 @@
+import sqlite3
+import time
+
+import pytest
+
+from onspring_api_sdk.models import App, GetFieldsByAppIdResponse, GetReportsByAppIdResponse, PagingRequest
+from onspring_api_sdk.persistent_cache import PersistentMetadataCache
+
+from .conftest import MOCK_APP, MOCK_FIELDS_RESPONSE, MOCK_REPORTS_BY_APP_RESPONSE, TEMP_DIR
+
+PATH = TEMP_DIR / "metadata.db"
+
+
+def _populate() -> None:
+    with PersistentMetadataCache(PATH) as cache:
+        cache.set_app(App.model_validate(MOCK_APP))
+        cache.set_fields_page(10, PagingRequest(), GetFieldsByAppIdResponse.model_validate(MOCK_FIELDS_RESPONSE))
+        cache.set_reports_page(
+            10, PagingRequest(), GetReportsByAppIdResponse.model_validate(MOCK_REPORTS_BY_APP_RESPONSE)
+        )
+        cache.set("other", 1)
+
+
+class TestPersistentMetadataCache:
+    def test_starts_warm(self):
+        _populate()
+
+        with PersistentMetadataCache(PATH) as cache:
+            assert cache.loaded == 5
+            assert cache.get_app(1) == App.model_validate(MOCK_APP)
+            assert cache.get_field(2).name == "List Field"
+            assert cache.get_fields_page(10, PagingRequest()) == GetFieldsByAppIdResponse.model_validate(
+                MOCK_FIELDS_RESPONSE
+            )
+            assert (
+                cache.get_reports_page(10, PagingRequest()).reports[0].id
+                == (MOCK_REPORTS_BY_APP_RESPONSE["items"][0]["id"])
+            )
+            assert cache.get("other") is None
+            assert cache.stale_hits == 0
+
+    def test_entries_keep_their_age(self, monkeypatch: pytest.MonkeyPatch):
+        _populate()
+        now = [1e12]
+        monkeypatch.setattr("onspring_api_sdk.persistent_cache.time.time", lambda: now[0])
+
+        with PersistentMetadataCache(PATH, ttl=60, stale_ttl=60) as cache:
+            assert cache.loaded == 0
+
+    def test_expired_entries_are_not_served_by_default(self, monkeypatch: pytest.MonkeyPatch):
+        _populate()
+        now = time.time() + 90
+        monkeypatch.setattr("onspring_api_sdk.persistent_cache.time.time", lambda: now)
+
+        with PersistentMetadataCache(PATH, ttl=60) as cache:
+            assert cache.loaded == 0
+            assert cache.get_app(1) is None
+
+    def test_stale_entries_are_served(self, monkeypatch: pytest.MonkeyPatch):
+        _populate()
+        now = time.time() + 90
+        monkeypatch.setattr("onspring_api_sdk.persistent_cache.time.time", lambda: now)
+
+        with PersistentMetadataCache(PATH, ttl=60, stale_ttl=60) as cache:
+            assert cache.get_app(1) is not None
+            assert cache.stale_hits == 1
+
+    def test_other_versions_are_discarded(self):
+        _populate()
+
+        with PersistentMetadataCache(PATH, version="2") as cache:
+            assert cache.loaded == 0
+
+        with PersistentMetadataCache(PATH) as cache:
+            assert cache.loaded == 0
+
+    def test_invalidation_is_persisted(self):
+        _populate()
+
+        with PersistentMetadataCache(PATH) as cache:
+            cache.invalidate_field(2)
+
+        with PersistentMetadataCache(PATH) as cache:
+            assert cache.get_field(2) is None
+            assert cache.get_fields_page(10, PagingRequest()) is None
+            assert cache.get_field(1) is not None
+
+            cache.clear()
+
+        with PersistentMetadataCache(PATH) as cache:
+            assert cache.loaded == 0
+
+    def test_invalid_rows_are_skipped(self):
+        _populate()
+
+        with sqlite3.connect(PATH) as connection:
+            connection.execute("""UPDATE entries SET value = '{}' WHERE key = '["app", 1]'""")
+
+        connection.close()
+
+        with PersistentMetadataCache(PATH) as cache:
+            assert cache.get_app(1) is None
+            assert cache.loaded == 4
+
+    def test_loads_newest_entries_up_to_max_entries(self):
+        _populate()
+
+        with PersistentMetadataCache(PATH, max_entries=2) as cache:
+            assert len(cache) == 2
+            assert cache.get_app(1) is None
+
+    def test_closed_cache_stays_in_memory(self):
+        cache = PersistentMetadataCache(PATH)
+        cache.close()
+
+        cache.set_app(App.model_validate(MOCK_APP))
+
+        assert cache.get_app(1) is not None
@@ -0,0 +1,64 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from onspring_api_sdk.rate_limit import RateLimiter
+
+
+class TestRateLimiter:
+    @pytest.mark.parametrize("rate, burst", [(0, 1), (-1, 1), (1, 0)])
+    def test_invalid_arguments(self, rate, burst):
+        with pytest.raises(ValueError):
+            RateLimiter(rate, burst)
+
+    def test_burst_is_not_delayed(self):
+        limiter = RateLimiter(rate=1, burst=5)
+
+        delays = [limiter.acquire() for _ in range(5)]
+
+        assert delays == [0.0] * 5
+        assert limiter.requests == 5
+        assert limiter.delayed_requests == 0
+
+    def test_paces_after_burst(self):
+        limiter = RateLimiter(rate=50, burst=1)
+
+        start = time.monotonic()
+        for _ in range(6):
+            limiter.acquire()
+        elapsed = time.monotonic() - start
+
+        assert elapsed >= 0.09
+        assert limiter.delayed_requests == 5
+        assert limiter.wait_seconds == pytest.approx(0.1, abs=0.02)
+
+    def test_shared_across_threads(self):
+        limiter = RateLimiter(rate=100, burst=2)
+
+        def _worker():
+            for _ in range(5):
+                limiter.acquire()
+
+        threads = [threading.Thread(target=_worker) for _ in range(4)]
+        start = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - start
+
+        assert limiter.requests == 20
+        assert elapsed >= 0.17
+
+    async def test_shared_across_coroutines(self):
+        limiter = RateLimiter(rate=100, burst=2)
+
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire_async() for _ in range(20)))
+        elapsed = time.monotonic() - start
+
+        assert limiter.requests == 20
+        assert limiter.delayed_requests == 18
+        assert elapsed >= 0.17
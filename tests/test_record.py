@@ -0,0 +1,113 @@
+import pytest
+
+from onspring_api_sdk.models import IntegerFieldValue, LazyFieldList, Record, StringFieldValue
+from onspring_api_sdk.models.record import LAZY_FIELDS
+
+RECORD = {
+    "appId": 100,
+    "recordId": 1,
+    "fieldData": [
+        {"fieldId": 1, "value": "Test Value", "type": "String"},
+        {"fieldId": 2, "value": 5, "type": "Integer"},
+        {"fieldId": 3, "value": "2024-01-02T03:04:05Z", "type": "Date"},
+    ],
+}
+
+
+@pytest.fixture(params=[False, True], ids=["eager", "lazy"])
+def record(request) -> Record:
+    return Record.model_validate(RECORD, context={LAZY_FIELDS: request.param})
+
+
+class TestFieldLookup:
+    def test_getitem(self, record: Record):
+        assert record[2].value == 5
+        assert record[1].value == "Test Value"
+
+    def test_getitem_missing_raises_key_error(self, record: Record):
+        with pytest.raises(KeyError):
+            record[99]
+
+    def test_get(self, record: Record):
+        assert record.get(3).value.year == 2024
+        assert record.get(99) is None
+        assert record.get(99, "default") == "default"
+
+    def test_field_map(self, record: Record):
+        field_map = record.field_map
+
+        assert list(field_map) == [1, 2, 3]
+        assert len(field_map) == 3
+        assert 2 in field_map
+        assert 99 not in field_map
+        assert field_map[1].value == "Test Value"
+
+    def test_lazy_lookup_only_parses_requested_field(self):
+        record = Record.model_validate(RECORD, context={LAZY_FIELDS: True})
+
+        assert record[3].value.year == 2024
+        assert list(record.field_map) == [1, 2, 3]
+        assert record.fields.materialized_count == 1
+
+    def test_index_follows_appended_fields(self):
+        record = Record(app_id=100, fields=[StringFieldValue(field_id=1, value="a")])
+
+        assert record.get(2) is None
+
+        record.fields.append(IntegerFieldValue(field_id=2, value=1))
+
+        assert record[2].value == 1
+
+    def test_index_follows_reassigned_fields(self):
+        record = Record(app_id=100, fields=[StringFieldValue(field_id=1, value="a")])
+
+        assert record[1].value == "a"
+
+        record.fields = [StringFieldValue(field_id=1, value="b")]
+
+        assert record[1].value == "b"
+
+    def test_index_follows_replaced_field(self):
+        record = Record(app_id=100, fields=[StringFieldValue(field_id=1, value="a")])
+
+        assert record[1].value == "a"
+
+        record.fields[0] = StringFieldValue(field_id=2, value="b")
+
+        assert record[2].value == "b"
+        assert record.get(1) is None
+
+    def test_duplicate_field_ids_keep_last(self):
+        record = Record(
+            app_id=100,
+            fields=[StringFieldValue(field_id=1, value="a"), StringFieldValue(field_id=1, value="b")],
+        )
+
+        assert record[1].value == "b"
+
+    def test_index_does_not_affect_equality(self):
+        first = Record.model_validate(RECORD)
+        second = Record.model_validate(RECORD)
+
+        first[1]
+
+        assert first == second
+
+
+class TestLazyFieldList:
+    def test_behaves_like_list(self):
+        eager = Record.model_validate(RECORD)
+        lazy = Record.model_validate(RECORD, context={LAZY_FIELDS: True})
+
+        assert isinstance(lazy.fields, LazyFieldList)
+        assert len(lazy.fields) == 3
+        assert lazy.fields[-1] == eager.fields[-1]
+        assert lazy.fields[1:] == eager.fields[1:]
+        assert [field.field_id for field in lazy.fields] == [1, 2, 3]
+        assert lazy.fields == eager.fields
+
+    def test_values_are_parsed_once(self):
+        fields = LazyFieldList(RECORD["fieldData"])
+
+        assert fields[0] is fields[0]
+        assert fields.materialized_count == 1
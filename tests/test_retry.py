@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from onspring_api_sdk.retry import RetryPolicy, RetryStats, _parse_retry_after
+
+
+class TestParseRetryAfter:
+    def test_seconds(self):
+        assert _parse_retry_after("7") == 7.0
+
+    def test_http_date(self):
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+        delay = _parse_retry_after(format_datetime(retry_at, usegmt=True))
+
+        assert 28 <= delay <= 30
+
+    def test_past_date_is_zero(self):
+        retry_at = datetime.now(timezone.utc) - timedelta(seconds=30)
+
+        assert _parse_retry_after(format_datetime(retry_at, usegmt=True)) == 0.0
+
+    @pytest.mark.parametrize("value", [None, "", "soon"])
+    def test_invalid(self, value):
+        assert _parse_retry_after(value) is None
+
+
+class TestRetryPolicy:
+    def test_should_retry_response(self):
+        policy = RetryPolicy()
+
+        assert policy.should_retry_response(httpx.Response(429))
+        assert policy.should_retry_response(httpx.Response(503))
+        assert not policy.should_retry_response(httpx.Response(500))
+        assert not policy.should_retry_response(httpx.Response(200))
+
+    def test_should_retry_error(self):
+        policy = RetryPolicy()
+
+        assert policy.should_retry_error(httpx.ConnectError("boom"))
+        assert policy.should_retry_error(httpx.ReadTimeout("slow"))
+        assert not policy.should_retry_error(httpx.UnsupportedProtocol("nope"))
+
+    def test_delay_is_jittered_within_exponential_bound(self):
+        policy = RetryPolicy(backoff_base=1.0, backoff_max=100.0)
+
+        delays = [policy.get_delay(3) for _ in range(200)]
+
+        assert all(0 <= delay <= 8.0 for delay in delays)
+        assert len(set(delays)) > 1
+
+    def test_delay_is_capped(self):
+        policy = RetryPolicy(backoff_base=1.0, backoff_max=2.0)
+
+        assert all(policy.get_delay(10) <= 2.0 for _ in range(50))
+
+    def test_retry_after_takes_precedence(self):
+        policy = RetryPolicy(backoff_max=60.0)
+        response = httpx.Response(429, headers={"retry-after": "12"})
+
+        assert policy.get_delay(0, response) == 12.0
+
+    def test_retry_after_is_not_capped_by_backoff_max(self):
+        policy = RetryPolicy(backoff_max=5.0)
+        response = httpx.Response(429, headers={"retry-after": "120"})
+
+        assert policy.should_retry_response(response)
+        assert policy.get_delay(0, response) == 120.0
+
+    def test_long_retry_after_is_not_retried(self):
+        policy = RetryPolicy(max_retry_after=60.0)
+
+        assert not policy.should_retry_response(httpx.Response(429, headers={"retry-after": "61"}))
+        assert policy.should_retry_response(httpx.Response(429, headers={"retry-after": "60"}))
+        assert RetryPolicy(max_retry_after=60.0, respect_retry_after=False).should_retry_response(
+            httpx.Response(429, headers={"retry-after": "61"})
+        )
+
+    def test_retry_after_ignored_when_disabled(self):
+        policy = RetryPolicy(backoff_base=0.01, respect_retry_after=False)
+        response = httpx.Response(429, headers={"retry-after": "12"})
+
+        assert policy.get_delay(0, response) <= 0.01
+
+
+class TestRetryStats:
+    def test_records(self):
+        stats = RetryStats()
+
+        stats.record_attempt()
+        stats.record_attempt()
+        stats.record_retry("503", 1.5)
+        stats.record_exhausted()
+
+        assert stats.attempts == 2
+        assert stats.retries == 1
+        assert stats.backoff_seconds == 1.5
+        assert stats.retries_by_reason == {"503": 1}
+        assert stats.exhausted == 1
@@ -1,21 +1,39 @@
+import io
+import json
+import threading
+import time
+from datetime import datetime, timezone
+
+import httpx
 import pytest
 import respx
 from httpx import Response
+from pydantic import ValidationError
 
 from onspring_api_sdk import OnspringClient
+from onspring_api_sdk.cache import MetadataCache
+from onspring_api_sdk.enums import ExportFormat, ParseMode, RawResponseMode
 from onspring_api_sdk.errors import (
     OnspringAuthenticationError,
     OnspringError,
     OnspringNotFoundError,
     OnspringRateLimitError,
 )
+from onspring_api_sdk.http_cache import ResponseCache
+from onspring_api_sdk.incremental import Checkpoint, MemoryCheckpointStore
+from onspring_api_sdk.instrumentation import RequestObserver, RequestStart, RequestTiming
+from onspring_api_sdk.metrics import MetricsCollector
 from onspring_api_sdk.models import (
     AddOrUpdateListItemResponse,
     AddOrUpdateRecordResponse,
     ApiResponse,
+    DeleteBatchRecordsReport,
+    DeleteBatchRecordsRequest,
+    DownloadFileResponse,
     GetAppByIdResponse,
     GetAppsByIdsResponse,
     GetAppsResponse,
+    GetBatchRecordsRequest,
     GetBatchRecordsResponse,
     GetFieldByIdResponse,
     GetFieldsByAppIdResponse,
@@ -28,10 +46,17 @@ from onspring_api_sdk.models import (
     GetReportByIdRequest,
     GetReportByIdResponse,
     GetReportsByAppIdResponse,
+    LazyFieldList,
+    PagingRequest,
+    QueryRecordsRequest,
     Record,
     SaveFileRequest,
     SaveFileResponse,
+    StringFieldValue,
 )
+from onspring_api_sdk.rate_limit import RateLimiter
+from onspring_api_sdk.retry import RetryPolicy
+from onspring_api_sdk.table import RecordTable
 
 from .conftest import (
     MOCK_APP,
@@ -51,8 +76,14 @@ from .conftest import (
     MOCK_REPORTS_BY_APP_RESPONSE,
     MOCK_SAVE_FILE_RESPONSE,
     MOCK_SAVE_RECORD_RESPONSE,
+    TEMP_DIR,
+    TEST_API_KEY,
     TEST_URL,
+    batch_records_side_effect,
     create_temp_file,
+    paged_side_effect,
+    parse_multipart,
+    records_page_side_effect,
 )
 
 
@@ -91,6 +122,50 @@ class TestCanConnect:
         assert client.client.is_closed
 
 
+class TestClientOptions:
+    def test_defaults(self):
+        client = OnspringClient(TEST_URL, TEST_API_KEY)
+        pool = client.client._transport._pool
+
+        assert client.client.timeout == httpx.Timeout(5.0)
+        assert pool._max_connections == 100
+        assert pool._max_keepalive_connections == 20
+        assert pool._keepalive_expiry == 5.0
+        assert pool._http2 is False
+
+    def test_custom_limits_and_timeout(self):
+        limits = httpx.Limits(max_connections=200, max_keepalive_connections=50, keepalive_expiry=30.0)
+        timeout = httpx.Timeout(10.0, connect=2.0)
+
+        client = OnspringClient(TEST_URL, TEST_API_KEY, limits=limits, timeout=timeout)
+        pool = client.client._transport._pool
+
+        assert client.client.timeout == timeout
+        assert pool._max_connections == 200
+        assert pool._max_keepalive_connections == 50
+        assert pool._keepalive_expiry == 30.0
+
+    def test_http2(self):
+        client = OnspringClient(TEST_URL, TEST_API_KEY, http2=True)
+
+        assert client.client._transport._pool._http2 is True
+
+    def test_custom_transport(self):
+        requests = []
+
+        def _handler(request: httpx.Request) -> Response:
+            requests.append(request)
+            return Response(200, json=MOCK_APP)
+
+        client = OnspringClient(TEST_URL, TEST_API_KEY, transport=httpx.MockTransport(_handler))
+
+        response = client.get_app_by_id(1)
+
+        assert response.is_successful
+        assert requests[0].url == f"{TEST_URL}/Apps/id/1"
+        assert requests[0].headers["x-apikey"] == TEST_API_KEY
+
+
 class TestGetApps:
     def test_success(self, client: OnspringClient):
         with respx.mock:
@@ -134,6 +209,52 @@ class TestGetApps:
             assert isinstance(response.data, GetAppsResponse)
 
 
+class TestGetAllApps:
+    def test_returns_every_page_in_order(self, client: OnspringClient):
+        with respx.mock:
+            route = respx.get(f"{TEST_URL}/Apps").mock(side_effect=paged_side_effect(MOCK_APPS_RESPONSE, 4))
+
+            responses = client.get_all_apps(max_concurrency=2)
+
+            assert route.call_count == 4
+            assert [response.data.page_number for response in responses] == [1, 2, 3, 4]
+            assert all(isinstance(response.data, GetAppsResponse) for response in responses)
+
+    def test_uses_paging_request(self, client: OnspringClient):
+        from onspring_api_sdk.models import PagingRequest
+
+        with respx.mock:
+            route = respx.get(f"{TEST_URL}/Apps").mock(side_effect=paged_side_effect(MOCK_APPS_RESPONSE, 4))
+
+            responses = client.get_all_apps(PagingRequest(page_number=3, page_size=10))
+
+            assert [response.data.page_number for response in responses] == [3, 4]
+            assert all(call.request.url.params["pageSize"] == "10" for call in route.calls)
+
+    def test_first_page_failure(self, client: OnspringClient):
+        with respx.mock:
+            route = respx.get(f"{TEST_URL}/Apps").mock(return_value=Response(401))
+
+            responses = client.get_all_apps()
+
+            assert route.call_count == 1
+            assert len(responses) == 1
+            _assert_error(responses[0], 401, "Unauthorized request")
+
+    def test_later_page_failure_returned_in_place(self, client: OnspringClient):
+        def _side_effect(request):
+            if request.url.params["pageNumber"] == "2":
+                return Response(400)
+            return paged_side_effect(MOCK_APPS_RESPONSE, 3)(request)
+
+        with respx.mock:
+            respx.get(f"{TEST_URL}/Apps").mock(side_effect=_side_effect)
+
+            responses = client.get_all_apps()
+
+            assert [response.status_code for response in responses] == [200, 400, 200]
+
+
 class TestGetAppById:
     def test_success(self, client: OnspringClient):
         with respx.mock:
@@ -338,6 +459,17 @@ class TestGetFieldsByAppId:
             assert isinstance(response.data, GetFieldsByAppIdResponse)
 
 
+class TestGetAllFieldsByAppId:
+    def test_returns_every_page_in_order(self, client: OnspringClient):
+        with respx.mock:
+            respx.get(f"{TEST_URL}/Fields/appId/10").mock(side_effect=paged_side_effect(MOCK_FIELDS_RESPONSE, 3))
+
+            responses = client.get_all_fields_by_app_id(10)
+
+            assert [response.data.page_number for response in responses] == [1, 2, 3]
+            assert all(isinstance(response.data, GetFieldsByAppIdResponse) for response in responses)
+
+
 class TestGetFileInfoById:
     def test_success(self, client: OnspringClient):
         with respx.mock:
@@ -527,6 +659,101 @@ class TestGetFileById:
             _assert_error(client.get_file_by_id(1, 2, 3), 418, None)
 
 
+class _FailingStream(httpx.SyncByteStream):
+    def __iter__(self):
+        yield b"partial"
+        raise httpx.ReadError("connection dropped")
+
+
+class TestDownloadFile:
+    URL = f"{TEST_URL}/Files/recordId/1/fieldId/2/fileId/3/file"
+    HEADERS = {"content-disposition": 'attachment; filename="big.bin"', "content-type": "application/octet-stream"}
+
+    def test_to_path(self, client: OnspringClient, tmp_path):
+        destination = tmp_path / "big.bin"
+
+        with respx.mock:
+            respx.get(self.URL).mock(return_value=Response(200, headers=self.HEADERS, content=b"x" * 1000))
+
+            response = client.download_file(1, 2, 3, destination, chunk_size=100)
+
+            assert response.is_successful
+            assert isinstance(response.data, DownloadFileResponse)
+            assert response.data.file.name == "big.bin"
+            assert response.data.file.content_type == "application/octet-stream"
+            assert response.data.file.content_length == 1000
+            assert response.data.file.bytes_written == 1000
+            assert destination.read_bytes() == b"x" * 1000
+
+    def test_to_str_path(self, client: OnspringClient, tmp_path):
+        destination = tmp_path / "file.txt"
+
+        with respx.mock:
+            respx.get(self.URL).mock(return_value=Response(200, content=b"Hello World!"))
+
+            response = client.download_file(1, 2, 3, str(destination))
+
+            assert response.data.file.name == "OnspringFile"
+            assert destination.read_bytes() == b"Hello World!"
+
+    def test_to_stream(self, client: OnspringClient):
+        destination = io.BytesIO()
+
+        with respx.mock:
+            respx.get(self.URL).mock(return_value=Response(200, headers=self.HEADERS, content=b"Hello World!"))
+
+            response = client.download_file(1, 2, 3, destination)
+
+            assert response.data.file.bytes_written == 12
+            assert destination.getvalue() == b"Hello World!"
+            assert not destination.closed
+
+    def test_error_does_not_create_file(self, client: OnspringClient, tmp_path):
+        destination = tmp_path / "missing.bin"
+
+        with respx.mock:
+            respx.get(self.URL).mock(return_value=Response(404, json=MOCK_MESSAGE_RESPONSE))
+
+            response = client.download_file(1, 2, 3, destination)
+
+            _assert_error(response, 404, "An error occurred")
+            assert not destination.exists()
+
+    @pytest.mark.parametrize(
+        "status, message",
+        [(400, "Request is invalid based on underlying data"), (401, "Unauthorized request"), (418, None)],
+    )
+    def test_errors(self, client: OnspringClient, status, message):
+        with respx.mock:
+            respx.get(self.URL).mock(return_value=Response(status))
+
+            _assert_error(client.download_file(1, 2, 3, io.BytesIO()), status, message)
+
+    def test_interrupted_download_removes_partial_file(self, client: OnspringClient, tmp_path):
+        destination = tmp_path / "partial.bin"
+
+        with respx.mock:
+            respx.get(self.URL).mock(return_value=Response(200, stream=_FailingStream()))
+
+            with pytest.raises(httpx.ReadError):
+                client.download_file(1, 2, 3, destination)
+
+            assert not destination.exists()
+
+    def test_retries_before_streaming(self, tmp_path):
+        client = OnspringClient(TEST_URL, TEST_API_KEY, retry_policy=RetryPolicy(backoff_base=0))
+        destination = tmp_path / "retried.bin"
+
+        with respx.mock:
+            route = respx.get(self.URL).mock(side_effect=[Response(503), Response(200, content=b"ok")])
+
+            response = client.download_file(1, 2, 3, destination)
+
+            assert response.is_successful
+            assert route.call_count == 2
+            assert destination.read_bytes() == b"ok"
+
+
 class TestSaveFile:
     def test_success(self, client: OnspringClient):
         file_path = create_temp_file()
@@ -610,6 +837,76 @@ class TestSaveFile:
 
             _assert_error(client.save_file(request), 418, None)
 
+    def test_streams_file_from_path(self, client: OnspringClient):
+        file_path = create_temp_file(content=b"x" * 200_000)
+        request = SaveFileRequest(
+            recordId=1,
+            fieldId=2,
+            fileName='my "file".txt',
+            filePath=str(file_path),
+            contentType="text/plain",
+            notes="Initial revision",
+            modifiedDate=datetime(2024, 1, 2, 3, 4, 5),
+        )
+
+        with respx.mock:
+            route = respx.post(f"{TEST_URL}/Files").mock(return_value=Response(201, json=MOCK_SAVE_FILE_RESPONSE))
+
+            response = client.save_file(request)
+
+            sent = route.calls[0].request
+            parts = parse_multipart(sent)
+
+            assert response.is_successful
+            assert int(sent.headers["content-length"]) == len(sent.content)
+            assert parts["File"] == ("my %22file%22.txt", "text/plain", b"x" * 200_000)
+            assert parts["recordId"][2] == b"1"
+            assert parts["fieldId"][2] == b"2"
+            assert parts["notes"][2] == b"Initial revision"
+            assert parts["modifiedDate"][2] == b"2024-01-02T03:04:05"
+
+    def test_streams_bytes(self, client: OnspringClient):
+        request = SaveFileRequest(recordId=1, fieldId=2, fileName="test.txt", contentType="text/plain")
+
+        with respx.mock:
+            route = respx.post(f"{TEST_URL}/Files").mock(return_value=Response(201, json=MOCK_SAVE_FILE_RESPONSE))
+
+            client.save_file(request, content=b"Hello World!")
+
+            sent = route.calls[0].request
+
+            assert int(sent.headers["content-length"]) == len(sent.content)
+            assert parse_multipart(sent)["File"][2] == b"Hello World!"
+
+    @pytest.mark.parametrize("content_length, chunked", [(None, True), (12, False)])
+    def test_streams_iterable(self, client: OnspringClient, content_length, chunked):
+        request = SaveFileRequest(recordId=1, fieldId=2, fileName="test.txt", contentType="text/plain")
+
+        with respx.mock:
+            route = respx.post(f"{TEST_URL}/Files").mock(return_value=Response(201, json=MOCK_SAVE_FILE_RESPONSE))
+
+            client.save_file(request, content=iter([b"Hello ", b"", b"World!"]), content_length=content_length)
+
+            sent = route.calls[0].request
+
+            assert (sent.headers.get("transfer-encoding") == "chunked") is chunked
+            assert parse_multipart(sent)["File"][2] == b"Hello World!"
+
+    def test_requires_path_or_content(self, client: OnspringClient):
+        request = SaveFileRequest(recordId=1, fieldId=2, fileName="test.txt", contentType="text/plain")
+
+        with pytest.raises(ValueError):
+            client.save_file(request)
+
+    def test_async_iterable_not_supported(self, client: OnspringClient):
+        async def chunks():
+            yield b"Hello World!"
+
+        request = SaveFileRequest(recordId=1, fieldId=2, fileName="test.txt", contentType="text/plain")
+
+        with pytest.raises(TypeError):
+            client.save_file(request, content=chunks())
+
 
 class TestAddOrUpdateListItem:
     def test_200_update(self, client: OnspringClient):
@@ -786,6 +1083,28 @@ class TestGetRecordsByAppId:
             _assert_error(client.get_records_by_app_id(request), 418, None)
 
 
+class TestGetAllRecordsByAppId:
+    def test_returns_every_page_in_order(self, client: OnspringClient):
+        with respx.mock:
+            respx.get(f"{TEST_URL}/Records/appId/100").mock(side_effect=records_page_side_effect(3))
+
+            responses = client.get_all_records_by_app_id(GetRecordsByAppRequest(app_id=100), max_concurrency=1)
+
+            records = [record.record_id for response in responses for record in response.data.records]
+            assert records == [1, 2, 3, 4, 5, 6]
+
+    def test_single_page(self, client: OnspringClient):
+        with respx.mock:
+            route = respx.get(f"{TEST_URL}/Records/appId/100").mock(
+                return_value=Response(200, json=MOCK_RECORDS_RESPONSE)
+            )
+
+            responses = client.get_all_records_by_app_id(GetRecordsByAppRequest(app_id=100))
+
+            assert route.call_count == 1
+            assert len(responses) == 1
+
+
 class TestGetRecordById:
     def test_success(self, client: OnspringClient):
         with respx.mock:
@@ -940,6 +1259,36 @@ class TestGetRecordsByIds:
 
             _assert_error(client.get_records_by_ids(request), 418, None)
 
+    def test_chunks_large_id_lists(self, client: OnspringClient):
+        with respx.mock:
+            route = respx.post(f"{TEST_URL}/Records/batch-get").mock(side_effect=batch_records_side_effect())
+
+            request = GetBatchRecordsRequest(app_id=100, recordIds=list(range(1, 6)), fieldIds=[1])
+
+            response = client.get_records_by_ids(request, batch_size=2)
+
+            sent = sorted(json.loads(call.request.content)["recordIds"] for call in route.calls)
+
+            assert response.is_successful
+            assert sent == [[1, 2], [3, 4], [5]]
+            assert all(json.loads(call.request.content)["fieldIds"] == [1] for call in route.calls)
+            assert response.data.count == 5
+            assert [record.record_id for record in response.data.records] == [1, 2, 3, 4, 5]
+
+    def test_chunk_failure(self, client: OnspringClient):
+        with respx.mock:
+            respx.post(f"{TEST_URL}/Records/batch-get").mock(side_effect=batch_records_side_effect(failing_ids=(3,)))
+
+            request = GetBatchRecordsRequest(app_id=100, recordIds=list(range(1, 6)))
+
+            response = client.get_records_by_ids(request, batch_size=2, max_concurrency=1)
+
+            _assert_error(response, 400, "Batch request is invalid/size of the data requested was too large.")
+
+    def test_invalid_batch_size(self, client: OnspringClient):
+        with pytest.raises(ValueError):
+            client.get_records_by_ids(GetBatchRecordsRequest(app_id=100, recordIds=[1]), batch_size=0)
+
 
 class TestQueryRecordsRequestDefaults:
     def test_default_page_values(self):
@@ -1024,6 +1373,246 @@ class TestQueryRecords:
             assert b"pageSize" not in body
 
 
+class TestQueryAllRecords:
+    def test_returns_every_page_in_order(self, client: OnspringClient):
+        from onspring_api_sdk.models import QueryRecordsRequest
+
+        with respx.mock:
+            respx.post(f"{TEST_URL}/Records/Query").mock(side_effect=records_page_side_effect(3))
+
+            responses = client.query_all_records(QueryRecordsRequest(app_id=100, filter="Test"))
+
+            assert [response.data.page_number for response in responses] == [1, 2, 3]
+
+
+class TestIterRecordsByAppId:
+    def test_yields_records_from_every_page(self, client: OnspringClient):
+        with respx.mock:
+            route = respx.get(f"{TEST_URL}/Records/appId/100").mock(side_effect=records_page_side_effect(3))
+
+            records = list(client.iter_records_by_app_id(GetRecordsByAppRequest(app_id=100)))
+
+            assert [record.record_id for record in records] == [1, 2, 3, 4, 5, 6]
+            assert route.call_count == 3
+
+    def test_starts_at_request_page(self, client: OnspringClient):
+        with respx.mock:
+            respx.get(f"{TEST_URL}/Records/appId/100").mock(side_effect=records_page_side_effect(3))
+
+            request = GetRecordsByAppRequest(app_id=100, page_number=2)
+            records = list(client.iter_records_by_app_id(request))
+
+            assert [record.record_id for record in records] == [3, 4, 5, 6]
+
+    def test_without_prefetch(self, client: OnspringClient):
+        with respx.mock:
+            respx.get(f"{TEST_URL}/Records/appId/100").mock(side_effect=records_page_side_effect(3))
+
+            records = list(client.iter_records_by_app_id(GetRecordsByAppRequest(app_id=100), prefetch=0))
+
+            assert [record.record_id for record in records] == [1, 2, 3, 4, 5, 6]
+
+    def test_empty_app(self, client: OnspringClient):
+        with respx.mock:
+            respx.get(f"{TEST_URL}/Records/appId/100").mock(
+                return_value=Response(200, json={**MOCK_RECORDS_RESPONSE, "totalPages": 0, "items": []})
+            )
+
+            assert list(client.iter_records_by_app_id(GetRecordsByAppRequest(app_id=100))) == []
+
+    def test_failed_page_raises(self, client: OnspringClient):
+        def _side_effect(request):
+            if request.url.params["pageNumber"] == "2":
+                return Response(401)
+            return records_page_side_effect(3)(request)
+
+        with respx.mock:
+            respx.get(f"{TEST_URL}/Records/appId/100").mock(side_effect=_side_effect)
+
+            iterator = client.iter_records_by_app_id(GetRecordsByAppRequest(app_id=100))
+
+            assert next(iterator).record_id == 1
+            assert next(iterator).record_id == 2
+
+            with pytest.raises(OnspringAuthenticationError, match="Unauthorized request"):
+                next(iterator)
+
+
+class TestIterQueryRecords:
+    def test_yields_records_from_every_page(self, client: OnspringClient):
+        from onspring_api_sdk.models import QueryRecordsRequest
+
+        with respx.mock:
+            route = respx.post(f"{TEST_URL}/Records/Query").mock(side_effect=records_page_side_effect(2))
+
+            records = list(client.iter_query_records(QueryRecordsRequest(app_id=100, filter="Test")))
+
+            assert [record.record_id for record in records] == [1, 2, 3, 4]
+            assert route.call_count == 2
+
+    def test_first_page_failure_raises(self, client: OnspringClient):
+        from onspring_api_sdk.models import QueryRecordsRequest
+
+        with respx.mock:
+            respx.post(f"{TEST_URL}/Records/Query").mock(return_value=Response(400))
+
+            with pytest.raises(OnspringError):
+                list(client.iter_query_records(QueryRecordsRequest(app_id=100, filter="Test")))
+
+
+class TestRecordsTable:
+    def test_collects_every_page_by_app_id(self, client: OnspringClient):
+        with respx.mock:
+            route = respx.get(f"{TEST_URL}/Records/appId/100").mock(side_effect=records_page_side_effect(3))
+
+            table = client.get_records_table_by_app_id(GetRecordsByAppRequest(app_id=100))
+
+            assert isinstance(table, RecordTable)
+            assert table.record_ids.to_list() == [1, 2, 3, 4, 5, 6]
+            assert table[1].to_list() == ["Test Value"] * 6
+            assert table[2].to_list() == [42] * 6
+            assert route.call_count == 3
+
+    def test_collects_every_page_of_query(self, client: OnspringClient):
+        with respx.mock:
+            respx.post(f"{TEST_URL}/Records/Query").mock(side_effect=records_page_side_effect(2))
+
+            table = client.query_records_table(QueryRecordsRequest(app_id=100, filter="Test"))
+
+            assert table.record_ids.to_list() == [1, 2, 3, 4]
+
+    def test_failed_page_raises(self, client: OnspringClient):
+        with respx.mock:
+            respx.get(f"{TEST_URL}/Records/appId/100").mock(return_value=Response(401))
+
+            with pytest.raises(OnspringAuthenticationError):
+                client.get_records_table_by_app_id(GetRecordsByAppRequest(app_id=100))
+
+
+class TestExportRecords:
+    def test_exports_every_page_as_json_lines(self, client: OnspringClient):
+        path = TEMP_DIR / "records.jsonl"
+        progress = []
+
+        with respx.mock:
+            respx.get(f"{TEST_URL}/Fields/appId/100").mock(return_value=Response(200, json=MOCK_FIELDS_RESPONSE))
+            respx.get(f"{TEST_URL}/Records/appId/100").mock(side_effect=records_page_side_effect(3))
+
+            count = client.export_records(100, path, progress=lambda *args: progress.append(args))
+
+        lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+        assert count == 6
+        assert lines[0] == {"recordId": 1, "1": "Test Value", "2": 42}
+        assert [line["recordId"] for line in lines] == [1, 2, 3, 4, 5, 6]
+        assert progress == [(2, 6), (4, 6), (6, 6)]
+
+    def test_exports_selected_fields_as_csv(self, client: OnspringClient):
+        path = TEMP_DIR / "records.csv"
+
+        with respx.mock:
+            route = respx.get(f"{TEST_URL}/Records/appId/100").mock(side_effect=records_page_side_effect(1))
+
+            count = client.export_records(100, path, format=ExportFormat.Csv, field_ids=[2])
+
+            params = route.calls[0].request.url.params
+
+            assert params["fieldIds"] == "2"
+            assert params["pageSize"] == "1000"
+
+        assert count == 2
+        assert path.read_text(encoding="utf-8").splitlines() == ["recordId,2", "1,42", "2,42"]
+
+    def test_filter_queries_records(self, client: OnspringClient):
+        stream = io.StringIO()
+
+        with respx.mock:
+            route = respx.post(f"{TEST_URL}/Records/Query").mock(side_effect=records_page_side_effect(2))
+
+            count = client.export_records(100, stream, field_ids=[1], filter="1 eq 'Test Value'")
+
+            assert json.loads(route.calls[0].request.content)["filter"] == "1 eq 'Test Value'"
+
+        assert count == 4
+        assert not stream.closed
+
+    def test_failed_page_raises_and_removes_file(self, client: OnspringClient):
+        path = TEMP_DIR / "records.jsonl"
+
+        def _side_effect(request):
+            if request.url.params["pageNumber"] == "2":
+                return Response(401)
+            return records_page_side_effect(3)(request)
+
+        with respx.mock:
+            respx.get(f"{TEST_URL}/Records/appId/100").mock(side_effect=_side_effect)
+
+            with pytest.raises(OnspringAuthenticationError):
+                client.export_records(100, path, field_ids=[1])
+
+        assert not path.exists()
+
+
+class TestIterChangedRecords:
+    @staticmethod
+    def _changes(*records: tuple[int, str]):
+        items = [
+            {**MOCK_RECORD, "recordId": record_id, "fieldData": [{"fieldId": 3, "value": modified, "type": "Date"}]}
+            for record_id, modified in records
+        ]
+
+        return Response(200, json={**MOCK_RECORDS_RESPONSE, "totalRecords": len(items), "items": items})
+
+    def test_first_pass_reads_every_record_then_queries_changes(self, client: OnspringClient):
+        checkpoints = MemoryCheckpointStore()
+
+        with respx.mock:
+            respx.get(f"{TEST_URL}/Records/appId/100").mock(
+                return_value=self._changes((1, "2024-01-02T03:00:00Z"), (2, "2024-01-02T03:04:05Z"))
+            )
+
+            first = [record.record_id for record in client.iter_changed_records(100, 3, checkpoints)]
+
+        assert first == [1, 2]
+        assert checkpoints.load(100).high_water_mark == datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+        with respx.mock:
+            route = respx.post(f"{TEST_URL}/Records/Query").mock(
+                return_value=self._changes((1, "2024-01-02T03:00:00Z"), (3, "2024-01-02T03:10:00Z"))
+            )
+
+            second = [
+                record.record_id for record in client.iter_changed_records(100, 3, checkpoints, filter="1 eq 'a'")
+            ]
+
+            body = json.loads(route.calls[0].request.content)
+
+        assert second == [3]
+        assert body["filter"] == "(1 eq 'a') and (3 gt '2024-01-02T02:59:05Z')"
+        assert checkpoints.load(100).high_water_mark == datetime(2024, 1, 2, 3, 10, tzinfo=timezone.utc)
+
+    def test_requests_modified_field(self, client: OnspringClient):
+        with respx.mock:
+            route = respx.get(f"{TEST_URL}/Records/appId/100").mock(return_value=self._changes())
+
+            list(client.iter_changed_records(100, 3, MemoryCheckpointStore(), field_ids=[1]))
+
+            assert route.calls[0].request.url.params["fieldIds"] == "1,3"
+
+    def test_failed_pass_keeps_checkpoint(self, client: OnspringClient):
+        checkpoint = Checkpoint(datetime(2024, 1, 2, tzinfo=timezone.utc))
+        checkpoints = MemoryCheckpointStore()
+        checkpoints.save(100, checkpoint)
+
+        with respx.mock:
+            respx.post(f"{TEST_URL}/Records/Query").mock(return_value=Response(500))
+
+            with pytest.raises(OnspringError):
+                list(client.iter_changed_records(100, 3, checkpoints))
+
+        assert checkpoints.load(100) is checkpoint
+
+
 class TestAddOrUpdateRecord:
     def _make_record(self) -> Record:
         from onspring_api_sdk.models import StringFieldValue
@@ -1115,32 +1704,95 @@ class TestAddOrUpdateRecord:
             assert b"fieldData" not in body
 
 
-class TestDeleteRecordsByIds:
-    def test_success(self, client: OnspringClient):
-        with respx.mock:
-            respx.post(f"{TEST_URL}/Records/batch-delete").mock(return_value=Response(204))
+class TestAddOrUpdateRecords:
+    def _records(self, count: int):
+        for record_id in range(1, count + 1):
+            yield Record(appId=100, recordId=record_id, fieldData=[StringFieldValue(fieldId=1, value="test")])
 
-            from onspring_api_sdk.models import DeleteBatchRecordsRequest
+    def _side_effect(self, request):
+        record_id = json.loads(request.content)["recordId"]
 
-            request = DeleteBatchRecordsRequest(app_id=100, recordIds=[1, 2])
+        if record_id == 3:
+            raise httpx.ConnectError("connection refused")
 
-            response = client.delete_records_by_ids(request)
+        if record_id == 4:
+            return Response(400)
 
-            assert response.is_successful
-            assert response.status_code == 204
-            assert response.message == "Record(s) deleted successfully"
+        return Response(200, json={"id": record_id, "warnings": []})
 
-    def test_400(self, client: OnspringClient):
+    def test_results_in_input_order(self, client: OnspringClient):
         with respx.mock:
-            respx.post(f"{TEST_URL}/Records/batch-delete").mock(return_value=Response(400))
+            route = respx.put(f"{TEST_URL}/Records").mock(side_effect=self._side_effect)
 
-            from onspring_api_sdk.models import DeleteBatchRecordsRequest
+            results = client.add_or_update_records(self._records(6), max_concurrency=3)
 
-            request = DeleteBatchRecordsRequest(app_id=100, recordIds=[1])
+            assert route.call_count == 6
+            assert len(results) == 6
+            saved_ids = [result.data.id for result in results if not isinstance(result, Exception) and result.data]
 
-            _assert_error(client.delete_records_by_ids(request), 400, "Invalid request provided")
+            assert saved_ids == [1, 2, 5, 6]
+            assert isinstance(results[2], httpx.ConnectError)
+            assert results[3].status_code == 400
+            assert not results[3].is_successful
+
+    def test_bounded_concurrency(self, client: OnspringClient):
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def _side_effect(request):
+            nonlocal active, peak
+
+            with lock:
+                active += 1
+                peak = max(peak, active)
+
+            time.sleep(0.01)
+
+            with lock:
+                active -= 1
+
+            return Response(200, json=MOCK_SAVE_RECORD_RESPONSE)
 
-    def test_401(self, client: OnspringClient):
+        with respx.mock:
+            respx.put(f"{TEST_URL}/Records").mock(side_effect=_side_effect)
+
+            results = client.add_or_update_records(self._records(12), max_concurrency=3)
+
+            assert len(results) == 12
+            assert all(result.is_successful for result in results)
+            assert 1 < peak <= 3
+
+    def test_empty(self, client: OnspringClient):
+        assert client.add_or_update_records([]) == []
+
+
+class TestDeleteRecordsByIds:
+    def test_success(self, client: OnspringClient):
+        with respx.mock:
+            respx.post(f"{TEST_URL}/Records/batch-delete").mock(return_value=Response(204))
+
+            from onspring_api_sdk.models import DeleteBatchRecordsRequest
+
+            request = DeleteBatchRecordsRequest(app_id=100, recordIds=[1, 2])
+
+            response = client.delete_records_by_ids(request)
+
+            assert response.is_successful
+            assert response.status_code == 204
+            assert response.message == "Record(s) deleted successfully"
+
+    def test_400(self, client: OnspringClient):
+        with respx.mock:
+            respx.post(f"{TEST_URL}/Records/batch-delete").mock(return_value=Response(400))
+
+            from onspring_api_sdk.models import DeleteBatchRecordsRequest
+
+            request = DeleteBatchRecordsRequest(app_id=100, recordIds=[1])
+
+            _assert_error(client.delete_records_by_ids(request), 400, "Invalid request provided")
+
+    def test_401(self, client: OnspringClient):
         with respx.mock:
             respx.post(f"{TEST_URL}/Records/batch-delete").mock(return_value=Response(401))
 
@@ -1182,6 +1834,40 @@ class TestDeleteRecordsByIds:
 
             _assert_error(client.delete_records_by_ids(request), 418, None)
 
+    def test_chunks_large_id_lists(self, client: OnspringClient):
+        with respx.mock:
+            route = respx.post(f"{TEST_URL}/Records/batch-delete").mock(
+                side_effect=batch_records_side_effect(status=204)
+            )
+
+            request = DeleteBatchRecordsRequest(app_id=100, recordIds=list(range(1, 6)))
+
+            response = client.delete_records_by_ids(request, batch_size=2)
+
+            assert response.is_successful
+            assert route.call_count == 3
+            assert isinstance(response.data, DeleteBatchRecordsReport)
+            assert [chunk.record_ids for chunk in response.data.chunks] == [[1, 2], [3, 4], [5]]
+            assert response.data.deleted_record_ids == [1, 2, 3, 4, 5]
+            assert response.data.failed_record_ids == []
+
+    def test_partial_failure_report(self, client: OnspringClient):
+        with respx.mock:
+            respx.post(f"{TEST_URL}/Records/batch-delete").mock(
+                side_effect=batch_records_side_effect(failing_ids=(3,), status=204)
+            )
+
+            request = DeleteBatchRecordsRequest(app_id=100, recordIds=list(range(1, 6)))
+
+            response = client.delete_records_by_ids(request, batch_size=2)
+
+            assert not response.is_successful
+            assert response.status_code == 400
+            assert response.message == "Invalid request provided"
+            assert response.data.deleted_record_ids == [1, 2, 5]
+            assert response.data.failed_record_ids == [3, 4]
+            assert response.data.chunks[1].status_code == 400
+
 
 class TestGetReportById:
     def test_success(self, client: OnspringClient):
@@ -1315,6 +2001,744 @@ class TestGetReportsByAppId:
             assert isinstance(response.data, GetReportsByAppIdResponse)
 
 
+class TestGetAllReportsByAppId:
+    def test_returns_every_page_in_order(self, client: OnspringClient):
+        with respx.mock:
+            respx.get(f"{TEST_URL}/Reports/appId/10").mock(
+                side_effect=paged_side_effect(MOCK_REPORTS_BY_APP_RESPONSE, 2)
+            )
+
+            responses = client.get_all_reports_by_app_id(10)
+
+            assert [response.data.page_number for response in responses] == [1, 2]
+            assert all(isinstance(response.data, GetReportsByAppIdResponse) for response in responses)
+
+
+class TestRetry:
+    def _client(self, **kwargs) -> OnspringClient:
+        policy = RetryPolicy(backoff_base=0.001, backoff_max=0.01, **kwargs)
+        return OnspringClient(TEST_URL, TEST_API_KEY, retry_policy=policy)
+
+    def test_retries_transient_status(self):
+        client = self._client()
+
+        with respx.mock:
+            route = respx.get(f"{TEST_URL}/Apps/id/1").mock(
+                side_effect=[Response(503), Response(429, headers={"retry-after": "0"}), Response(200, json=MOCK_APP)]
+            )
+
+            response = client.get_app_by_id(1)
+
+            assert response.is_successful
+            assert route.call_count == 3
+            assert client.retry_stats.attempts == 3
+            assert client.retry_stats.retries == 2
+            assert client.retry_stats.retries_by_reason == {"503": 1, "429": 1}
+
+    def test_long_retry_after_returns_response(self):
+        client = self._client(max_retry_after=60)
+
+        with respx.mock:
+            route = respx.get(f"{TEST_URL}/Apps/id/1").mock(
+                side_effect=[Response(429, headers={"retry-after": "120"}), Response(200, json=MOCK_APP)]
+            )
+
+            response = client.get_app_by_id(1)
+
+            assert response.status_code == 429
+            assert route.call_count == 1
+            assert client.retry_stats.retries == 0
+
+    def test_retries_connection_errors(self):
+        client = self._client()
+
+        with respx.mock:
+            respx.post(f"{TEST_URL}/Records/Query").mock(
+                side_effect=[httpx.ConnectError("refused"), Response(200, json=MOCK_RECORDS_RESPONSE)]
+            )
+
+            from onspring_api_sdk.models import QueryRecordsRequest
+
+            response = client.query_records(QueryRecordsRequest(app_id=100, filter="Test"))
+
+            assert response.is_successful
+            assert client.retry_stats.retries_by_reason == {"ConnectError": 1}
+
+    def test_returns_last_response_when_exhausted(self):
+        client = self._client(max_retries=2)
+
+        with respx.mock:
+            route = respx.get(f"{TEST_URL}/Apps").mock(return_value=Response(504))
+
+            response = client.get_apps()
+
+            assert response.status_code == 504
+            assert route.call_count == 3
+            assert client.retry_stats.exhausted == 1
+
+    def test_raises_when_errors_exhausted(self):
+        client = self._client(max_retries=1)
+
+        with respx.mock:
+            respx.get(f"{TEST_URL}/Apps").mock(side_effect=httpx.ReadTimeout("slow"))
+
+            with pytest.raises(httpx.ReadTimeout):
+                client.get_apps()
+
+            assert client.retry_stats.attempts == 2
+
+    def test_does_not_retry_writes(self):
+        client = self._client()
+
+        with respx.mock:
+            route = respx.put(f"{TEST_URL}/Records").mock(return_value=Response(503))
+
+            record = Record(app_id=100, fields=[])
+            response = client.add_or_update_record(record)
+
+            assert response.status_code == 503
+            assert route.call_count == 1
+            assert client.retry_stats.retries == 0
+
+    def test_no_policy_does_not_retry(self):
+        client = OnspringClient(TEST_URL, TEST_API_KEY)
+
+        with respx.mock:
+            route = respx.get(f"{TEST_URL}/Apps").mock(return_value=Response(503))
+
+            response = client.get_apps()
+
+            assert response.status_code == 503
+            assert route.call_count == 1
+
+
+class TestRateLimiting:
+    def test_every_attempt_passes_through_limiter(self):
+        limiter = RateLimiter(rate=1000, burst=10)
+        policy = RetryPolicy(backoff_base=0.001)
+        client = OnspringClient(TEST_URL, TEST_API_KEY, retry_policy=policy, rate_limiter=limiter)
+
+        with respx.mock:
+            respx.get(f"{TEST_URL}/Apps/id/1").mock(side_effect=[Response(503), Response(200, json=MOCK_APP)])
+            respx.get(f"{TEST_URL}/Fields/id/1").mock(return_value=Response(200, json=MOCK_FIELD))
+
+            client.get_app_by_id(1)
+            client.get_field_by_id(1)
+
+            assert limiter.requests == 3
+
+    def test_limiter_shared_between_clients(self):
+        limiter = RateLimiter(rate=1000, burst=10)
+        first = OnspringClient(TEST_URL, TEST_API_KEY, rate_limiter=limiter)
+        second = OnspringClient(TEST_URL, TEST_API_KEY, rate_limiter=limiter)
+
+        with respx.mock:
+            respx.get(f"{TEST_URL}/Ping").mock(return_value=Response(200))
+
+            first.can_connect()
+            second.can_connect()
+
+            assert limiter.requests == 2
+
+
+class TestMetadataCaching:
+    def _client(self) -> OnspringClient:
+        return OnspringClient(TEST_URL, TEST_API_KEY, metadata_cache=MetadataCache())
+
+    def test_get_app_by_id_is_cached(self):
+        client = self._client()
+
+        with respx.mock:
+            route = respx.get(f"{TEST_URL}/Apps/id/1").mock(return_value=Response(200, json=MOCK_APP))
+
+            first = client.get_app_by_id(1)
+            second = client.get_app_by_id(1)
+
+            assert route.call_count == 1
+            assert second.is_successful
+            assert second.data.app == first.data.app
+
+    def test_failures_are_not_cached(self):
+        client = self._client()
+
+        with respx.mock:
+            route = respx.get(f"{TEST_URL}/Fields/id/1").mock(return_value=Response(404))
+
+            client.get_field_by_id(1)
+            client.get_field_by_id(1)
+
+            assert route.call_count == 2
+
+    def test_fields_by_app_id_populates_field_cache(self):
+        client = self._client()
+
+        with respx.mock:
+            page_route = respx.get(f"{TEST_URL}/Fields/appId/10").mock(
+                return_value=Response(200, json=MOCK_FIELDS_RESPONSE)
+            )
+            field_route = respx.get(f"{TEST_URL}/Fields/id/2").mock(return_value=Response(200, json=MOCK_LIST_FIELD))
+
+            client.get_fields_by_app_id(10)
+            client.get_fields_by_app_id(10)
+            response = client.get_field_by_id(2)
+
+            assert page_route.call_count == 1
+            assert field_route.call_count == 0
+            assert response.data.field.name == "List Field"
+
+    def test_fields_by_ids_only_fetches_missing(self):
+        client = self._client()
+
+        with respx.mock:
+            respx.get(f"{TEST_URL}/Fields/id/2").mock(return_value=Response(200, json=MOCK_LIST_FIELD))
+            route = respx.post(f"{TEST_URL}/Fields/batch-get").mock(
+                return_value=Response(200, json={"count": 1, "items": [MOCK_FIELD]})
+            )
+
+            client.get_field_by_id(2)
+            response = client.get_fields_by_ids([2, 1])
+
+            assert route.calls[0].request.content == b"[1]"
+            assert [field.id for field in response.data.fields] == [2, 1]
+            assert response.data.count == 2
+
+            cached = client.get_fields_by_ids([1, 2])
+
+            assert route.call_count == 1
+            assert [field.id for field in cached.data.fields] == [1, 2]
+
+    def test_reports_by_app_id_is_cached(self):
+        client = self._client()
+
+        with respx.mock:
+            route = respx.get(f"{TEST_URL}/Reports/appId/10").mock(
+                return_value=Response(200, json=MOCK_REPORTS_BY_APP_RESPONSE)
+            )
+
+            client.get_reports_by_app_id(10)
+            client.get_reports_by_app_id(10)
+            client.get_reports_by_app_id(10, PagingRequest(page_number=2))
+
+            assert route.call_count == 2
+
+    def test_invalidation(self):
+        client = self._client()
+
+        with respx.mock:
+            route = respx.get(f"{TEST_URL}/Apps/id/1").mock(return_value=Response(200, json=MOCK_APP))
+
+            client.get_app_by_id(1)
+            client.metadata_cache.invalidate_app(1)
+            client.get_app_by_id(1)
+
+            assert route.call_count == 2
+
+    def test_revalidate_refreshes_expired_entries(self):
+        cache = MetadataCache(ttl=0.01, stale_ttl=60)
+        client = OnspringClient(TEST_URL, TEST_API_KEY, metadata_cache=cache)
+
+        with respx.mock:
+            respx.get(f"{TEST_URL}/Apps/id/1").mock(
+                side_effect=[Response(200, json=MOCK_APP), Response(200, json={**MOCK_APP, "name": "Renamed"})]
+            )
+            respx.get(f"{TEST_URL}/Fields/id/1").mock(side_effect=[Response(200, json=MOCK_FIELD), Response(404)])
+            respx.get(f"{TEST_URL}/Fields/id/2").mock(return_value=Response(200, json=MOCK_LIST_FIELD))
+            respx.get(f"{TEST_URL}/Fields/appId/10").mock(
+                side_effect=[Response(200, json=MOCK_FIELDS_RESPONSE), Response(500)]
+            )
+
+            client.get_app_by_id(1)
+            client.get_field_by_id(1)
+            client.get_fields_by_app_id(10)
+            time.sleep(0.02)
+
+            assert client.get_app_by_id(1).data.app.name == MOCK_APP["name"]
+            assert cache.stale_hits == 1
+
+            refreshed = cache.revalidate(client)
+
+            assert refreshed == 2
+            assert cache.get_app(1).name == "Renamed"
+            assert cache.get_field(1) is None
+            assert cache.get_fields_page(10, PagingRequest()) is not None
+
+    def test_revalidate_requires_client_using_cache(self, client: OnspringClient):
+        with pytest.raises(ValueError):
+            MetadataCache().revalidate(client)
+
+    def test_stale_entry_served_while_revalidating(self):
+        cache = MetadataCache(ttl=0.01, stale_ttl=60)
+        client = OnspringClient(TEST_URL, TEST_API_KEY, metadata_cache=cache)
+        started = threading.Event()
+        release = threading.Event()
+
+        def _side_effect(request):
+            if route.call_count == 0:
+                return Response(200, json=MOCK_APP)
+
+            started.set()
+            release.wait(5)
+            return Response(200, json={**MOCK_APP, "name": "Renamed"})
+
+        with respx.mock:
+            route = respx.get(f"{TEST_URL}/Apps/id/1").mock(side_effect=_side_effect)
+
+            client.get_app_by_id(1)
+            time.sleep(0.02)
+
+            worker = threading.Thread(target=cache.revalidate, args=(client,))
+            worker.start()
+
+            assert started.wait(5)
+
+            name = client.get_app_by_id(1).data.app.name
+            release.set()
+            worker.join()
+
+            assert name == MOCK_APP["name"]
+            assert route.call_count == 2
+            assert cache.get_app(1).name == "Renamed"
+
+
+class TestResponseCache:
+    def _client(self, **kwargs) -> OnspringClient:
+        return OnspringClient(TEST_URL, TEST_API_KEY, response_cache=ResponseCache(**kwargs))
+
+    def test_revalidates_with_etag(self):
+        client = self._client()
+
+        with respx.mock:
+            route = respx.get(f"{TEST_URL}/Apps/id/1").mock(
+                side_effect=[Response(200, json=MOCK_APP, headers={"ETag": '"v1"'}), Response(304)]
+            )
+
+            first = client.get_app_by_id(1)
+            second = client.get_app_by_id(1)
+
+            assert route.call_count == 2
+            assert "if-none-match" not in route.calls[0].request.headers
+            assert route.calls[1].request.headers["if-none-match"] == '"v1"'
+            assert second.status_code == 200
+            assert second.data.app is first.data.app
+            assert client.response_cache.revalidations == 1
+
+    def test_revalidates_with_last_modified(self):
+        client = self._client()
+        last_modified = "Wed, 01 Jan 2025 00:00:00 GMT"
+
+        with respx.mock:
+            route = respx.get(f"{TEST_URL}/Fields/appId/10").mock(
+                side_effect=[
+                    Response(200, json=MOCK_FIELDS_RESPONSE, headers={"Last-Modified": last_modified}),
+                    Response(304),
+                ]
+            )
+
+            client.get_fields_by_app_id(10)
+            response = client.get_fields_by_app_id(10)
+
+            assert route.calls[1].request.headers["if-modified-since"] == last_modified
+            assert len(response.data.fields) == len(MOCK_FIELDS_RESPONSE["items"])
+
+    def test_changed_response_replaces_entry(self):
+        client = self._client()
+
+        with respx.mock:
+            route = respx.get(f"{TEST_URL}/Apps/id/1").mock(
+                side_effect=[
+                    Response(200, json=MOCK_APP, headers={"ETag": '"v1"'}),
+                    Response(200, json={**MOCK_APP, "name": "Renamed"}, headers={"ETag": '"v2"'}),
+                    Response(304),
+                ]
+            )
+
+            client.get_app_by_id(1)
+            client.get_app_by_id(1)
+            response = client.get_app_by_id(1)
+
+            assert route.calls[2].request.headers["if-none-match"] == '"v2"'
+            assert response.data.app.name == "Renamed"
+
+    def test_without_validators_serves_until_ttl(self):
+        client = self._client()
+
+        with respx.mock:
+            route = respx.get(f"{TEST_URL}/Apps").mock(return_value=Response(200, json=MOCK_APPS_RESPONSE))
+
+            client.get_apps()
+            response = client.get_apps()
+
+            assert route.call_count == 1
+            assert response.is_successful
+            assert client.response_cache.hits == 1
+
+    def test_parse_modes_are_cached_separately(self):
+        client = self._client()
+
+        with respx.mock:
+            respx.get(f"{TEST_URL}/Apps/id/1").mock(
+                side_effect=[Response(200, json=MOCK_APP, headers={"ETag": '"v1"'}), Response(304)]
+            )
+
+            client.get_app_by_id(1)
+            response = client.get_app_by_id(1, parse_mode=ParseMode.Json)
+
+            assert response.data == MOCK_APP
+
+    def test_records_are_not_cached(self):
+        client = self._client()
+
+        with respx.mock:
+            route = respx.get(f"{TEST_URL}/Records/appId/100").mock(
+                return_value=Response(200, json=MOCK_RECORDS_RESPONSE)
+            )
+
+            client.get_records_by_app_id(GetRecordsByAppRequest(app_id=100))
+            client.get_records_by_app_id(GetRecordsByAppRequest(app_id=100))
+
+            assert route.call_count == 2
+
+    def test_clients_with_different_keys_share_cache_safely(self):
+        cache = ResponseCache()
+        first = OnspringClient(TEST_URL, TEST_API_KEY, response_cache=cache)
+        second = OnspringClient(TEST_URL, "other-api-key", response_cache=cache)
+
+        with respx.mock:
+            route = respx.get(f"{TEST_URL}/Apps/id/1").mock(
+                side_effect=[
+                    Response(200, json=MOCK_APP),
+                    Response(200, json={**MOCK_APP, "name": "Other App"}),
+                ]
+            )
+
+            first.get_app_by_id(1)
+            response = second.get_app_by_id(1)
+
+            assert route.call_count == 2
+            assert route.calls[1].request.headers["x-apikey"] == "other-api-key"
+            assert response.data.app.name == "Other App"
+            assert first.get_app_by_id(1).data.app.name == MOCK_APP["name"]
+            assert route.call_count == 2
+            assert len(cache) == 2
+
+
+class TestParseMode:
+    RECORD = {
+        "appId": 100,
+        "recordId": 1,
+        "fieldData": [
+            {"fieldId": 1, "value": "Test Value", "type": "String"},
+            {"fieldId": 2, "value": 1.5, "type": "Decimal"},
+            {"fieldId": 3, "value": "2024-01-02T03:04:05Z", "type": "Date"},
+            {"fieldId": 4, "value": "3fa85f64-5717-4562-b3fc-2c963f66afa6", "type": "Guid"},
+            {"fieldId": 5, "value": {"quantity": 1, "increment": "Day(s)"}, "type": "TimeSpan"},
+            {
+                "fieldId": 6,
+                "value": [{"fileId": 1, "fileName": "a.txt", "storageLocation": "Internal"}],
+                "type": "AttachmentList",
+            },
+        ],
+    }
+
+    def _get_record(self, parse_mode: ParseMode, response: Response):
+        client = OnspringClient(TEST_URL, TEST_API_KEY, parse_mode=parse_mode)
+
+        with respx.mock:
+            respx.get(f"{TEST_URL}/Records/appId/100/recordId/1").mock(return_value=response)
+
+            return client.get_record_by_id(GetRecordByIdRequest(app_id=100, record_id=1))
+
+    def test_validated_by_default(self, client: OnspringClient):
+        assert client.parse_mode is ParseMode.Validated
+
+    def test_lazy_mode_defers_field_values(self):
+        validated = self._get_record(ParseMode.Validated, Response(200, json=self.RECORD))
+        lazy = self._get_record(ParseMode.Lazy, Response(200, json=self.RECORD))
+
+        assert isinstance(lazy.data.fields, LazyFieldList)
+        assert lazy.data.fields.materialized_count == 0
+        assert lazy.data.fields[2].value.year == 2024
+        assert lazy.data.fields.materialized_count == 1
+        assert len(lazy.data.fields) == len(validated.data.fields)
+        assert list(lazy.data.fields) == validated.data.fields
+        assert lazy.data == validated.data
+
+    def test_lazy_mode_raises_on_access_to_invalid_value(self):
+        record = {"appId": 100, "recordId": 1, "fieldData": [{"fieldId": 1, "value": "abc", "type": "Integer"}]}
+
+        response = self._get_record(ParseMode.Lazy, Response(200, json=record))
+
+        assert response.is_successful
+
+        with pytest.raises(ValidationError):
+            response.data.fields[0]
+
+    def test_lazy_mode_serializes_field_values(self):
+        validated = self._get_record(ParseMode.Validated, Response(200, json=self.RECORD))
+        lazy = self._get_record(ParseMode.Lazy, Response(200, json=self.RECORD))
+
+        assert lazy.data.model_dump(by_alias=True, mode="json") == validated.data.model_dump(by_alias=True, mode="json")
+
+    def test_json_per_call(self, client: OnspringClient):
+        with respx.mock:
+            respx.get(f"{TEST_URL}/Records/appId/100").mock(return_value=Response(200, json=MOCK_RECORDS_RESPONSE))
+
+            response = client.get_records_by_app_id(GetRecordsByAppRequest(app_id=100), parse_mode=ParseMode.Json)
+
+            assert response.is_successful
+            assert response.data == MOCK_RECORDS_RESPONSE
+
+    def test_bytes_per_call(self, client: OnspringClient):
+        with respx.mock:
+            respx.get(f"{TEST_URL}/Fields/id/1").mock(return_value=Response(200, json=MOCK_FIELD))
+
+            response = client.get_field_by_id(1, parse_mode=ParseMode.Bytes)
+
+            assert json.loads(response.data) == MOCK_FIELD
+
+    def test_raw_modes_keep_status_handling(self, client: OnspringClient):
+        with respx.mock:
+            respx.get(f"{TEST_URL}/Apps/id/1").mock(return_value=Response(401))
+
+            _assert_error(client.get_app_by_id(1, parse_mode=ParseMode.Json), 401, "Unauthorized request")
+
+    @pytest.mark.parametrize("parse_mode", [ParseMode.Json, ParseMode.Bytes])
+    def test_raw_modes_rejected_for_client(self, parse_mode):
+        with pytest.raises(ValueError):
+            OnspringClient(TEST_URL, TEST_API_KEY, parse_mode=parse_mode)
+
+    def test_raw_modes_bypass_metadata_cache(self):
+        client = OnspringClient(TEST_URL, TEST_API_KEY, metadata_cache=MetadataCache())
+
+        with respx.mock:
+            route = respx.get(f"{TEST_URL}/Fields/id/1").mock(return_value=Response(200, json=MOCK_FIELD))
+
+            raw = client.get_field_by_id(1, parse_mode=ParseMode.Json)
+            client.get_field_by_id(1, parse_mode=ParseMode.Json)
+
+            assert raw.data == MOCK_FIELD
+            assert route.call_count == 2
+            assert len(client.metadata_cache) == 0
+
+    def test_json_batch_chunks_are_merged(self, client: OnspringClient):
+        with respx.mock:
+            respx.post(f"{TEST_URL}/Records/batch-get").mock(side_effect=batch_records_side_effect())
+
+            request = GetBatchRecordsRequest(app_id=100, recordIds=[1, 2, 3])
+
+            response = client.get_records_by_ids(request, batch_size=2, parse_mode=ParseMode.Json)
+
+            assert response.data["count"] == 3
+            assert [item["recordId"] for item in response.data["items"]] == [1, 2, 3]
+
+    def test_bytes_batch_requires_single_chunk(self, client: OnspringClient):
+        request = GetBatchRecordsRequest(app_id=100, recordIds=[1, 2, 3])
+
+        with pytest.raises(ValueError):
+            client.get_records_by_ids(request, batch_size=2, parse_mode=ParseMode.Bytes)
+
+
+class TestRawResponseMode:
+    def _get_app(self, raw_response_mode: RawResponseMode, response: Response):
+        client = OnspringClient(TEST_URL, TEST_API_KEY, raw_response_mode=raw_response_mode)
+
+        with respx.mock:
+            respx.get(f"{TEST_URL}/Apps/id/1").mock(return_value=response)
+
+            return client.get_app_by_id(1)
+
+    def test_full_by_default(self, client: OnspringClient):
+        assert client.raw_response_mode is RawResponseMode.Full
+
+    def test_full_keeps_raw_response(self):
+        response = self._get_app(RawResponseMode.Full, Response(200, json=MOCK_APP, headers={"X-Test": "1"}))
+
+        assert isinstance(response.raw_response, httpx.Response)
+        assert response.headers["X-Test"] == "1"
+        assert response.elapsed is not None
+
+    def test_metadata_keeps_headers_and_elapsed(self):
+        response = self._get_app(RawResponseMode.Metadata, Response(200, json=MOCK_APP, headers={"X-Test": "1"}))
+
+        assert response.is_successful
+        assert response.data.app.id == MOCK_APP["id"]
+        assert response.raw_response is None
+        assert response.headers["X-Test"] == "1"
+        assert response.elapsed is not None
+
+    def test_off_drops_everything(self):
+        response = self._get_app(RawResponseMode.Off, Response(200, json=MOCK_APP))
+
+        assert response.is_successful
+        assert response.raw_response is None
+        assert response.headers is None
+        assert response.elapsed is None
+
+    def test_errors_keep_status_and_message(self):
+        response = self._get_app(RawResponseMode.Off, Response(401))
+
+        _assert_error(response, 401, "Unauthorized request")
+        assert response.raw_response is None
+
+
+class _RecordingObserver(RequestObserver):
+    def __init__(self):
+        self.starts: list[RequestStart] = []
+        self.ends: list[RequestTiming] = []
+
+    def on_request_start(self, event: RequestStart) -> None:
+        self.starts.append(event)
+
+    def on_request_end(self, timing: RequestTiming) -> None:
+        self.ends.append(timing)
+
+
+class TestInstrumentation:
+    def test_observer_sees_start_and_end(self):
+        observer = _RecordingObserver()
+        client = OnspringClient(TEST_URL, TEST_API_KEY, observers=[observer])
+
+        with respx.mock:
+            respx.get(f"{TEST_URL}/Apps/id/1").mock(return_value=Response(200, json=MOCK_APP))
+
+            response = client.get_app_by_id(1)
+
+        assert observer.starts == [RequestStart("/Apps/id/{id}", "GET", f"{TEST_URL}/Apps/id/1")]
+        assert len(observer.ends) == 1
+
+        timing = observer.ends[0]
+
+        assert timing is response.timing
+        assert timing.endpoint == "/Apps/id/{id}"
+        assert timing.status_code == 200
+        assert timing.response_bytes == len(response.raw_response.content)
+        assert timing.retries == 0
+        assert timing.error is None
+        assert timing.total_seconds >= timing.network_seconds + timing.parse_seconds
+
+    def test_response_exposes_timing(self, client: OnspringClient):
+        with respx.mock:
+            respx.get(f"{TEST_URL}/Apps/id/1").mock(return_value=Response(200, json=MOCK_APP))
+
+            response = client.get_app_by_id(1)
+
+        assert response.network_seconds == response.timing.network_seconds
+        assert response.parse_seconds == response.timing.parse_seconds
+        assert response.parse_seconds >= 0
+
+    def test_request_bytes(self, client: OnspringClient):
+        with respx.mock:
+            respx.put(f"{TEST_URL}/Records").mock(return_value=Response(201, json=MOCK_SAVE_RECORD_RESPONSE))
+
+            response = client.add_or_update_record(Record(app_id=100, fields=[]))
+
+        assert response.timing.method == "PUT"
+        assert response.timing.request_bytes == len(response.raw_response.request.content)
+
+    def test_retries_are_counted_as_queue_time(self):
+        observer = _RecordingObserver()
+        policy = RetryPolicy(backoff_base=0.001, backoff_max=0.01)
+        client = OnspringClient(TEST_URL, TEST_API_KEY, retry_policy=policy, observers=[observer])
+
+        with respx.mock:
+            respx.get(f"{TEST_URL}/Apps/id/1").mock(side_effect=[Response(503), Response(200, json=MOCK_APP)])
+
+            response = client.get_app_by_id(1)
+
+        assert len(observer.starts) == 1
+        assert response.timing.retries == 1
+        assert response.timing.retry_reasons == ("503",)
+        assert response.timing.queue_seconds == pytest.approx(client.retry_stats.backoff_seconds)
+
+    def test_failed_request_notifies_error(self):
+        observer = _RecordingObserver()
+        client = OnspringClient(TEST_URL, TEST_API_KEY, observers=[observer])
+
+        with respx.mock:
+            respx.get(f"{TEST_URL}/Apps").mock(side_effect=httpx.ConnectError("refused"))
+
+            with pytest.raises(httpx.ConnectError):
+                client.get_apps()
+
+        timing = observer.ends[0]
+
+        assert timing.status_code is None
+        assert isinstance(timing.error, httpx.ConnectError)
+
+    def test_batch_delete_keeps_single_chunk_metadata(self):
+        client = OnspringClient(TEST_URL, TEST_API_KEY, raw_response_mode=RawResponseMode.Metadata)
+
+        with respx.mock:
+            respx.post(f"{TEST_URL}/Records/batch-delete").mock(return_value=Response(204, headers={"X-Test": "1"}))
+
+            response = client.delete_records_by_ids(DeleteBatchRecordsRequest(app_id=100, recordIds=[1, 2]))
+
+        assert response.timing is not None
+        assert response.timing.status_code == 204
+        assert response.headers["X-Test"] == "1"
+        assert response.elapsed is not None
+
+    def test_interrupted_download_notifies_error(self):
+        observer = _RecordingObserver()
+        client = OnspringClient(TEST_URL, TEST_API_KEY, observers=[observer])
+
+        with respx.mock:
+            respx.get(f"{TEST_URL}/Files/recordId/1/fieldId/2/fileId/3/file").mock(
+                return_value=Response(200, stream=_FailingStream())
+            )
+
+            with pytest.raises(httpx.ReadError):
+                client.download_file(1, 2, 3, io.BytesIO())
+
+        assert len(observer.starts) == len(observer.ends) == 1
+        assert observer.ends[0].status_code == 200
+        assert isinstance(observer.ends[0].error, httpx.ReadError)
+
+    def test_can_connect_notifies(self):
+        observer = _RecordingObserver()
+        client = OnspringClient(TEST_URL, TEST_API_KEY, observers=[observer])
+
+        with respx.mock:
+            respx.get(f"{TEST_URL}/Ping").mock(return_value=Response(200))
+
+            client.can_connect()
+
+        assert [timing.endpoint for timing in observer.ends] == ["/Ping"]
+
+    def test_raw_response_mode_off_drops_timing(self):
+        observer = _RecordingObserver()
+        client = OnspringClient(TEST_URL, TEST_API_KEY, raw_response_mode=RawResponseMode.Off, observers=[observer])
+
+        with respx.mock:
+            respx.get(f"{TEST_URL}/Apps/id/1").mock(return_value=Response(200, json=MOCK_APP))
+
+            response = client.get_app_by_id(1)
+
+        assert response.timing is None
+        assert response.parse_seconds is None
+        assert len(observer.ends) == 1
+
+    def test_metrics_collector(self):
+        collector = MetricsCollector()
+        policy = RetryPolicy(backoff_base=0.001, backoff_max=0.01)
+        client = OnspringClient(TEST_URL, TEST_API_KEY, retry_policy=policy, observers=[collector])
+
+        with respx.mock:
+            respx.get(f"{TEST_URL}/Apps/id/1").mock(
+                side_effect=[Response(429, headers={"retry-after": "0"}), Response(200, json=MOCK_APP)]
+            )
+            respx.get(f"{TEST_URL}/Apps/id/2").mock(return_value=Response(404))
+
+            client.get_app_by_id(1)
+            client.get_app_by_id(2)
+
+        metrics = collector.endpoint("GET", "/Apps/id/{id}")
+
+        assert metrics.requests_by_status == {"200": 1, "404": 1}
+        assert metrics.rate_limited == 1
+        assert 'endpoint="/Apps/id/{id}"' in collector.render_prometheus()
+
+
 class TestRaiseForStatus:
     def test_401_raises_authentication_error(self):
         response = ApiResponse(status_code=401, message="Unauthorized")
@@ -0,0 +1,202 @@
+from array import array
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from onspring_api_sdk.models import GetReportByIdResponse, IntegerFieldValue, Record, StringFieldValue
+from onspring_api_sdk.models.record import LAZY_FIELDS
+from onspring_api_sdk.table import Column, RecordTable, ReportTable
+
+FIELD_DATA = [
+    {"fieldId": 1, "value": "Test Value", "type": "String"},
+    {"fieldId": 2, "value": 5, "type": "Integer"},
+    {"fieldId": 3, "value": 1.5, "type": "Decimal"},
+    {"fieldId": 4, "value": "2024-01-02T03:04:05.123456Z", "type": "Date"},
+    {"fieldId": 5, "value": "3fa85f64-5717-4562-b3fc-2c963f66afa6", "type": "Guid"},
+    {"fieldId": 6, "value": {"quantity": 1, "increment": "Day(s)"}, "type": "TimeSpan"},
+    {"fieldId": 7, "value": [1, 2], "type": "IntegerList"},
+]
+
+
+def _records(lazy: bool) -> list[Record]:
+    items = [
+        {"appId": 100, "recordId": 1, "fieldData": FIELD_DATA},
+        {"appId": 100, "recordId": 2, "fieldData": [{"fieldId": 2, "value": 6, "type": "Integer"}]},
+        {"appId": 100, "recordId": 3, "fieldData": [{"fieldId": 8, "value": "New", "type": "String"}]},
+    ]
+
+    return [Record.model_validate(item, context={LAZY_FIELDS: lazy}) for item in items]
+
+
+class TestRecordTable:
+    @pytest.mark.parametrize("lazy", [False, True], ids=["eager", "lazy"])
+    def test_values_match_records(self, lazy: bool):
+        records = _records(lazy)
+        eager = _records(False)
+
+        table = RecordTable.from_records(records)
+
+        assert len(table) == 3
+        assert table.app_id == 100
+        assert table.record_ids.to_list() == [1, 2, 3]
+        assert table.field_ids == [1, 2, 3, 4, 5, 6, 7, 8]
+
+        for field in eager[0].fields:
+            assert table[field.field_id][0] == field.value
+
+        assert table[2].to_list() == [5, 6, None]
+        assert table[8].to_list() == [None, None, "New"]
+
+    def test_lazy_records_are_not_materialized(self):
+        records = _records(True)
+
+        RecordTable.from_records(records)
+
+        assert all(record.fields.materialized_count == 0 for record in records)
+
+    def test_numeric_and_date_columns_use_arrays(self):
+        table = RecordTable.from_records(_records(True))
+
+        assert isinstance(table[2].values, array)
+        assert table[2].values.typecode == "q"
+        assert table[3].values.typecode == "d"
+        assert table[4].values.typecode == "q"
+        assert isinstance(table[1].values, list)
+        assert list(table[2].present) == [1, 1, 0]
+
+    def test_large_integers_fall_back_to_list(self):
+        column = Column(2, "Integer")
+        column.extend([1, None, 2**63, -(2**63) - 1])
+
+        assert isinstance(column.values, list)
+        assert column.to_list() == [1, None, 2**63, -(2**63) - 1]
+
+    def test_slice_rows(self):
+        table = RecordTable.from_records(_records(True))
+
+        sliced = table.slice(1)
+
+        assert len(sliced) == 2
+        assert sliced.record_ids.to_list() == [2, 3]
+        assert sliced[2].to_list() == [6, None]
+        assert len(table) == 3
+
+    def test_slice_column(self):
+        table = RecordTable.from_records(_records(True))
+
+        column = table[2][:2]
+
+        assert isinstance(column, Column)
+        assert column.to_list() == [5, 6]
+
+    def test_select_columns(self):
+        table = RecordTable.from_records(_records(True))
+
+        selected = table.select([2, 8])
+
+        assert selected.field_ids == [2, 8]
+        assert selected.to_dict() == {2: [5, 6, None], 8: [None, None, "New"]}
+
+    def test_duplicate_field_keeps_last(self):
+        record = Record(
+            app_id=100,
+            record_id=1,
+            fields=[StringFieldValue(field_id=1, value="a"), StringFieldValue(field_id=1, value="b")],
+        )
+
+        table = RecordTable.from_records([record])
+
+        assert table[1].to_list() == ["b"]
+
+    def test_conflicting_types_raise(self):
+        records = [
+            Record(app_id=100, record_id=1, fields=[StringFieldValue(field_id=1, value="a")]),
+            Record(app_id=100, record_id=2, fields=[IntegerFieldValue(field_id=1, value=1)]),
+        ]
+
+        with pytest.raises(ValueError):
+            RecordTable.from_records(records)
+
+    def test_invalid_value_raises(self):
+        record = Record.model_validate(
+            {"appId": 100, "recordId": 1, "fieldData": [{"fieldId": 1, "value": "abc", "type": "Integer"}]},
+            context={LAZY_FIELDS: True},
+        )
+
+        with pytest.raises(ValueError):
+            RecordTable.from_records([record])
+
+
+REPORT = {
+    "columns": ["Name", "Count", "Score", "Created", "Tags", "Empty"],
+    "rows": [
+        {"recordId": 1, "cells": ["a", 1, 1.5, "2024-01-02T03:04:05Z", ["x"], None]},
+        {"recordId": 2, "cells": ["b", 2, 2, "2024-01-03T03:04:05Z", None, None]},
+        {"recordId": 3, "cells": [None, None, None, None, ["y", "z"], None]},
+    ],
+}
+
+
+class TestReportTable:
+    @pytest.mark.parametrize("parsed", [False, True], ids=["json", "model"])
+    def test_transposes_rows_into_columns(self, parsed: bool):
+        report = GetReportByIdResponse.model_validate(REPORT) if parsed else REPORT
+
+        table = ReportTable.from_report(report)
+
+        assert len(table) == 3
+        assert table.column_names == REPORT["columns"]
+        assert table.record_ids.to_list() == [1, 2, 3]
+        assert table["Name"].to_list() == ["a", "b", None]
+        assert table["Count"].to_list() == [1, 2, None]
+        assert table["Tags"].to_list() == [["x"], None, ["y", "z"]]
+
+    def test_infers_column_types(self):
+        table = ReportTable.from_report(REPORT)
+
+        assert [table[name].type for name in table.column_names] == [
+            "String",
+            "Integer",
+            "Decimal",
+            "Date",
+            None,
+            None,
+        ]
+        assert table["Count"].values.typecode == "q"
+        assert table["Score"].to_list() == [Decimal("1.5"), Decimal("2"), None]
+        assert table["Created"][0] == datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+    def test_invalid_dates_stay_strings(self):
+        report = {"columns": ["Created"], "rows": [{"recordId": 1, "cells": ["2024-99-99T00:00:00"]}]}
+
+        table = ReportTable.from_report(report)
+
+        assert table["Created"].type == "String"
+        assert table["Created"].to_list() == ["2024-99-99T00:00:00"]
+
+    def test_large_integers_are_kept(self):
+        report = {"columns": ["Count"], "rows": [{"recordId": 1, "cells": [2**64]}, {"recordId": 2, "cells": [1]}]}
+
+        table = ReportTable.from_report(report)
+
+        assert table["Count"].type == "Integer"
+        assert table["Count"].to_list() == [2**64, 1]
+
+    def test_short_rows_are_padded(self):
+        report = {"columns": ["A", "B"], "rows": [{"recordId": 1, "cells": [1]}]}
+
+        table = ReportTable.from_report(report)
+
+        assert table.to_dict() == {"A": [1], "B": [None]}
+
+    def test_empty_report(self):
+        table = ReportTable.from_report({"columns": ["A"], "rows": []})
+
+        assert len(table) == 0
+        assert table.to_dict() == {"A": []}
+
+    def test_iter_rows(self):
+        table = ReportTable.from_report(REPORT)
+
+        assert list(table.iter_rows())[1][:3] == ("b", 2, Decimal("2"))